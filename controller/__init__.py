@@ -1,6 +1,20 @@
-from .user_controller import UserController  # noqa F401
-from .auth_controller import AuthController  # noqa F401
-from .base_controller import BaseController  # noqa F401
-from .client_controller import ClientController  # noqa F401
-from .contrat_controller import ContratController  # noqa F401
-from .event_controller import EventController  # noqa F401
+import importlib
+
+# Chargement paresseux : seul le contrôleur demandé est importé (démarrage plus rapide de la CLI).
+_CONTROLLERS = {
+    "UserController": "controller.user_controller",
+    "AuthController": "controller.auth_controller",
+    "BaseController": "controller.base_controller",
+    "ClientController": "controller.client_controller",
+    "ContratController": "controller.contrat_controller",
+    "EventController": "controller.event_controller",
+    "ExportController": "controller.export_controller",
+    "CommandController": "controller.command_controller",
+    "ReportController": "controller.report_controller",
+}
+
+
+def __getattr__(name):
+    if name in _CONTROLLERS:
+        return getattr(importlib.import_module(_CONTROLLERS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
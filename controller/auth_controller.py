@@ -1,6 +1,9 @@
 import jwt
 from datetime import datetime, timedelta, timezone
-from utils.config import SECRET_KEY, Session
+from sqlalchemy.orm import joinedload
+from utils.config import DB_PERMISSIONS, SECRET_KEY, SESSION_CACHE_FILE, SESSION_CACHE_TTL, Session
+from utils.session_cache import clear_session_cache, read_session_cache, write_session_cache
+from model.role import load_permissions
 from model.user import User
 from view.auth_view import AuthView
 
@@ -16,6 +19,8 @@ class AuthController:
             "user_id": user.id,
             "exp": datetime.now(timezone.utc) + timedelta(hours=1),
             "role": user.role.name if user.role else None,
+            "name": user.name,
+            "ver": user.token_version or 0,
         }
         return jwt.encode(payload, SECRET_KEY, algorithm="HS256")
 
@@ -49,20 +54,31 @@ class AuthController:
     def login(self):
         """Authentifie un utilisateur et génère un token JWT."""
         email, password = self.view.prompt_credentials()
-        user = self.session.query(User).filter_by(email=email).first()
+        user = self.session.query(User).options(joinedload(User.role)).filter_by(email=email).first()
 
         if user and user.check_password(password):
+            if user.needs_rehash():
+                # Les paramètres Argon2 ont changé : le mot de passe en clair n'est disponible qu'ici.
+                user.password = user.set_password(password)
+                self.session.commit()
             token = self.generate_token(user)
             self.store_token(token)
+            clear_session_cache(SESSION_CACHE_FILE)
             self.view.display_success_message(f"✅ Connexion réussie ! Bienvenue {user.name}.")
             return token
         else:
             self.view.display_error_message("❌ Échec de connexion. Vérifiez vos identifiants.")
             return None
 
-    def verify_token(self):
-        """Vérifie si un token JWT valide est stocké et retourne l'utilisateur associé."""
-        token = self.load_token()
+    def verify_token(self, token=None, cache=True):
+        """Vérifie le token JWT fourni (ou celui stocké localement) et retourne l'utilisateur associé.
+
+        Tant que le cache de session signé est frais, l'utilisateur est résolu sans requête en base.
+        Sinon, l'utilisateur est relu et sa version de session comparée à celle du token. Avec
+        `cache=False` (serveur local, qui garde ses utilisateurs en mémoire), le fichier de cache
+        n'est ni lu ni écrit.
+        """
+        token = token or self.load_token()
         if not token:
             self.view.display_error_message("⚠️ Vous devez vous connecter !")
             return None
@@ -71,14 +87,30 @@ class AuthController:
         if not payload:
             return None
 
-        user = self.session.query(User).filter_by(id=payload["user_id"]).first()
+        if cache:
+            principal = read_session_cache(SESSION_CACHE_FILE, token, SECRET_KEY, SESSION_CACHE_TTL)
+            if principal and principal.id == payload["user_id"]:
+                return principal
+
+        user = self.session.query(User).options(joinedload(User.role)).filter_by(id=payload["user_id"]).first()
         if not user:
             self.view.display_error_message("⚠️ Utilisateur introuvable.")
             return None
 
+        if payload.get("ver", 0) != (user.token_version or 0):
+            if cache:
+                clear_session_cache(SESSION_CACHE_FILE)
+            self.view.display_error_message("⚠️ Session expirée suite à une modification du compte, reconnectez-vous.")
+            return None
+
+        if DB_PERMISSIONS:
+            load_permissions(self.session)
+        if cache and "exp" in payload:
+            write_session_cache(SESSION_CACHE_FILE, token, SECRET_KEY, user, payload["exp"])
         return user
 
     def logout(self):
         """Déconnecte l'utilisateur en supprimant le token."""
         open(".token", "w").close()
+        clear_session_cache(SESSION_CACHE_FILE)
         self.view.display_success_message("👋 Déconnexion réussie.")
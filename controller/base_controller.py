@@ -1,16 +1,94 @@
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from utils.records import chunked, read_records
+
+
 class BaseController:
+    # Relations affichées par chaque listing, chargées en amont pour éviter les requêtes N+1.
+    EAGER_LOADING = {}
+
     def __init__(self, user, session):
         """Initialise le contrôleur avec l'utilisateur connecté."""
         self.user = user
         self.session = session
 
+    def load_options(self, listing):
+        """Retourne les options de chargement des relations déclarées pour un listing."""
+        return self.EAGER_LOADING.get(listing, ())
+
     def check_permission(self, action):
         """Vérifie si l'utilisateur connecté a la permission d'effectuer une action."""
-        print(f"🔍 Vérification permission : action={action}, rôle={self.user.role.name if self.user.role else None}")
-
-        if self.user.role and self.user.role.has_permission(action):
-            print("✅ Permission accordée")
+        role = self.user.role
+        if role is not None and role.has_permission(action):
             return True
-        else:
-            print("⛔ Permission refusée")
-            return False
+        print("⛔ Permission refusée")
+        return False
+
+    def import_records(self, model, path, batch_size, parse_record, existing_message, prepare_rows=None):
+        """Boucle commune des imports en masse depuis un fichier CSV ou JSONL (clients, utilisateurs).
+
+        Le fichier est lu en flux et traité par lots : `parse_record(record)` retourne les colonnes d'une
+        ligne (dont `email`) ou lève ValueError avec le message à signaler ; une requête `IN` écarte les
+        emails déjà en base (`existing_message`, formaté avec `email`) ; `prepare_rows(rows)` complète les
+        lignes retenues (hachage des mots de passe...) ; puis un INSERT multi-lignes et un commit par lot.
+        Un lot refusé par la base est rejoué ligne par ligne pour ne signaler que les lignes fautives.
+        Retourne (nombre de lignes insérées, erreurs (ligne, message) triées).
+        """
+        inserted = 0
+        errors = []
+        seen_emails = set()
+
+        for chunk in chunked(read_records(path), batch_size):
+            candidates = []
+            for line_number, record, error in chunk:
+                if error:
+                    errors.append((line_number, error))
+                    continue
+                try:
+                    row = parse_record(record)
+                except ValueError as e:
+                    errors.append((line_number, str(e)))
+                    continue
+                if row["email"] in seen_emails:
+                    errors.append((line_number, f"Email en double dans le fichier : {row['email']}"))
+                    continue
+                seen_emails.add(row["email"])
+                candidates.append((line_number, row))
+
+            if not candidates:
+                continue
+
+            existing = {
+                email
+                for (email,) in self.session.query(model.email).filter(
+                    model.email.in_([row["email"] for _, row in candidates])
+                )
+            }
+            for line_number, row in candidates:
+                if row["email"] in existing:
+                    errors.append((line_number, existing_message.format(email=row["email"])))
+            candidates = [(line_number, row) for line_number, row in candidates if row["email"] not in existing]
+            if not candidates:
+                continue
+
+            line_numbers = [line_number for line_number, _ in candidates]
+            rows = [row for _, row in candidates]
+            if prepare_rows:
+                rows = prepare_rows(rows)
+            try:
+                self.session.execute(insert(model), rows)
+                self.session.commit()
+                inserted += len(rows)
+            except SQLAlchemyError:
+                self.session.rollback()
+                for line_number, row in zip(line_numbers, rows):
+                    try:
+                        self.session.execute(insert(model), [row])
+                        self.session.commit()
+                        inserted += 1
+                    except SQLAlchemyError as e:
+                        self.session.rollback()
+                        errors.append((line_number, f"Ligne rejetée : {e.__class__.__name__}"))
+
+        errors.sort()
+        return inserted, errors
@@ -1,11 +1,20 @@
 from model.client import Client
 from view.client_view import ClientView
 from controller.base_controller import BaseController
-from utils.config import Session as DBSession
-import sentry_sdk
+from utils.config import IMPORT_BATCH_SIZE, PAGE_SIZE, Session as DBSession
+from utils.records import text_field
+from utils.telemetry import audit
+import datetime
 
 
 class ClientController(BaseController):
+    # display_clients n'affiche aucune relation : pas de chargement supplémentaire.
+    EAGER_LOADING = {
+        "list_all_client": (),
+        "list_personnal_client": (),
+        "search_clients": (),
+    }
+
     def __init__(self, user):
         """Initialise le contrôleur avec l'utilisateur connecté."""
         super().__init__(user, DBSession())
@@ -36,18 +45,53 @@ class ClientController(BaseController):
         self.session.add(new_client)
         self.session.commit()
 
-        sentry_sdk.capture_message(f"Client '{name}' créé par {self.user.name}.", level="info")
+        audit.emit("client_created", f"Client '{name}' créé par {self.user.name}.")
 
         self.view.display_info_message(f"✅ Client '{name}' créé et attribué à {self.user.name}.")
         return new_client
 
+    def import_clients(self, path, batch_size=IMPORT_BATCH_SIZE):
+        """Import en masse de clients depuis un fichier CSV ou JSONL (réservé aux commerciaux).
+
+        Le fichier est lu en flux et traité par lots (voir BaseController.import_records) : une requête
+        `IN` détecte les emails déjà présents, puis un INSERT multi-lignes et un commit par lot. Les
+        lignes invalides sont signalées sans interrompre l'import. Retourne (nombre de clients créés,
+        erreurs par ligne).
+        """
+        if not self.check_permission("create_client"):
+            self.view.display_error_message("❌ Accès refusé : Seuls les commerciaux peuvent créer des clients.")
+            return None
+
+        inserted, errors = self.import_records(
+            Client, path, batch_size, self._parse_client_record, "Un client avec cet email existe déjà : {email}"
+        )
+        audit.emit("clients_imported", f"{inserted} clients importés par {self.user.name}.")
+        self.view.display_import_report(inserted, errors)
+        return inserted, errors
+
+    def _parse_client_record(self, record):
+        """Colonnes d'un client importé ; ValueError si la ligne est invalide."""
+        name, email, phone, company = (text_field(record, field) for field in ("name", "email", "phone", "company"))
+        if not name or not email:
+            raise ValueError("Nom et email obligatoires.")
+        now = datetime.datetime.now()
+        return {
+            "name": name,
+            "email": email,
+            "phone": phone or None,
+            "company": company or None,
+            "commercial_id": self.user.id,
+            "date_created": now,
+            "date_updated": now,
+        }
+
     def list_all_client(self):
         """Liste tous les clients"""
         if not self.check_permission("read_client"):
             self.view.display_error_message("❌ Accès refusé")
             return None
 
-        clients = self.session.query(Client).all()
+        clients = self.session.query(Client).options(*self.load_options("list_all_client")).all()
         self.view.display_clients(clients)
         return clients
 
@@ -57,10 +101,37 @@ class ClientController(BaseController):
             self.view.display_error_message("❌ Accès refusé : Seuls les commerciaux peuvent lire les clients.")
             return None
 
-        clients = self.session.query(Client).filter_by(commercial_id=self.user.id).all()
+        clients = (
+            self.session.query(Client)
+            .options(*self.load_options("list_personnal_client"))
+            .filter_by(commercial_id=self.user.id)
+            .all()
+        )
         self.view.display_clients(clients)
         return clients
 
+    def search_clients(self, query, page=1, page_size=PAGE_SIZE):
+        """Recherche les clients par nom, email, entreprise ou téléphone (sous-chaînes, sans accents ni casse).
+
+        Résultats classés et paginés (`page` à partir de 1) ; retourne les clients de la page.
+        """
+        if not self.check_permission("read_client"):
+            self.view.display_error_message("❌ Accès refusé")
+            return None
+
+        statement = Client.search_statement(self.session.get_bind().dialect.name, query)
+        if statement is None:
+            self.view.display_error_message("⚠️ Saisissez au moins un terme de recherche.")
+            return None
+
+        page = max(page, 1)
+        rows = self.session.scalars(
+            statement.options(*self.load_options("search_clients")).limit(page_size + 1).offset((page - 1) * page_size)
+        ).all()
+        clients = rows[:page_size]
+        self.view.display_search_results(clients, query, page, len(rows) > page_size)
+        return clients
+
     def update_client(self, client_id):
         """Mise à jour des informations d'un client (nécessite 'update_client')."""
 
@@ -86,6 +157,6 @@ class ClientController(BaseController):
 
         self.session.commit()
 
-        sentry_sdk.capture_message(f"Client {client_id} mis à jour.", level="info")
+        audit.emit("client_updated", f"Client {client_id} mis à jour.")
 
         self.view.display_info_message(f"✅ Client {client_id} mis à jour !")
@@ -0,0 +1,275 @@
+import argparse
+import contextlib
+import datetime
+import io
+import shlex
+from controller.client_controller import ClientController
+from controller.contrat_controller import ContratController
+from controller.event_controller import EventController
+from controller.report_controller import ReportController
+from controller.user_controller import UserController
+from utils.config import session_scope
+from view.json_view import JsonView
+
+
+def _date(value):
+    """Date au format ISO (`2025-06-01 14:00` ou `2025-06-01T14:00`)."""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date invalide : {value}")
+
+
+class CommandError(Exception):
+    """Ligne de commande invalide (message d'argparse)."""
+
+
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser qui lève une exception au lieu de quitter le processus (mode batch)."""
+
+    def error(self, message):
+        raise CommandError(f"{self.prog}: {message}")
+
+    def exit(self, status=0, message=None):
+        raise CommandError(message or self.format_usage())
+
+
+class CommandController:
+    """Mode non interactif : exécute les actions des contrôleurs à partir d'arguments, sortie JSON.
+
+    Chaque commande (`client list --mine`, `contrat filter --unsigned`, `event assign 42 --support 7`...)
+    appelle la méthode du contrôleur concerné en remplaçant sa vue par une JsonView, qui fournit les
+    saisies depuis les arguments et collecte les affichages. Les contrôleurs et l'analyseur sont créés
+    une seule fois, ce qui permet d'enchaîner des milliers de commandes dans un même processus.
+    """
+
+    CONTROLLERS = {
+        "user": UserController,
+        "client": ClientController,
+        "contrat": ContratController,
+        "event": EventController,
+        "report": ReportController,
+    }
+
+    def __init__(self, user):
+        """Initialise le mode commande avec l'utilisateur connecté."""
+        self.user = user
+        self.controllers = {}
+        self.parser = self.build_parser()
+
+    def build_parser(self):
+        """Construit l'analyseur `<entité> <action> [options]` ; chaque action déclare sa permission.
+
+        La permission est vérifiée avant l'appel pour que les refus soient signalés en JSON, y compris
+        pour les actions dont le contrôleur ne fait qu'afficher le refus.
+        """
+        parser = _Parser(prog="main.py", add_help=False)
+        entities = parser.add_subparsers(dest="entity", required=True)
+
+        def action(entity, name, permission, run):
+            command = entity.add_parser(name, add_help=False)
+            command.set_defaults(permission=permission, run=run)
+            return command
+
+        user = entities.add_parser("user", add_help=False).add_subparsers(dest="action", required=True)
+        action(user, "list", "read_user", lambda c, o: c.list_users())
+        command = action(user, "show", "read_user", lambda c, o: c.get_user_details(o.id))
+        command.add_argument("id", type=int)
+        command = action(user, "create", "create_user", self._create_user)
+        command.add_argument("--name", required=True)
+        command.add_argument("--email", required=True)
+        command.add_argument("--password", required=True)
+        command.add_argument("--role", required=True, choices=["gestion", "commercial", "support"])
+        command = action(user, "update", "update_user", self._update_user)
+        command.add_argument("id", type=int)
+        command.add_argument("--name", default="")
+        command.add_argument("--email", default="")
+        command.add_argument("--password", default="")
+        command = action(user, "delete", "delete_user", lambda c, o: c.delete_user(o.id))
+        command.add_argument("id", type=int)
+
+        client = entities.add_parser("client", add_help=False).add_subparsers(dest="action", required=True)
+        command = action(
+            client, "list", lambda o: "read_client_personnal" if o.mine else "read_client", self._list_clients
+        )
+        command.add_argument("--mine", action="store_true", help="seulement mes clients (commerciaux)")
+        command = action(client, "search", "read_client", lambda c, o: c.search_clients(" ".join(o.query), o.page))
+        command.add_argument("query", nargs="+")
+        command.add_argument("--page", type=int, default=1)
+        command = action(client, "create", "create_client", self._create_client)
+        command.add_argument("--name", required=True)
+        command.add_argument("--email", required=True)
+        command.add_argument("--phone")
+        command.add_argument("--company")
+        command = action(client, "update", "update_client", self._update_client)
+        command.add_argument("id", type=int)
+        for field in ("name", "email", "phone", "company"):
+            command.add_argument(f"--{field}", default="")
+
+        contrat = entities.add_parser("contrat", add_help=False).add_subparsers(dest="action", required=True)
+        action(contrat, "list", "read_contrat", lambda c, o: c.read_contrat())
+        command = action(contrat, "filter", "filter_contrat", self._filter_contrats)
+        filtre = command.add_mutually_exclusive_group(required=True)
+        filtre.add_argument("--unsigned", action="store_const", dest="filtre", const="non_signes")
+        filtre.add_argument("--unpaid", action="store_const", dest="filtre", const="paiement_en_attente")
+        command = action(contrat, "create", "create_contrat", self._create_contrat)
+        command.add_argument("--client", type=int, required=True)
+        command.add_argument("--total", type=float, required=True)
+        command.add_argument("--remaining", type=float, required=True)
+        command = action(contrat, "update", "update_contrat", self._update_contrat)
+        command.add_argument("id", type=int)
+        command.add_argument("--total", type=float)
+        command.add_argument("--remaining", type=float)
+        command.add_argument("--sign", action="store_true")
+
+        event = entities.add_parser("event", add_help=False).add_subparsers(dest="action", required=True)
+        action(event, "list", "read_event", lambda c, o: c.read_event())
+        action(event, "filter", "filter_event", lambda c, o: c.filter_event())
+        command = action(event, "create", "create_event", self._create_event)
+        command.add_argument("--contrat", type=int, required=True)
+        command.add_argument("--name", required=True)
+        command.add_argument("--start", type=_date, required=True)
+        command.add_argument("--end", type=_date, required=True)
+        command.add_argument("--location", required=True)
+        command.add_argument("--attendees", type=int, required=True)
+        command.add_argument("--support", type=int)
+        command.add_argument("--notes")
+        command = action(event, "assign", "update_event", self._assign_event)
+        command.add_argument("id", type=int)
+        command.add_argument("--support", type=int, required=True)
+        command = action(event, "notes", "update_event", self._update_notes)
+        command.add_argument("id", type=int)
+        command.add_argument("--notes", required=True)
+        command = action(event, "validate", "read_event", lambda c, o: c.validate_schedule(o.start, o.end))
+        command.add_argument("--from", dest="start", type=_date)
+        command.add_argument("--to", dest="end", type=_date)
+        command = action(event, "calendar", "read_event", lambda c, o: c.search_events(o.start, o.end, o.location))
+        command.add_argument("--from", dest="start", type=_date)
+        command.add_argument("--to", dest="end", type=_date)
+        command.add_argument("--location")
+        command = action(event, "auto-assign", "update_event", self._auto_assign)
+        command.add_argument("--from", dest="start", type=_date)
+        command.add_argument("--to", dest="end", type=_date)
+        command.add_argument("--dry-run", action="store_true")
+
+        report = entities.add_parser("report", add_help=False).add_subparsers(dest="action", required=True)
+        command = action(report, "totals", "read_contrat", lambda c, o: c.contrat_totals(o.by, o.live))
+        command.add_argument("--by", required=True, choices=ReportController.GROUPINGS)
+        command.add_argument("--live", action="store_true")
+        action(report, "dashboard", "read_contrat", lambda c, o: c.show_dashboard())
+        return parser
+
+    def controller(self, entity):
+        """Contrôleur de l'entité, créé au premier usage puis réutilisé."""
+        if entity not in self.controllers:
+            self.controllers[entity] = self.CONTROLLERS[entity](self.user)
+        return self.controllers[entity]
+
+    def execute(self, argv):
+        """Exécute une commande (liste d'arguments), affiche son résultat JSON et retourne True si elle a réussi."""
+        command = " ".join(argv)
+        view = JsonView()
+        try:
+            options = self.parser.parse_args(argv)
+        except CommandError as e:
+            return view.display_result(command, errors=[str(e).strip()])
+
+        controller = self.controller(options.entity)
+        permission = options.permission(options) if callable(options.permission) else options.permission
+        # Les contrôleurs affichent parfois directement (refus de permission) : la sortie reste du JSON.
+        with contextlib.redirect_stdout(io.StringIO()):
+            allowed = controller.check_permission(permission)
+        if not allowed:
+            return view.display_result(command, errors=["⛔ Permission refusée"])
+
+        controller.view, interactive_view = view, controller.view
+        try:
+            # Seule stdout est capturée : le profil SQL de l'action (--profile) reste visible sur stderr.
+            with contextlib.redirect_stdout(io.StringIO()), session_scope():
+                result = options.run(controller, options)
+        except Exception as e:
+            return view.display_result(command, errors=[str(e)])
+        finally:
+            controller.view = interactive_view
+        return view.display_result(command, result)
+
+    def run_batch(self, lines):
+        """Exécute une commande par ligne (lignes vides et commentaires `#` ignorés) ; retourne le nombre d'échecs."""
+        failures = 0
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                failures += not JsonView().display_result(line, errors=[str(e)])
+                continue
+            failures += not self.execute(argv)
+        return failures
+
+    # Actions dont les saisies sont fournies par les arguments.
+
+    def _create_user(self, controller, options):
+        controller.view.answers.update(
+            input_infos_user=(options.name, options.email, options.password), choose_role=options.role
+        )
+        return controller.create_user()
+
+    def _update_user(self, controller, options):
+        controller.view.answers["input_infos_user"] = (options.name, options.email, options.password)
+        return controller.update_user(options.id)
+
+    def _list_clients(self, controller, options):
+        if options.mine:
+            return controller.list_personnal_client()
+        return controller.list_all_client()
+
+    def _create_client(self, controller, options):
+        controller.view.answers["input_client_info"] = (options.name, options.email, options.phone, options.company)
+        return controller.create_client()
+
+    def _update_client(self, controller, options):
+        controller.view.answers["input_client_info"] = (options.name, options.email, options.phone, options.company)
+        return controller.update_client(options.id)
+
+    def _filter_contrats(self, controller, options):
+        controller.view.answers["ask_filter_option"] = options.filtre
+        return controller.filter_contrats()
+
+    def _create_contrat(self, controller, options):
+        controller.view.answers["input_contrat_info"] = (options.client, options.total, options.remaining)
+        return controller.create_contrat()
+
+    def _update_contrat(self, controller, options):
+        controller.view.answers["input_update_contrat_info"] = lambda contrat: (
+            options.total if options.total is not None else contrat.total_amount,
+            options.remaining if options.remaining is not None else contrat.remaining_amount,
+            True if options.sign else contrat.status,
+        )
+        return controller.update_contrat(options.id)
+
+    def _create_event(self, controller, options):
+        controller.view.answers["input_event_info"] = (
+            options.contrat,
+            options.name,
+            options.start,
+            options.end,
+            options.location,
+            options.attendees,
+            options.support,
+            options.notes,
+        )
+        return controller.create_event()
+
+    def _assign_event(self, controller, options):
+        controller.view.answers["input_support_assignment"] = options.support
+        return controller.update_event(options.id)
+
+    def _auto_assign(self, controller, options):
+        assignments, unassigned = controller.auto_assign(options.start, options.end, options.dry_run)
+        return {"assignments": assignments, "unassigned": unassigned}
+
+    def _update_notes(self, controller, options):
+        controller.view.answers["input_update_notes"] = options.notes
+        return controller.update_event(options.id)
@@ -1,12 +1,20 @@
 from model.contrat import Contrat
 from model.client import Client
 from controller.base_controller import BaseController
-from utils.config import Session as DBSession
+from utils.config import PAGE_SIZE, Session as DBSession, async_session
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
 from view.contrat_view import ContratView
-import sentry_sdk
+from utils.telemetry import audit
 
 
 class ContratController(BaseController):
+    EAGER_LOADING = {
+        "read_contrat": (joinedload(Contrat.client),),
+        "filter_contrats": (joinedload(Contrat.client),),
+        "update_contrat": (joinedload(Contrat.client),),
+    }
+
     def __init__(self, user):
         """Initialise le contrôleur avec l'utilisateur connecté."""
         super().__init__(user, DBSession())
@@ -49,7 +57,7 @@ class ContratController(BaseController):
         self.session.add(new_contrat)
         self.session.commit()
 
-        sentry_sdk.capture_message(f"Contrat créé pour {client.name}.", level="info")
+        audit.emit("contrat_created", f"Contrat créé pour {client.name}.")
 
         self.view.display_info_message(f"✅ Contrat créé avec succès pour le client {client.name} !")
         return new_contrat
@@ -61,7 +69,9 @@ class ContratController(BaseController):
             self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas modifier ce contrat.")
             return None
 
-        contrat = self.session.query(Contrat).filter_by(id=contrat_id).first()
+        contrat = (
+            self.session.query(Contrat).options(*self.load_options("update_contrat")).filter_by(id=contrat_id).first()
+        )
 
         if not contrat:
             self.view.display_error_message("⚠️ Contrat inexistant.")
@@ -79,7 +89,7 @@ class ContratController(BaseController):
 
         self.session.commit()
 
-        sentry_sdk.capture_message(f"Contrat {contrat.id} mis à jour.", level="info")
+        audit.emit("contrat_updated", f"Contrat {contrat.id} mis à jour.")
 
         self.view.display_info_message(f"✅ Contrat {contrat.id} mis à jour avec succès !")
         return contrat
@@ -91,7 +101,7 @@ class ContratController(BaseController):
             self.view.display_error_message("❌ Accès refusé : Vous n'avez pas la permission d'afficher les contrats.")
             return []
 
-        contrats = self.session.query(Contrat).all()
+        contrats = self.session.query(Contrat).options(*self.load_options("read_contrat")).all()
 
         if not contrats:
             self.view.display_info_message("📭 Aucun contrat trouvé.")
@@ -100,6 +110,46 @@ class ContratController(BaseController):
 
         return contrats
 
+    def iter_contrat_pages(self, page_size=PAGE_SIZE, query=None):
+        """Parcourt les contrats page par page (pagination par clé sur Contrat.id).
+
+        Chaque page coûte une seule requête (client chargé par jointure) et seule la page
+        courante est conservée en mémoire, quelle que soit la taille de la table.
+        """
+        if query is None:
+            query = self.session.query(Contrat)
+        query = query.options(*self.load_options("read_contrat")).order_by(Contrat.id)
+
+        last_id = None
+        while True:
+            page_query = query if last_id is None else query.filter(Contrat.id > last_id)
+            page = page_query.limit(page_size).all()
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last_id = page[-1].id
+
+    def browse_contrats(self, page_size=PAGE_SIZE):
+        """Affiche les contrats page par page et retourne le nombre de contrats affichés."""
+
+        if not self.check_permission("read_contrat"):
+            self.view.display_error_message("❌ Accès refusé : Vous n'avez pas la permission d'afficher les contrats.")
+            return 0
+
+        total = 0
+        for page in self.iter_contrat_pages(page_size):
+            self.view.display_contrats(page)
+            total += len(page)
+            if len(page) == page_size and not self.view.ask_next_page():
+                break
+
+        if total == 0:
+            self.view.display_info_message("📭 Aucun contrat trouvé.")
+
+        return total
+
     def filter_contrats(self):
         """Permet à l'utilisateur de filtrer les contrats (non signés ou avec paiement en attente)."""
 
@@ -109,7 +159,7 @@ class ContratController(BaseController):
 
         filtre = self.view.ask_filter_option()
 
-        query = self.session.query(Contrat)
+        query = self.session.query(Contrat).options(*self.load_options("filter_contrats"))
 
         if filtre == "non_signes":
             query = query.filter_by(status=False)
@@ -127,3 +177,53 @@ class ContratController(BaseController):
             self.view.display_contrats(contrats)
 
         return contrats
+
+    # Variantes asynchrones des lectures (sans affichage) : chacune ouvre sa propre AsyncSession,
+    # ce qui permet de les lancer en parallèle avec asyncio.gather.
+
+    async def read_contrat_async(self):
+        """Retourne tous les contrats avec leur client (équivalent asynchrone de read_contrat)."""
+        if not self.check_permission("read_contrat"):
+            return []
+        async with async_session() as session:
+            result = await session.execute(select(Contrat).options(*self.load_options("read_contrat")))
+            return result.scalars().all()
+
+    async def filter_contrats_async(self, filtre):
+        """Retourne les contrats non signés ou en attente de paiement (équivalent asynchrone de filter_contrats)."""
+        if not self.check_permission("filter_contrat"):
+            return []
+        statement = select(Contrat).options(*self.load_options("filter_contrats"))
+        if filtre == "non_signes":
+            statement = statement.where(Contrat.status.is_(False))
+        elif filtre == "paiement_en_attente":
+            statement = statement.where(Contrat.remaining_amount > 0)
+        else:
+            return []
+        async with async_session() as session:
+            return (await session.execute(statement)).scalars().all()
+
+    async def contrats_per_status_async(self):
+        """Nombre de contrats, montant total et restant dû par statut de signature."""
+        if not self.check_permission("read_contrat"):
+            return []
+        statement = select(
+            Contrat.status,
+            func.count(Contrat.id),
+            func.sum(Contrat.total_amount),
+            func.sum(Contrat.remaining_amount),
+        ).group_by(Contrat.status)
+        async with async_session() as session:
+            return [tuple(row) for row in await session.execute(statement)]
+
+    async def remaining_per_commercial_async(self):
+        """Montant restant dû par commercial (via les clients)."""
+        if not self.check_permission("read_contrat"):
+            return []
+        statement = (
+            select(Client.commercial_id, func.sum(Contrat.remaining_amount))
+            .join(Client, Contrat.client_id == Client.id)
+            .group_by(Client.commercial_id)
+        )
+        async with async_session() as session:
+            return [tuple(row) for row in await session.execute(statement)]
@@ -1,12 +1,22 @@
 from controller.base_controller import BaseController
 from model.event import Event
 from model.contrat import Contrat
+from model.role import Role
+from model.user import User
 from view.event_view import EventView
-from utils.config import Session as DBSession
-import sentry_sdk
+from utils.config import PAGE_SIZE, Session as DBSession, async_session
+from utils.scheduling import IntervalIndex, assign_supports, build_schedule_index
+from sqlalchemy import and_, func, or_, select, update
+from utils.telemetry import audit
 
 
 class EventController(BaseController):
+    # display_events n'affiche aucune relation : pas de chargement supplémentaire.
+    EAGER_LOADING = {
+        "read_event": (),
+        "filter_event": (),
+    }
+
     def __init__(self, user):
         """Initialise le contrôleur avec l'utilisateur connecté."""
         super().__init__(user, DBSession())
@@ -33,6 +43,8 @@ class EventController(BaseController):
         if not contrat:
             self.view.display_error_message("⚠️ Contrat inexistant.")
             return None
+        if support_id is not None and self.report_conflicts(support_id, start_date, end_date):
+            return None
 
         new_event = Event(
             name=name,
@@ -47,9 +59,9 @@ class EventController(BaseController):
 
         self.session.add(new_event)
         self.session.commit()
-        sentry_sdk.capture_message(
+        audit.emit(
+            "event_created",
             f"📅 Nouvel événement créé : {new_event.name} ({new_event.start_date} - {new_event.end_date})",
-            level="info",
         )
         self.view.display_info_message(f"✅ Événement '{name}' créé avec succès pour le contrat {contrat_id} !")
         return new_event
@@ -61,7 +73,7 @@ class EventController(BaseController):
             self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas lire un événement.")
             return []
 
-        events = self.session.query(Event).all()
+        events = self.session.query(Event).options(*self.load_options("read_event")).all()
 
         if not events:
             self.view.display_info_message("📭 Aucun événement disponible.")
@@ -78,11 +90,12 @@ class EventController(BaseController):
             return []
 
         events = []
+        query = self.session.query(Event).options(*self.load_options("filter_event"))
 
         if self.user.role.name == "support":
-            events = self.session.query(Event).filter_by(support_id=self.user.id).all()
+            events = query.filter_by(support_id=self.user.id).all()
         if self.user.role.name == "gestion":
-            events = self.session.query(Event).filter_by(support_id=None).all()
+            events = query.filter_by(support_id=None).all()
 
         if not events:
             self.view.display_info_message("📭 Aucun événement trouvé pour ce filtre.")
@@ -91,6 +104,66 @@ class EventController(BaseController):
 
         return events
 
+    def iter_event_pages(self, start_date=None, end_date=None, location=None, page_size=PAGE_SIZE):
+        """Parcourt par date les événements d'une fenêtre et/ou d'un lieu, page par page.
+
+        Pagination par clé sur (start_date, id) : chaque page coûte une requête servie par les index
+        de dates ou (location, start_date), et seule la page courante est en mémoire.
+        """
+        query = (
+            self.session.query(Event)
+            .options(*self.load_options("read_event"))
+            .filter(*Event.window_criteria(start_date, end_date, location))
+            .order_by(Event.start_date, Event.id)
+        )
+        last = None
+        while True:
+            page_query = query
+            if last is not None:
+                page_query = query.filter(
+                    or_(
+                        Event.start_date > last.start_date,
+                        and_(Event.start_date == last.start_date, Event.id > last.id),
+                    )
+                )
+            page = page_query.limit(page_size).all()
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last = page[-1]
+
+    def search_events(self, start_date=None, end_date=None, location=None):
+        """Événements qui chevauchent une fenêtre de dates et/ou ont lieu à un endroit, triés par date."""
+        if not self.check_permission("read_event"):
+            self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas lire un événement.")
+            return []
+
+        events = [event for page in self.iter_event_pages(start_date, end_date, location) for event in page]
+        if not events:
+            self.view.display_info_message("📭 Aucun événement sur cette période ou à ce lieu.")
+        else:
+            self.view.display_events(events)
+        return events
+
+    def browse_calendar(self, start_date=None, end_date=None, location=None, page_size=PAGE_SIZE):
+        """Affiche page par page les événements d'une fenêtre et/ou d'un lieu ; retourne le nombre affiché."""
+        if not self.check_permission("read_event"):
+            self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas lire un événement.")
+            return 0
+
+        total = 0
+        for page in self.iter_event_pages(start_date, end_date, location, page_size):
+            self.view.display_events(page)
+            total += len(page)
+            if len(page) == page_size and not self.view.ask_next_page():
+                break
+
+        if total == 0:
+            self.view.display_info_message("📭 Aucun événement sur cette période ou à ce lieu.")
+        return total
+
     def update_event(self, event_id):
         """Met à jour un événement (gestion attribue un support, support met à jour les notes)."""
 
@@ -106,6 +179,8 @@ class EventController(BaseController):
 
         if self.user.role.name == "gestion":
             new_support_id = self.view.input_support_assignment()
+            if self.report_conflicts(new_support_id, event.start_date, event.end_date, exclude_id=event.id):
+                return None
             event.support_id = new_support_id
 
         if self.user.role.name == "support":
@@ -113,8 +188,134 @@ class EventController(BaseController):
             event.notes = new_notes
 
         self.session.commit()
-        sentry_sdk.capture_message(
-            f"📅 Événement mis à jour : {event.name} ({event.start_date} - {event.end_date})", level="info"
-        )
+        audit.emit("event_updated", f"📅 Événement mis à jour : {event.name} ({event.start_date} - {event.end_date})")
         self.view.display_info_message(f"✅ Événement {event.id} mis à jour avec succès !")
         return event
+
+    def support_conflicts(self, support_id, start_date, end_date, exclude_id=None):
+        """Événements du support qui chevauchent le créneau [start_date, end_date), triés par début.
+
+        Les événements du support dans la fenêtre sont lus par l'index (support_id, start_date) puis
+        placés dans un IntervalIndex, comme pour validate_schedule : les deux contrôles appliquent la
+        même règle de chevauchement.
+        """
+        query = self.session.query(Event).filter(
+            Event.support_id == support_id, Event.start_date < end_date, Event.end_date > start_date
+        )
+        if exclude_id is not None:
+            query = query.filter(Event.id != exclude_id)
+        index = IntervalIndex((event.start_date, event.end_date, event) for event in query)
+        return index.overlapping(start_date, end_date)
+
+    def report_conflicts(self, support_id, start_date, end_date, exclude_id=None):
+        """Signale les événements du support sur ce créneau ; retourne True s'il y en a."""
+        conflicts = self.support_conflicts(support_id, start_date, end_date, exclude_id)
+        if conflicts:
+            self.view.display_error_message(
+                f"⚠️ Le support {support_id} est déjà affecté sur ce créneau : "
+                + ", ".join(f"{event.name} ({event.start_date} - {event.end_date})" for event in conflicts)
+            )
+        return bool(conflicts)
+
+    def validate_schedule(self, start_date=None, end_date=None):
+        """Détecte les chevauchements d'événements par support, éventuellement dans une fenêtre de dates.
+
+        Les événements assignés sont lus en une requête, puis indexés par support (IntervalIndex) :
+        la recherche ne compare que les événements qui se chevauchent réellement.
+        Retourne les conflits (support_id, événement, événement en conflit).
+        """
+        if not self.check_permission("read_event"):
+            self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas lire les événements.")
+            return []
+
+        query = self.session.query(Event.support_id, Event.start_date, Event.end_date, Event.id, Event.name).filter(
+            Event.support_id.is_not(None)
+        )
+        if start_date is not None:
+            query = query.filter(Event.end_date > start_date)
+        if end_date is not None:
+            query = query.filter(Event.start_date < end_date)
+        rows = ((support_id, start, end, (event_id, name)) for support_id, start, end, event_id, name in query)
+
+        conflicts = []
+        for support_id, index in sorted(build_schedule_index(rows).items()):
+            conflicts.extend((support_id, first, second) for first, second in index.conflicts())
+        self.view.display_schedule_conflicts(conflicts)
+        return conflicts
+
+    def auto_assign(self, start_date=None, end_date=None, dry_run=False):
+        """Assigne un support à tous les événements non assignés (gestion), éventuellement dans une fenêtre de dates.
+
+        Trois requêtes (événements à assigner, supports avec leur charge, planning existant sur la période)
+        puis une répartition gloutonne sans chevauchement (assign_supports) et une mise à jour groupée.
+        En simulation (dry_run), rien n'est enregistré.
+        Retourne (attributions [(event_id, support_id)], événements restés sans support).
+        """
+        if not self.check_permission("update_event") or self.user.role.name != "gestion":
+            self.view.display_error_message("❌ Accès refusé : Seule la gestion peut assigner les supports.")
+            return [], []
+
+        query = self.session.query(Event.id, Event.start_date, Event.end_date).filter(Event.support_id.is_(None))
+        if start_date is not None:
+            query = query.filter(Event.end_date > start_date)
+        if end_date is not None:
+            query = query.filter(Event.start_date < end_date)
+        events = query.all()
+        if not events:
+            self.view.display_info_message("📭 Aucun événement à assigner.")
+            return [], []
+
+        loads = dict(
+            self.session.query(User.id, func.count(Event.id))
+            .join(User.role)
+            .outerjoin(Event, Event.support_id == User.id)
+            .filter(Role.name == "support")
+            .group_by(User.id)
+        )
+        period_start = min(start for _, start, _ in events)
+        period_end = max(end for _, _, end in events)
+        planned = self.session.query(Event.support_id, Event.start_date, Event.end_date, Event.id).filter(
+            Event.support_id.is_not(None), Event.start_date < period_end, Event.end_date > period_start
+        )
+        assignments, unassigned = assign_supports(events, sorted(loads), build_schedule_index(planned), loads)
+
+        if assignments and not dry_run:
+            self.session.execute(
+                update(Event), [{"id": event_id, "support_id": support_id} for event_id, support_id in assignments]
+            )
+            self.session.commit()
+            audit.emit("events_assigned", f"📅 {len(assignments)} événement(s) assigné(s) automatiquement.")
+        self.view.display_assignment_report(assignments, unassigned, dry_run)
+        return assignments, unassigned
+
+    # Variantes asynchrones des lectures (sans affichage), une AsyncSession chacune.
+
+    async def read_event_async(self):
+        """Retourne tous les événements (équivalent asynchrone de read_event)."""
+        if not self.check_permission("read_event"):
+            return []
+        async with async_session() as session:
+            result = await session.execute(select(Event).options(*self.load_options("read_event")))
+            return result.scalars().all()
+
+    async def filter_event_async(self):
+        """Retourne les événements du support connecté, ou non assignés pour la gestion."""
+        if not self.check_permission("filter_event"):
+            return []
+        statement = select(Event).options(*self.load_options("filter_event"))
+        if self.user.role.name == "support":
+            statement = statement.where(Event.support_id == self.user.id)
+        elif self.user.role.name == "gestion":
+            statement = statement.where(Event.support_id.is_(None))
+        else:
+            return []
+        async with async_session() as session:
+            return (await session.execute(statement)).scalars().all()
+
+    async def events_per_support_async(self):
+        """Nombre d'événements par collaborateur support (None : non assignés)."""
+        if not self.check_permission("read_event"):
+            return []
+        statement = select(Event.support_id, func.count(Event.id)).group_by(Event.support_id)
+        async with async_session() as session:
+            return [tuple(row) for row in await session.execute(statement)]
@@ -0,0 +1,127 @@
+from sqlalchemy import select
+from controller.base_controller import BaseController
+from model.client import Client
+from model.contrat import Contrat
+from model.event import Event
+from model.role import Role
+from model.user import User
+from utils.config import EXPORT_BATCH_SIZE, Session as DBSession
+from utils.ics import write_ics
+from utils.records import write_records
+from view.export_view import ExportView
+
+
+class ExportController(BaseController):
+    """Exports en flux (CSV, JSONL ou colonnaire) des clients, contrats, événements et utilisateurs."""
+
+    # Entité exportable -> permission de lecture requise.
+    PERMISSIONS = {
+        "clients": "read_client",
+        "contrats": "read_contrat",
+        "events": "read_event",
+        "users": "read_user",
+    }
+
+    # Filtres identiques à filter_contrats / filter_event -> permission requise.
+    FILTERS = {
+        "contrats": {"non_signes": "filter_contrat", "paiement_en_attente": "filter_contrat"},
+        "events": {"mine": "filter_event", "unassigned": "filter_event"},
+    }
+
+    def __init__(self, user):
+        """Initialise le contrôleur avec l'utilisateur connecté."""
+        super().__init__(user, DBSession())
+        self.view = ExportView()
+
+    def build_query(self, entity, filtre=None):
+        """Construit la requête de colonnes (sans objets ORM) pour une entité et un filtre éventuel."""
+        if entity == "clients":
+            # Colonnes listées : la clé de recherche (search_key) est interne à l'index plein texte.
+            statement = select(
+                Client.id,
+                Client.name,
+                Client.email,
+                Client.phone,
+                Client.company,
+                Client.date_created,
+                Client.date_updated,
+                Client.commercial_id,
+            ).order_by(Client.id)
+        elif entity == "contrats":
+            statement = select(*Contrat.__table__.columns).order_by(Contrat.id)
+            if filtre == "non_signes":
+                statement = statement.where(Contrat.status.is_(False))
+            elif filtre == "paiement_en_attente":
+                statement = statement.where(Contrat.remaining_amount > 0)
+        elif entity == "events":
+            statement = select(*Event.__table__.columns).order_by(Event.id)
+            if filtre == "mine":
+                statement = statement.where(Event.support_id == self.user.id)
+            elif filtre == "unassigned":
+                statement = statement.where(Event.support_id.is_(None))
+        else:
+            statement = (
+                select(User.id, User.name, User.email, User.role_id, Role.name.label("role"))
+                .outerjoin(Role, User.role_id == Role.id)
+                .order_by(User.id)
+            )
+        return statement
+
+    def export(self, entity, path, fmt=None, filtre=None, batch_size=EXPORT_BATCH_SIZE):
+        """Exporte une entité vers un fichier et retourne le nombre de lignes écrites.
+
+        Les lignes sont lues par un curseur serveur (`yield_per`) et écrites lot par lot :
+        la mémoire utilisée ne dépend pas de la taille de la table.
+        """
+        if entity not in self.PERMISSIONS:
+            self.view.display_error_message(f"Entité inconnue : {entity}")
+            return None
+        if filtre and filtre not in self.FILTERS.get(entity, {}):
+            self.view.display_error_message(f"Filtre invalide pour {entity} : {filtre}")
+            return None
+
+        action = self.FILTERS[entity][filtre] if filtre else self.PERMISSIONS[entity]
+        if not self.check_permission(action):
+            self.view.display_error_message(f"❌ Accès refusé : Vous ne pouvez pas exporter les {entity}.")
+            return None
+
+        statement = self.build_query(entity, filtre).execution_options(yield_per=batch_size)
+        result = self.session.execute(statement)
+        try:
+            count = write_records(path, list(result.keys()), result.partitions(), fmt)
+        except ValueError as e:
+            self.view.display_error_message(str(e))
+            return None
+        finally:
+            result.close()
+
+        self.view.display_info_message(f"✅ {count} ligne(s) exportée(s) dans {path}.")
+        return count
+
+    def export_calendar(
+        self, path, start_date=None, end_date=None, location=None, mine=False, batch_size=EXPORT_BATCH_SIZE
+    ):
+        """Exporte les événements (fenêtre de dates, lieu, ou seulement les siens) en calendrier iCalendar (.ics).
+
+        Les événements sont lus par date via un curseur serveur et écrits lot par lot : un support peut
+        synchroniser un planning de toute taille à mémoire constante. Retourne le nombre d'événements.
+        """
+        if not self.check_permission("filter_event" if mine else "read_event"):
+            self.view.display_error_message("❌ Accès refusé : Vous ne pouvez pas exporter les events.")
+            return None
+
+        statement = (
+            select(Event.id, Event.name, Event.start_date, Event.end_date, Event.location, Event.notes)
+            .where(*Event.window_criteria(start_date, end_date, location))
+            .order_by(Event.start_date, Event.id)
+        )
+        if mine:
+            statement = statement.where(Event.support_id == self.user.id)
+        result = self.session.execute(statement.execution_options(yield_per=batch_size))
+        try:
+            count = write_ics(path, result.partitions())
+        finally:
+            result.close()
+
+        self.view.display_info_message(f"✅ {count} événement(s) exporté(s) dans {path}.")
+        return count
@@ -0,0 +1,107 @@
+import asyncio
+from sqlalchemy import extract, func, select
+from controller.base_controller import BaseController
+from controller.contrat_controller import ContratController
+from controller.event_controller import EventController
+from model.client import Client
+from model.contrat import Contrat
+from model.contrat_summary import ContratSummary, rebuild_contrat_summaries
+from model.user import User
+from utils.config import Session as DBSession, dispose_async_engine
+from view.report_view import ReportView
+
+
+class ReportController(BaseController):
+    """Rapports agrégés sur les contrats et les événements."""
+
+    # Regroupements disponibles pour les totaux des contrats.
+    GROUPINGS = ("client", "commercial", "month", "status")
+
+    def __init__(self, user):
+        """Initialise le contrôleur avec l'utilisateur connecté."""
+        super().__init__(user, DBSession())
+        self.contrats = ContratController(user)
+        self.events = EventController(user)
+        self.view = ReportView()
+
+    def contrat_totals(self, group_by, live=False):
+        """Nombre de contrats, montant total et restant dû par client, commercial, mois ou statut.
+
+        Les totaux sont calculés par la base (GROUP BY) à partir de la table de synthèse, qui compte
+        quelques lignes par client et par mois ; live=True agrège directement la table des contrats.
+        """
+        if not self.check_permission("read_contrat"):
+            self.view.display_error_message("Accès refusé : Vous n'avez pas la permission d'afficher les rapports.")
+            return []
+        if group_by not in self.GROUPINGS:
+            raise ValueError(f"Regroupement inconnu : {group_by}")
+
+        if live:
+            source, count = Contrat, func.count(Contrat.id)
+            year, month = extract("year", Contrat.date_created), extract("month", Contrat.date_created)
+        else:
+            source, count = ContratSummary, func.sum(ContratSummary.contrat_count)
+            year, month = ContratSummary.year, ContratSummary.month
+        keys = {
+            "client": (Client.id, Client.name),
+            "commercial": (User.id, User.name),
+            "month": (year, month),
+            "status": (source.status,),
+        }[group_by]
+
+        statement = select(*keys, count, func.sum(source.total_amount), func.sum(source.remaining_amount))
+        statement = statement.select_from(source)
+        if group_by in ("client", "commercial"):
+            statement = statement.join(Client, source.client_id == Client.id)
+        if group_by == "commercial":
+            statement = statement.outerjoin(User, Client.commercial_id == User.id)
+        if live:
+            statement = statement.where(Contrat.client_id.is_not(None))
+        statement = statement.group_by(*keys).order_by(*keys)
+
+        totals = [tuple(row) for row in self.session.execute(statement)]
+        self.view.display_contrat_totals(totals, group_by)
+        return totals
+
+    def rebuild_summaries(self):
+        """Recalcule la synthèse des contrats (après des insertions en masse hors ORM)."""
+        if not self.check_permission("update_contrat"):
+            self.view.display_error_message("Accès refusé : Vous ne pouvez pas recalculer les rapports.")
+            return None
+        rows = rebuild_contrat_summaries(self.session)
+        self.view.display_info_message(f"Synthèse des contrats recalculée ({rows} lignes).")
+        return rows
+
+    async def collect_dashboard(self, concurrent=True):
+        """Exécute les agrégats du tableau de bord, en parallèle (asyncio.gather) ou l'un après l'autre.
+
+        Chaque agrégat utilise sa propre AsyncSession, donc sa propre connexion du pool.
+        """
+        names = ("contrats_par_statut", "reste_par_commercial", "events_par_support")
+        queries = (
+            self.contrats.contrats_per_status_async,
+            self.contrats.remaining_per_commercial_async,
+            self.events.events_per_support_async,
+        )
+        if concurrent:
+            results = await asyncio.gather(*(query() for query in queries))
+        else:
+            results = [await query() for query in queries]
+        return dict(zip(names, results))
+
+    def show_dashboard(self):
+        """Calcule et affiche le tableau de bord (contrats par statut, restant dû, événements par support)."""
+        if not self.check_permission("read_contrat"):
+            self.view.display_error_message("Accès refusé : Vous n'avez pas la permission d'afficher les rapports.")
+            return None
+
+        async def collect():
+            # Le moteur asynchrone est lié à la boucle d'asyncio.run : il est fermé avec elle.
+            try:
+                return await self.collect_dashboard()
+            finally:
+                await dispose_async_engine()
+
+        dashboard = asyncio.run(collect())
+        self.view.display_dashboard(dashboard)
+        return dashboard
@@ -1,12 +1,22 @@
-from utils.config import Session as DBSession
+import os
+from concurrent.futures import ProcessPoolExecutor
+from utils.config import HASH_WORKERS, IMPORT_BATCH_SIZE, SESSION_CACHE_FILE, Session as DBSession
 from model.user import User
 from model.role import Role
 from view.user_view import UserView
 from controller.base_controller import BaseController
-import sentry_sdk
+from sqlalchemy.orm import joinedload, selectinload
+from utils.records import text_field
+from utils.session_cache import clear_session_cache
+from utils.telemetry import audit
 
 
 class UserController(BaseController):
+    EAGER_LOADING = {
+        "list_users": (joinedload(User.role),),
+        "get_user_details": (joinedload(User.role), selectinload(User.clients), selectinload(User.events)),
+    }
+
     def __init__(self, user):
         """Initialise le contrôleur avec l'utilisateur connecté."""
         super().__init__(user, DBSession())
@@ -29,10 +39,55 @@ class UserController(BaseController):
         new_user = self.model(name=name, email=email, password=password, role_id=role.id)
         self.session.add(new_user)
         self.session.commit()
-        sentry_sdk.capture_message(f"👤 Nouvel utilisateur créé : {new_user.name} ({new_user.email})", level="info")
+        audit.emit("user_created", f"👤 Nouvel utilisateur créé : {new_user.name} ({new_user.email})")
         self.view.display_info_message(f"✅ Utilisateur '{name}' créé avec succès !")
         return new_user
 
+    def import_users(self, path, batch_size=IMPORT_BATCH_SIZE, workers=HASH_WORKERS):
+        """Création en masse d'utilisateurs depuis un fichier CSV ou JSONL (nécessite 'create_user').
+
+        Les champs attendus sont name, email, password et role. Le fichier est lu en flux et traité par
+        lots (voir BaseController.import_records) : les mots de passe de chaque lot sont hachés dans un
+        pool de `workers` processus (un par cœur si 0, en série si 1), puis insérés par un INSERT
+        multi-lignes et un commit par lot.
+        Retourne (nombre d'utilisateurs créés, erreurs par ligne).
+        """
+        if not self.check_permission("create_user"):
+            return None
+
+        role_ids = {name: role_id for role_id, name in self.session.query(Role.id, Role.name)}
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        def parse_record(record):
+            name, email, password, role = (text_field(record, field) for field in ("name", "email", "password", "role"))
+            if not name or not email or not password:
+                raise ValueError("Nom, email et mot de passe obligatoires.")
+            if role not in role_ids:
+                raise ValueError(f"Rôle invalide : {role}")
+            return {"name": name, "email": email, "password": password, "role_id": role_ids[role]}
+
+        def hash_passwords(rows):
+            hashes = User.hash_passwords([row["password"] for row in rows], executor)
+            return [{**row, "password": password_hash} for row, password_hash in zip(rows, hashes)]
+
+        try:
+            inserted, errors = self.import_records(
+                User,
+                path,
+                batch_size,
+                parse_record,
+                "Un utilisateur avec cet email existe déjà : {email}",
+                prepare_rows=hash_passwords,
+            )
+        finally:
+            if executor:
+                executor.shutdown()
+
+        audit.emit("users_imported", f"👤 {inserted} utilisateurs créés par {self.user.name}.")
+        self.view.display_import_report(inserted, errors)
+        return inserted, errors
+
     def delete_user(self, user_id):
         """Suppression d'un utilisateur (nécessite 'delete_user')."""
         if not self.check_permission("delete_user"):
@@ -42,10 +97,10 @@ class UserController(BaseController):
         if user_to_delete:
             self.session.delete(user_to_delete)
             self.session.commit()
+            if user_to_delete.id == self.user.id:
+                clear_session_cache(SESSION_CACHE_FILE)
             self.view.display_info_message(f"✅ Utilisateur {user_id} supprimé !")
-            sentry_sdk.capture_message(
-                f"👤 Utilisateur supprimé : {user_to_delete.name} ({user_to_delete.email})", level="info"
-            )
+            audit.emit("user_deleted", f"👤 Utilisateur supprimé : {user_to_delete.name} ({user_to_delete.email})")
         else:
             self.view.display_error_message(f"⚠️ L'utilisateur {user_id} n'existe pas.")
 
@@ -55,7 +110,7 @@ class UserController(BaseController):
         if not self.check_permission("read_user"):
             return None
 
-        users = self.session.query(User).all()
+        users = self.session.query(User).options(*self.load_options("list_users")).all()
         self.view.display_users(users)
 
     def get_user_details(self, user_id):
@@ -63,7 +118,7 @@ class UserController(BaseController):
         if not self.check_permission("read_user"):
             return None
 
-        user = self.session.query(User).filter_by(id=user_id).first()
+        user = self.session.query(User).options(*self.load_options("get_user_details")).filter_by(id=user_id).first()
         if user:
             self.view.display_user_details(user)
         else:
@@ -87,6 +142,9 @@ class UserController(BaseController):
         user.email = email if email else user.email
         if password:
             user.password = user.set_password(password)
+        user.token_version = (user.token_version or 0) + 1
         self.session.commit()
-        sentry_sdk.capture_message(f"👤 Utilisateur mis à jour : {user.name} ({user.email})", level="info")
+        if user.id == self.user.id:
+            clear_session_cache(SESSION_CACHE_FILE)
+        audit.emit("user_updated", f"👤 Utilisateur mis à jour : {user.name} ({user.email})")
         self.view.display_info_message(f"✅ Utilisateur {user_id} mis à jour !")
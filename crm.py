@@ -0,0 +1,92 @@
+"""Client léger du serveur CRM (`python main.py serve`).
+
+N'importe que la bibliothèque standard : la commande est transmise au serveur, qui garde moteur, pool,
+permissions et contrôleurs en mémoire. Sans serveur joignable, la commande est exécutée par main.py.
+
+    python crm.py client list --mine
+    python crm.py batch < operations.txt
+"""
+
+import json
+import os
+import shlex
+import socket
+import sys
+
+DAEMON_SOCKET = os.getenv("DAEMON_SOCKET", ".crm.sock")
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def load_token(path=".token"):
+    """Token stocké par `python main.py login`."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def connect(path=DAEMON_SOCKET):
+    """Connexion au serveur, ou None s'il n'est pas lancé."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def send(connection, token, argv):
+    """Envoie une commande et retourne la réponse JSON (décodée) du serveur."""
+    connection.sendall(json.dumps({"token": token, "argv": argv}).encode("utf-8") + b"\n")
+    response = b""
+    while not response.endswith(b"\n"):
+        chunk = connection.recv(65536)
+        if not chunk:
+            raise ConnectionError("Connexion fermée par le serveur.")
+        response += chunk
+    return json.loads(response)
+
+
+def batch_commands(lines):
+    """Commandes d'un fichier batch (lignes vides et commentaires `#` ignorés) : (ligne, argv ou erreur)."""
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield line, shlex.split(line)
+        except ValueError as e:
+            yield line, e
+
+
+def main(args):
+    connection = connect()
+    if connection is None:
+        os.execv(sys.executable, [sys.executable, MAIN, *args])
+
+    token = load_token()
+    if args[:1] == ["batch"]:
+        lines = open(args[1], encoding="utf-8") if len(args) > 1 else sys.stdin
+        commands = batch_commands(lines)
+    else:
+        commands = [(" ".join(args), args)]
+
+    failures = 0
+    with connection:
+        for line, argv in commands:
+            if isinstance(argv, ValueError):
+                # Même réponse que `main.py batch` pour une ligne illisible, et le batch continue.
+                result = {"command": line, "ok": False, "data": None, "messages": [], "errors": [str(argv)]}
+            else:
+                result = send(connection, token, argv)
+            print(json.dumps(result, ensure_ascii=False))
+            failures += not result["ok"]
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,52 +1,419 @@
-from prompt_toolkit import prompt
-from rich.console import Console
-from controller.auth_controller import AuthController
-from controller.user_controller import UserController
-from controller.contrat_controller import ContratController
-from controller.event_controller import EventController
-from controller.client_controller import ClientController
-from utils.config import Base, engine, Session
-from utils.populate_database import seed_roles, seed_admin_user
 import sys
-from model import Role, User
-from view.menu_view import show_menu, show_user_menu, show_client_menu, show_contrat_menu, show_event_menu
-import sentry_sdk
+from utils import config
+from utils.config import init_sentry, session_scope, close_sessions
 
-console = Console()
-auth_controller = AuthController()
+# Les dépendances lourdes (rich, prompt_toolkit, contrôleurs, Sentry) sont importées dans les commandes
+# qui les utilisent : `login` et `logout` ne chargent que l'authentification.
 
 
 def initialize_database():
-    """Ajoute les rôles et l'admin s'ils n'existent pas encore."""
-    Base.metadata.create_all(engine)
-    session = Session()
-    if session.query(Role).count() == 0:
-        print("📌 Création des rôles...")
-        seed_roles(session)
-    admin_exists = (
-        session.query(User).join(Role).filter(User.email == "admin@admin.com", Role.name == "gestion").first()
+    """Met la base à niveau si sa version enregistrée est plus ancienne que celle du code.
+
+    En régime établi, seule la lecture de la version est exécutée (une requête).
+    """
+    from utils.migrations import upgrade_database
+
+    with session_scope() as session:
+        return upgrade_database(session)
+
+
+def authenticated_user():
+    """Retourne l'utilisateur du token stocké, ou None en affichant comment se connecter."""
+    from controller.auth_controller import AuthController
+
+    user = AuthController().verify_token()
+    if not user:
+        print("\n🔐 Connectez-vous d'abord avec `python main.py login`")
+    return user
+
+
+def login(args):
+    """Commande `login` : authentifie l'utilisateur et stocke son token."""
+    from controller.auth_controller import AuthController
+
+    initialize_database()
+    with session_scope():
+        AuthController().login()
+
+
+def logout(args):
+    """Commande `logout` : supprime le token stocké localement."""
+    from controller.auth_controller import AuthController
+
+    AuthController().logout()
+    print("\n🚪 Déconnexion réussie !")
+
+
+def init_db(args):
+    """Commande `init-db` : initialise ou met à niveau le schéma et les données par défaut."""
+    version = initialize_database()
+    print(f"✅ Base de données à jour (version {version}).")
+
+
+def import_clients(args):
+    """Commande `clients import <fichier> [--batch-size N]` : import en masse de clients."""
+    import argparse
+    from controller.client_controller import ClientController
+    from utils.config import IMPORT_BATCH_SIZE
+
+    parser = argparse.ArgumentParser(prog="main.py clients import")
+    parser.add_argument("path", help="fichier CSV ou JSONL (champs name, email, phone, company)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="clients insérés par lot")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            ClientController(user).import_clients(options.path, options.batch_size)
+
+
+def search_clients(args):
+    """Commande `clients search <termes> [--page N]` : recherche classée et paginée des clients."""
+    import argparse
+    from controller.client_controller import ClientController
+
+    parser = argparse.ArgumentParser(prog="main.py clients search")
+    parser.add_argument("query", nargs="+", help="nom, email, entreprise ou téléphone (ou un extrait)")
+    parser.add_argument("--page", type=int, default=1, help="page de résultats (à partir de 1)")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            ClientController(user).search_clients(" ".join(options.query), options.page)
+
+
+def import_users(args):
+    """Commande `users import <fichier> [--batch-size N] [--workers N]` : création d'utilisateurs en masse."""
+    import argparse
+    from controller.user_controller import UserController
+    from utils.config import HASH_WORKERS, IMPORT_BATCH_SIZE
+
+    parser = argparse.ArgumentParser(prog="main.py users import")
+    parser.add_argument("path", help="fichier CSV ou JSONL (champs name, email, password, role)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="utilisateurs insérés par lot")
+    parser.add_argument(
+        "--workers", type=int, default=HASH_WORKERS, help="processus de hachage (0 : un par cœur, 1 : en série)"
     )
+    options = parser.parse_args(args)
 
-    if admin_exists is None:
-        print("📌 Création de l'admin par défaut...")
-        seed_admin_user(session)
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            UserController(user).import_users(options.path, options.batch_size, options.workers)
 
-    session.close()
 
+def validate_events(args):
+    """Commande `events validate [--from DATE] [--to DATE]` : chevauchements dans le planning des supports."""
+    import argparse
+    import datetime
+    from controller.event_controller import EventController
 
-def main():
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "login":
-            auth_controller.login()
-            return
-        elif sys.argv[1] == "logout":
-            auth_controller.logout()
-            console.print("\n[bold yellow]🚪 Déconnexion réussie ![/bold yellow]")
-            return
+    parser = argparse.ArgumentParser(prog="main.py events validate")
+    parser.add_argument("--from", dest="start", type=datetime.datetime.fromisoformat, help="début de la fenêtre")
+    parser.add_argument("--to", dest="end", type=datetime.datetime.fromisoformat, help="fin de la fenêtre")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user and EventController(user).validate_schedule(options.start, options.end):
+            sys.exit(1)
+
+
+def assign_events(args):
+    """Commande `events assign [--from DATE] [--to DATE] [--dry-run]` : assignation automatique des supports."""
+    import argparse
+    import datetime
+    from controller.event_controller import EventController
+
+    parser = argparse.ArgumentParser(prog="main.py events assign")
+    parser.add_argument("--from", dest="start", type=datetime.datetime.fromisoformat, help="début de la fenêtre")
+    parser.add_argument("--to", dest="end", type=datetime.datetime.fromisoformat, help="fin de la fenêtre")
+    parser.add_argument("--dry-run", action="store_true", help="afficher la répartition sans l'enregistrer")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            EventController(user).auto_assign(options.start, options.end, options.dry_run)
+
+
+def calendar_events(args):
+    """Commande `events calendar [--from DATE] [--to DATE] [--location LIEU]` : planning page par page."""
+    import argparse
+    import datetime
+    from controller.event_controller import EventController
+
+    parser = argparse.ArgumentParser(prog="main.py events calendar")
+    parser.add_argument("--from", dest="start", type=datetime.datetime.fromisoformat, help="début de la fenêtre")
+    parser.add_argument("--to", dest="end", type=datetime.datetime.fromisoformat, help="fin de la fenêtre")
+    parser.add_argument("--location", help="lieu exact des événements")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            EventController(user).browse_calendar(options.start, options.end, options.location)
+
+
+def export_ics(args):
+    """Commande `events ics <fichier> [--from DATE] [--to DATE] [--location LIEU] [--mine]` : export iCalendar."""
+    import argparse
+    import datetime
+    from controller.export_controller import ExportController
+    from utils.config import EXPORT_BATCH_SIZE
+
+    parser = argparse.ArgumentParser(prog="main.py events ics")
+    parser.add_argument("path", help="fichier de sortie (.ics)")
+    parser.add_argument("--from", dest="start", type=datetime.datetime.fromisoformat, help="début de la fenêtre")
+    parser.add_argument("--to", dest="end", type=datetime.datetime.fromisoformat, help="fin de la fenêtre")
+    parser.add_argument("--location", help="lieu exact des événements")
+    parser.add_argument("--mine", action="store_true", help="seulement les événements dont je suis le support")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE, help="événements lus par lot")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            ExportController(user).export_calendar(
+                options.path, options.start, options.end, options.location, options.mine, options.batch_size
+            )
+
+
+def export(args):
+    """Commande `export <entité> <fichier> [--format F] [--filter F]` : export en flux vers un fichier."""
+    import argparse
+    from controller.export_controller import ExportController
+    from utils.config import EXPORT_BATCH_SIZE
+    from utils.records import FORMATS
+
+    parser = argparse.ArgumentParser(prog="main.py export")
+    parser.add_argument("entity", choices=sorted(ExportController.PERMISSIONS))
+    parser.add_argument("path", help="fichier de sortie (.csv, .jsonl ou .cjsonl)")
+    parser.add_argument("--format", choices=FORMATS, help="format de sortie (déduit de l'extension par défaut)")
+    parser.add_argument(
+        "--filter", help="contrats : non_signes, paiement_en_attente ; events : mine, unassigned", dest="filtre"
+    )
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE, help="lignes lues par lot")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            ExportController(user).export(
+                options.entity, options.path, options.format, options.filtre, options.batch_size
+            )
+
+
+def dashboard(args):
+    """Commande `dashboard` : agrégats contrats/événements calculés en parallèle par le moteur asynchrone."""
+    from controller.report_controller import ReportController
 
-    user = auth_controller.verify_token()
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            ReportController(user).show_dashboard()
+
+
+# Actions `report` du mode commande, distinctes des regroupements de la commande interactive.
+REPORT_ACTIONS = ("totals", "dashboard")
+
+
+def report(args):
+    """Commande `report <client|commercial|month|status> [--live] [--rebuild]` : totaux des contrats (GROUP BY SQL).
+
+    `report totals --by <regroupement>` et `report dashboard` passent par le mode commande (JSON).
+    """
+    import argparse
+    from controller.report_controller import ReportController
+
+    if args[:1] and args[0] in REPORT_ACTIONS:
+        # `report totals --by month`, `report dashboard` : actions du mode commande (sortie JSON).
+        return command_mode("report")(args)
+
+    parser = argparse.ArgumentParser(prog="main.py report")
+    parser.add_argument("group_by", choices=ReportController.GROUPINGS, help="regroupement des totaux")
+    parser.add_argument("--live", action="store_true", help="agréger la table des contrats plutôt que la synthèse")
+    parser.add_argument("--rebuild", action="store_true", help="recalculer la synthèse avant lecture")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope():
+        user = authenticated_user()
+        if user:
+            controller = ReportController(user)
+            if options.rebuild:
+                controller.rebuild_summaries()
+            controller.contrat_totals(options.group_by, options.live)
+
+
+def command_user():
+    """Met la base à niveau (messages sur stderr) et retourne l'utilisateur connecté pour le mode commande."""
+    import contextlib
+
+    with contextlib.redirect_stdout(sys.stderr):
+        initialize_database()
+        with session_scope():
+            return authenticated_user()
+
+
+def command_mode(entity):
+    """Commandes `<entité> <action> [options]` (ex. `client list --mine`) : mode non interactif, sortie JSON."""
+
+    def run(args):
+        from controller.command_controller import CommandController
+
+        user = command_user()
+        if not user or not CommandController(user).execute([entity, *args]):
+            sys.exit(1)
+
+    return run
+
+
+def batch(args):
+    """Commande `batch [fichier]` : exécute une commande par ligne (stdin par défaut), une ligne JSON par résultat."""
+    from controller.command_controller import CommandController
+
+    user = command_user()
+    if not user:
+        sys.exit(1)
+    controller = CommandController(user)
+    if args:
+        with open(args[0], encoding="utf-8") as file:
+            failures = controller.run_batch(file)
+    else:
+        failures = controller.run_batch(sys.stdin)
+    if failures:
+        sys.exit(1)
+
+
+def serve(args):
+    """Commande `serve [--socket CHEMIN]` : serveur local gardant moteur, permissions et contrôleurs chargés."""
+    import argparse
+    import signal
+    from utils.config import DAEMON_SOCKET
+    from utils.daemon import CRMServer
+
+    parser = argparse.ArgumentParser(prog="main.py serve")
+    parser.add_argument("--socket", default=DAEMON_SOCKET, help="chemin du socket Unix")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    # SIGTERM (arrêt du service) ferme le serveur comme Ctrl+C, ce qui supprime le socket.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with CRMServer(options.socket) as server:
+        print(f"🚀 Serveur CRM à l'écoute sur {options.socket} (Ctrl+C pour arrêter)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            print("\n🛑 Serveur arrêté.")
+
+
+def populate(args):
+    """Commande `populate [--users N] [--clients N] [--contrats N] [--events N]` : données synthétiques de charge."""
+    import argparse
+    from utils.populate_database import generate_synthetic_data
+
+    parser = argparse.ArgumentParser(prog="main.py populate")
+    parser.add_argument("--users", type=int, default=100, help="utilisateurs (50%% commerciaux, 35%% supports)")
+    parser.add_argument("--clients", type=int, default=1_000)
+    parser.add_argument("--contrats", type=int, default=5_000)
+    parser.add_argument("--events", type=int, default=2_000, help="au plus un événement par contrat signé")
+    parser.add_argument("--seed", type=int, default=0, help="graine du générateur (jeu de données reproductible)")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="lignes insérées par lot")
+    options = parser.parse_args(args)
+
+    initialize_database()
+    with session_scope() as session:
+        counts = generate_synthetic_data(
+            session,
+            options.users,
+            options.clients,
+            options.contrats,
+            options.events,
+            options.seed,
+            options.batch_size,
+        )
+    print("✅ Données générées : " + ", ".join(f"{count} {table}" for table, count in counts.items()))
+
+
+def calibrate_hash(args):
+    """Commande `calibrate-hash [--target-ms N]` : propose des paramètres Argon2 pour cette machine."""
+    import argparse
+    from utils.config import ARGON2_MEMORY_COST, ARGON2_PARALLELISM
+    from utils.password_hashing import calibrate
+
+    parser = argparse.ArgumentParser(prog="main.py calibrate-hash")
+    parser.add_argument("--target-ms", type=float, default=250, help="latence visée pour un hachage")
+    parser.add_argument("--memory-cost", type=int, default=ARGON2_MEMORY_COST, help="mémoire par hachage en KiB")
+    parser.add_argument("--parallelism", type=int, default=ARGON2_PARALLELISM, help="nombre de threads")
+    options = parser.parse_args(args)
+
+    time_cost, memory_cost, parallelism, duration = calibrate(
+        options.target_ms, options.memory_cost, options.parallelism
+    )
+    print(f"⏱️ Hachage mesuré : {duration:.0f} ms. Paramètres à reporter dans le fichier .env :")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={parallelism}")
+    if duration < options.target_ms:
+        print("⚠️ Cible non atteinte avec le nombre maximal de passes : augmentez --memory-cost.")
+
+
+COMMANDS = {
+    "login": login,
+    "logout": logout,
+    "init-db": init_db,
+    "clients import": import_clients,
+    "clients search": search_clients,
+    "users import": import_users,
+    "events validate": validate_events,
+    "events assign": assign_events,
+    "events calendar": calendar_events,
+    "events ics": export_ics,
+    "export": export,
+    "dashboard": dashboard,
+    "report": report,
+    "calibrate-hash": calibrate_hash,
+    "populate": populate,
+    "user": command_mode("user"),
+    "client": command_mode("client"),
+    "contrat": command_mode("contrat"),
+    "event": command_mode("event"),
+    "batch": batch,
+    "serve": serve,
+}
+
+
+def run_menu():
+    """Boucle du menu interactif (nécessite un utilisateur connecté)."""
+    from prompt_toolkit import prompt
+    from rich.console import Console
+    from controller.auth_controller import AuthController
+    from controller.user_controller import UserController
+    from controller.contrat_controller import ContratController
+    from controller.event_controller import EventController
+    from controller.client_controller import ClientController
+    from view.menu_view import show_menu, show_user_menu, show_client_menu, show_contrat_menu, show_event_menu
+
+    console = Console()
+    initialize_database()
+    auth_controller = AuthController()
+
+    with session_scope():
+        user = authenticated_user()
     if not user:
-        console.print("\n🔐 Connectez-vous d'abord avec `python main.py login`")
         return
 
     controllers = {
@@ -57,7 +424,8 @@ def main():
     }
 
     while True:
-        show_menu(user)
+        with session_scope():
+            show_menu(user)
         choix = prompt("👉 Choisissez une option : ").strip().lower()
 
         if choix == "1":
@@ -85,15 +453,33 @@ def main():
             console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
 
 
+def main():
+    args = sys.argv[1:]
+    if "--profile" in args:
+        # Chaque action affiche ses requêtes SQL : nombre, durée totale, plus lentes et lignes lues.
+        args.remove("--profile")
+        config.PROFILE_ACTIONS = True
+
+    for length in (2, 1):
+        command = " ".join(args[:length])
+        if command in COMMANDS:
+            COMMANDS[command](args[length:])
+            return
+
+    run_menu()
+
+
 if __name__ == "__main__":
     try:
-        sentry_sdk.set_context("CLI Command", {"command": " ".join(sys.argv) if sys.argv else "Menu principal"})
-
-        initialize_database()
+        init_sentry(" ".join(arg for arg in sys.argv[1:] if arg != "--profile"))
         main()
     except KeyboardInterrupt:
         sys.exit(0)
 
     except Exception as e:
+        import sentry_sdk
+
         sentry_sdk.capture_exception(e)
-        console.print(f"[bold red]🚨 Une erreur s'est produite : {e}[/bold red]")
+        print(f"🚨 Une erreur s'est produite : {e}")
+    finally:
+        close_sessions()
@@ -3,3 +3,5 @@ from .event import *  # noqa F403
 from .role import *  # noqa F403
 from .user import *  # noqa F403
 from .contrat import *  # noqa F403
+from .contrat_summary import *  # noqa F403
+from .schema_version import *  # noqa F403
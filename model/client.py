@@ -1,7 +1,24 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, case, column, event, literal_column, select, table
 from sqlalchemy.orm import relationship
 import datetime
 from utils.config import Base
+from utils.search import (
+    MIN_TERM_LENGTH,
+    SEARCH_TABLE,
+    client_search_key,
+    create_search_index,
+    drop_search_index,
+    match_expression,
+    search_terms,
+)
+
+
+def _search_key_default(context):
+    """Clé de recherche calculée à l'insertion, y compris pour les INSERT en masse (import, jeu de test)."""
+    parameters = context.get_current_parameters()
+    return client_search_key(
+        parameters.get("name"), parameters.get("email"), parameters.get("company"), parameters.get("phone")
+    )
 
 
 class Client(Base):
@@ -13,7 +30,9 @@ class Client(Base):
     company = Column(String(100))
     date_created = Column(DateTime, default=datetime.datetime.now)
     date_updated = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
-    commercial_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    commercial_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), index=True)
+    # Nom, email, entreprise et téléphone normalisés (minuscules, sans accents), indexés en plein texte.
+    search_key = Column(String(400), nullable=False, default=_search_key_default, server_default="")
     commercial = relationship("User", back_populates="clients")
     contrats = relationship("Contrat", back_populates="client", passive_deletes="all")
 
@@ -26,5 +45,50 @@ class Client(Base):
         self.date_created = datetime.datetime.now()
         self.date_updated = datetime.datetime.now()
 
+    @classmethod
+    def search_statement(cls, dialect_name, query):
+        """Requête classée des clients dont la clé contient chaque terme de `query` ; None sans terme.
+
+        Les termes assez longs passent par l'index plein texte (FTS5 ou FULLTEXT), les plus courts par un
+        LIKE sur les seules lignes retenues. Classement : nom commençant par le premier terme, pertinence
+        de l'index, puis nom.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return None
+        min_length = MIN_TERM_LENGTH.get(dialect_name)
+        indexed = [term for term in terms if min_length and len(term) >= min_length]
+        statement = select(cls).where(
+            *(cls.search_key.contains(term, autoescape=True) for term in terms if term not in indexed)
+        )
+        ranking = [case((cls.search_key.startswith(terms[0], autoescape=True), 0), else_=1)]
+        if indexed and dialect_name == "mysql":
+            score = cls.search_key.match(match_expression(dialect_name, indexed))
+            statement = statement.where(score)
+            ranking.append(score.desc())
+        elif indexed:
+            search = table(SEARCH_TABLE, column("rowid"), column("rank"))
+            statement = statement.join(search, search.c.rowid == cls.id).where(
+                literal_column(SEARCH_TABLE).op("MATCH")(match_expression(dialect_name, indexed))
+            )
+            ranking.append(search.c.rank)
+        return statement.order_by(*ranking, cls.name, cls.id)
+
     def __repr__(self):
         return f"<Client(id={self.id}, name={self.name}, email={self.email}, company={self.company}, commercial_id={self.commercial_id})>"
+
+
+@event.listens_for(Client, "before_update")
+def refresh_search_key(mapper, connection, target):
+    """Recalcule la clé de recherche d'un client modifié par l'ORM."""
+    target.search_key = client_search_key(target.name, target.email, target.company, target.phone)
+
+
+@event.listens_for(Client.__table__, "after_create")
+def create_client_search(target, connection, **kw):
+    create_search_index(connection)
+
+
+@event.listens_for(Client.__table__, "before_drop")
+def drop_client_search(target, connection, **kw):
+    drop_search_index(connection)
@@ -1,18 +1,26 @@
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, Index, text
 from sqlalchemy.orm import relationship, validates
 from datetime import datetime
+from model.money import Money, to_money
 from utils.config import Base
 
 
 class Contrat(Base):
     __tablename__ = "contrats"
+    __table_args__ = (
+        # filter_contrats "non signés" (préfixe status) et "non signés avec reste à payer".
+        Index("ix_contrats_status_remaining_amount", "status", "remaining_amount"),
+        # filter_contrats "paiement en attente" : index partiel sous SQLite, complet sous MySQL.
+        Index("ix_contrats_unpaid", "remaining_amount", sqlite_where=text("remaining_amount > 0")),
+    )
 
     id = Column(Integer, primary_key=True)
-    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"))
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), index=True)
     client = relationship("Client", back_populates="contrats")
     event = relationship("Event", back_populates="contrat", uselist=False)
-    total_amount = Column(Float, nullable=False)
-    remaining_amount = Column(Float, nullable=False)
+    # Montants en centimes entiers (Decimal côté Python) : totaux exacts.
+    total_amount = Column(Money, nullable=False)
+    remaining_amount = Column(Money, nullable=False)
     date_created = Column(DateTime, default=datetime.now)
     status = Column(Boolean, default=False)
 
@@ -36,7 +44,8 @@ class Contrat(Base):
 
     @validates("remaining_amount", "total_amount")
     def validate_amounts(self, key, value):
-        """Empêche les montants négatifs et le montant restant supérieur au total."""
+        """Arrondit au centime, empêche les montants négatifs et le montant restant supérieur au total."""
+        value = to_money(value)
         if value < 0:
             raise ValueError("Le montant ne peut pas être négatif.")
         if key == "remaining_amount" and value > self.total_amount:
@@ -0,0 +1,152 @@
+from datetime import datetime
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, event, extract, func
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from model.contrat import Contrat
+from model.money import Money
+from utils.config import Base
+
+# Seuls ces noms sont repris par `from model import *` (pas Session, event, insert... de SQLAlchemy).
+__all__ = ["ContratSummary", "rebuild_contrat_summaries", "update_contrat_summaries"]
+
+
+class ContratSummary(Base):
+    """Synthèse matérialisée des contrats par client, mois de création et statut de signature.
+
+    Tenue à jour à chaque flush (création, modification, suppression de contrats par l'ORM) par des
+    additions atomiques en base ; les insertions en masse hors ORM doivent être suivies de
+    rebuild_contrat_summaries.
+    """
+
+    __tablename__ = "contrat_summaries"
+
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    year = Column(Integer, primary_key=True, autoincrement=False)
+    month = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(Boolean, primary_key=True)
+    contrat_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Money, nullable=False, default=0)
+    remaining_amount = Column(Money, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<ContratSummary(client_id={self.client_id}, month={self.year}-{self.month:02d}, status={self.status}, "
+            f"contrat_count={self.contrat_count}, total_amount={self.total_amount}, "
+            f"remaining_amount={self.remaining_amount})>"
+        )
+
+
+def rebuild_contrat_summaries(session: Session):
+    """Recalcule toute la synthèse en une requête INSERT ... SELECT ... GROUP BY ; retourne le nombre de lignes."""
+    year, month = extract("year", Contrat.date_created), extract("month", Contrat.date_created)
+    grouped = (
+        select(
+            Contrat.client_id,
+            year,
+            month,
+            Contrat.status,
+            func.count(Contrat.id),
+            func.sum(Contrat.total_amount),
+            func.sum(Contrat.remaining_amount),
+        )
+        .where(Contrat.client_id.is_not(None), Contrat.date_created.is_not(None))
+        .group_by(Contrat.client_id, year, month, Contrat.status)
+    )
+    columns = ["client_id", "year", "month", "status", "contrat_count", "total_amount", "remaining_amount"]
+    connection = session.connection()
+    connection.execute(delete(ContratSummary))
+    connection.execute(insert(ContratSummary).from_select(columns, grouped))
+    session.commit()
+    return session.query(ContratSummary).count()
+
+
+def _add_delta(deltas, values, sign):
+    """Ajoute (sign=1) ou retire (sign=-1) un contrat de l'écart de sa ligne de synthèse."""
+    client_id, date_created, status, total_amount, remaining_amount = values
+    if client_id is None or date_created is None:
+        return
+    delta = deltas.setdefault((client_id, date_created.year, date_created.month, bool(status)), [0, 0, 0])
+    delta[0] += sign
+    delta[1] += sign * total_amount
+    delta[2] += sign * remaining_amount
+
+
+SUMMARY_FIELDS = ("client_id", "date_created", "status", "total_amount", "remaining_amount")
+
+
+@event.listens_for(Session, "before_flush")
+def update_contrat_summaries(session, flush_context, instances):
+    """Reporte sur la synthèse l'écart apporté par les contrats créés, modifiés ou supprimés."""
+    deltas = {}
+    with session.no_autoflush:
+        for contrat in session.new:
+            if isinstance(contrat, Contrat):
+                if contrat.date_created is None:
+                    contrat.date_created = datetime.now()
+                _add_delta(deltas, [getattr(contrat, name) for name in SUMMARY_FIELDS], 1)
+        changed = [
+            contrat
+            for contrat in session.dirty
+            if isinstance(contrat, Contrat) and contrat not in session.deleted and session.is_modified(contrat)
+        ]
+        deleted = [contrat for contrat in session.deleted if isinstance(contrat, Contrat)]
+        if changed or deleted:
+            # Valeurs enregistrées relues en une requête : l'historique ORM ne les connaît pas après expiration.
+            stored = select(*(getattr(Contrat, name) for name in SUMMARY_FIELDS)).where(
+                Contrat.id.in_([contrat.id for contrat in changed + deleted])
+            )
+            for values in session.execute(stored):
+                _add_delta(deltas, values, -1)
+        for contrat in changed:
+            _add_delta(deltas, [getattr(contrat, name) for name in SUMMARY_FIELDS], 1)
+
+        connection = session.connection()
+        for key, (count, total_amount, remaining_amount) in deltas.items():
+            if count or total_amount or remaining_amount:
+                _apply_delta(connection, key, count, total_amount, remaining_amount)
+
+
+UPSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert, "mysql": mysql_insert}
+DELTA_COLUMNS = ("contrat_count", "total_amount", "remaining_amount")
+
+
+def _apply_delta(connection, key, count, total_amount, remaining_amount):
+    """Ajoute un écart à une ligne de synthèse en une requête atomique (INSERT ... ON CONFLICT / ON DUPLICATE KEY).
+
+    L'addition est faite par la base (`col = col + écart`) : deux écritures concurrentes sur la même ligne
+    ne perdent pas de mise à jour et la première insertion d'une clé ne peut pas échouer sur la clé primaire.
+    """
+    client_id, year, month, status = key
+    statement = UPSERTS[connection.dialect.name](ContratSummary).values(
+        client_id=client_id,
+        year=year,
+        month=month,
+        status=status,
+        contrat_count=count,
+        total_amount=total_amount,
+        remaining_amount=remaining_amount,
+    )
+    table = ContratSummary.__table__
+    if connection.dialect.name == "mysql":
+        statement = statement.on_duplicate_key_update(
+            {name: table.c[name] + statement.inserted[name] for name in DELTA_COLUMNS}
+        )
+    else:
+        statement = statement.on_conflict_do_update(
+            index_elements=[column.name for column in table.primary_key.columns],
+            set_={name: table.c[name] + statement.excluded[name] for name in DELTA_COLUMNS},
+        )
+    connection.execute(statement)
+    if count < 0:
+        connection.execute(
+            delete(ContratSummary).where(
+                ContratSummary.client_id == client_id,
+                ContratSummary.year == year,
+                ContratSummary.month == month,
+                ContratSummary.status == status,
+                ContratSummary.contrat_count <= 0,
+            )
+        )
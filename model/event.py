@@ -1,16 +1,23 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import relationship, validates
 from utils.config import Base
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # filter_event (support_id seul) et conflits de planning (événements d'un support avant la fin d'un créneau).
+        Index("ix_events_support_start", "support_id", "start_date"),
+        # Fenêtres de dates (événements en cours ou à venir) et filtre par lieu trié par date.
+        Index("ix_events_end_date", "end_date"),
+        Index("ix_events_location_start", "location", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
-    contrat_id = Column(Integer, ForeignKey("contrats.id", ondelete="SET NULL"))
+    contrat_id = Column(Integer, ForeignKey("contrats.id", ondelete="SET NULL"), index=True)
     contrat = relationship("Contrat", back_populates="event")
-    start_date = Column(DateTime, nullable=False)
+    start_date = Column(DateTime, nullable=False, index=True)
     end_date = Column(DateTime, nullable=False)
     support_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
     support = relationship("User", back_populates="events")
@@ -43,6 +50,18 @@ class Event(Base):
             raise ValueError("Le nombre de participants ne peut pas être négatif.")
         return value
 
+    @classmethod
+    def window_criteria(cls, start_date=None, end_date=None, location=None):
+        """Critères des événements qui chevauchent [start_date, end_date) et/ou ont lieu à `location`."""
+        criteria = []
+        if start_date is not None:
+            criteria.append(cls.end_date > start_date)
+        if end_date is not None:
+            criteria.append(cls.start_date < end_date)
+        if location:
+            criteria.append(cls.location == location)
+        return criteria
+
     def __repr__(self):
         return (
             f"<Event(id={self.id}, name={self.name}, start_date={self.start_date}, "
@@ -0,0 +1,35 @@
+from decimal import ROUND_HALF_UP, Decimal
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+
+def to_money(value):
+    """Convertit un montant (int, float, texte ou Decimal) en Decimal arrondi au centime."""
+    if isinstance(value, float):
+        # repr() redonne le nombre saisi (12.34 et non 12.3399999...).
+        value = repr(value)
+    return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class Money(TypeDecorator):
+    """Montant en euros stocké en centimes entiers et exposé en Decimal à deux décimales.
+
+    Les sommes calculées par la base (SUM, GROUP BY) portent sur des entiers : elles sont exactes et
+    relues en Decimal sans conversion ligne à ligne.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(to_money(value).scaleb(2))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # int() : SUM renvoie un DECIMAL sous MySQL, et les anciennes colonnes REAL de SQLite des flottants.
+        return Decimal(int(value)).scaleb(-2)
@@ -1,18 +1,13 @@
-from sqlalchemy import Column, Integer, String
+from types import MappingProxyType
+from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 from utils.config import Base
 
-
-class Role(Base):
-    __tablename__ = "roles"
-    id = Column(Integer, primary_key=True)
-    name = Column(String(100), unique=True)
-    users = relationship("User", back_populates="role")
-
-    def get_permissions(self):
-        """Retourne l'ensemble des permissions pour un rôle donné."""
-        role_permissions = {
-            "gestion": {
+# Permissions compilées une seule fois au chargement du module (lecture seule).
+ROLE_PERMISSIONS = MappingProxyType(
+    {
+        "gestion": frozenset(
+            {
                 "create_user",
                 "read_user",
                 "update_user",
@@ -21,13 +16,14 @@ class Role(Base):
                 "read_contrat",
                 "create_contrat",
                 "update_contrat",
-                "read_contrat",
                 "filter_contrat",
                 "read_event",
                 "filter_event",
                 "update_event",
-            },
-            "commercial": {
+            }
+        ),
+        "commercial": frozenset(
+            {
                 "read_user",
                 "create_client",
                 "read_client",
@@ -36,22 +32,73 @@ class Role(Base):
                 "create_contrat",
                 "read_contrat",
                 "update_contrat",
-                "read_contrat",
                 "filter_contrat",
                 "create_event",
                 "read_event",
-            },
-            "support": {
+            }
+        ),
+        "support": frozenset(
+            {
                 "read_user",
                 "read_client",
                 "read_contrat",
                 "read_event",
                 "filter_event",
                 "update_event",
-            },
-        }
-        return role_permissions.get(self.name, set())
+            }
+        ),
+    }
+)
+NO_PERMISSIONS = frozenset()
+
+_permissions = ROLE_PERMISSIONS
+
+
+class Role(Base):
+    __tablename__ = "roles"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), unique=True)
+    users = relationship("User", back_populates="role")
+    permissions = relationship("RolePermission", back_populates="role", passive_deletes=True)
+
+    def get_permissions(self):
+        """Retourne l'ensemble des permissions pour un rôle donné."""
+        return _permissions.get(self.name, NO_PERMISSIONS)
 
     def has_permission(self, action: str) -> bool:
         """Vérifie si le rôle a une permission spécifique."""
-        return action in self.get_permissions()
+        return action in _permissions.get(self.name, NO_PERMISSIONS)
+
+
+class RolePermission(Base):
+    """Permission accordée à un rôle en base, prioritaire sur la table compilée dans le code."""
+
+    __tablename__ = "role_permissions"
+    role_id = Column(Integer, ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
+    action = Column(String(50), primary_key=True)
+    role = relationship("Role", back_populates="permissions")
+
+    def __repr__(self):
+        return f"<RolePermission(role_id={self.role_id}, action={self.action})>"
+
+
+def load_permissions(session):
+    """Charge une fois les permissions de la table role_permissions et les met en cache.
+
+    Les rôles présents en base remplacent ceux du code ; les autres gardent leurs permissions par défaut.
+    """
+    global _permissions
+    loaded = {}
+    for role_name, action in session.query(Role.name, RolePermission.action).join(RolePermission.role):
+        loaded.setdefault(role_name, set()).add(action)
+
+    _permissions = MappingProxyType(
+        {**ROLE_PERMISSIONS, **{name: frozenset(actions) for name, actions in loaded.items()}}
+    )
+    return _permissions
+
+
+def reset_permissions():
+    """Revient aux permissions compilées dans le code."""
+    global _permissions
+    _permissions = ROLE_PERMISSIONS
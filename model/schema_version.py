@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Integer
+import datetime
+from utils.config import Base
+
+
+class SchemaVersion(Base):
+    """Ligne unique (id=1) mémorisant la version du schéma et des données initiales."""
+
+    __tablename__ = "schema_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
+    date_updated = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
+
+    def __repr__(self):
+        return f"<SchemaVersion(version={self.version}, date_updated={self.date_updated})>"
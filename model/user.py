@@ -1,18 +1,20 @@
-from utils.config import Base
+from utils.config import ARGON2_MEMORY_COST, ARGON2_PARALLELISM, ARGON2_TIME_COST, Base
+from utils.password_hashing import build_hasher, hash_passwords
 from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
 
-ph = PasswordHasher()
+ph = build_hasher(ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM)
 
 
 class User(Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
-    email = Column(String(100))
+    email = Column(String(100), index=True)
     password = Column(String(255), nullable=False)
+    # Incrémentée à chaque modification du compte : invalide les tokens et caches de session existants.
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     role_id = Column(Integer, ForeignKey("roles.id", ondelete="SET NULL"))
     role = relationship("Role", back_populates="users")
     clients = relationship(
@@ -20,7 +22,8 @@ class User(Base):
         back_populates="commercial",
         passive_deletes="all",
     )
-    events = relationship("Event", back_populates="support", passive_deletes=True)
+    # Ordre de création explicite : l'index (support_id, start_date) trierait sinon par date.
+    events = relationship("Event", back_populates="support", passive_deletes=True, order_by="Event.id")
 
     def __init__(self, name, email, password, role_id):
         self.name = name
@@ -31,11 +34,23 @@ class User(Base):
     def set_password(self, password):
         return ph.hash(password)
 
+    @staticmethod
+    def hash_passwords(passwords, executor=None):
+        """Hache plusieurs mots de passe avec les paramètres configurés, en parallèle si un exécuteur est fourni."""
+        return hash_passwords(passwords, ph, executor)
+
     def check_password(self, password):
         try:
             return ph.verify(self.password, password)
         except VerifyMismatchError:
             return False
 
+    def needs_rehash(self):
+        """Indique si le hash a été calculé avec d'autres paramètres Argon2 que ceux configurés."""
+        try:
+            return ph.check_needs_rehash(self.password)
+        except InvalidHashError:
+            return True
+
     def __repr__(self):
         return f"<User(id={self.id}, name={self.name}, email={self.email}, role_id={self.role_id})>"
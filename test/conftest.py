@@ -1,9 +1,11 @@
 import pytest
+import sqlite3
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from model import Role, User, Client, Event, Contrat  # noqa: F401
 from controller import UserController, ClientController, ContratController, EventController
-from utils.config import Base
+from utils.config import Base, dispose_async_engine, profile_queries
 from datetime import datetime
 
 
@@ -26,6 +28,21 @@ def session():
         Base.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def assert_max_queries():
+    """Fixture qui vérifie le nombre maximal de requêtes SQL exécutées dans un bloc `with`."""
+
+    @contextmanager
+    def _assert_max_queries(max_count):
+        with profile_queries(engine) as profile:
+            yield profile.statements
+        assert profile.count <= max_count, f"{profile.count} requêtes exécutées (maximum {max_count}) :\n" + "\n".join(
+            profile.statements
+        )
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def mock_session(monkeypatch, session):
     """Fixture qui remplace la session globale par la session de test."""
@@ -33,6 +50,30 @@ def mock_session(monkeypatch, session):
     return session
 
 
+@pytest.fixture
+async def async_database(session, monkeypatch, tmp_path):
+    """Fixture qui branche le moteur asynchrone sur une copie fichier de la base de test.
+
+    La base en mémoire n'est pas partagée entre connexions : appeler la fonction retournée une fois les
+    données créées pour les copier dans le fichier lu par les requêtes asynchrones.
+    """
+    path = tmp_path / "async.db"
+    monkeypatch.setattr("utils.config.ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr("utils.config._async_engine", None)
+
+    def snapshot():
+        session.commit()
+        connection = engine.raw_connection()
+        try:
+            with sqlite3.connect(path) as target:
+                connection.driver_connection.backup(target)
+        finally:
+            connection.close()
+
+    yield snapshot
+    await dispose_async_engine()
+
+
 @pytest.fixture
 def role_gestion(mock_session):
     """Fixture pour un rôle 'gestion'."""
@@ -0,0 +1,163 @@
+from decimal import Decimal
+from sqlalchemy import inspect, text
+from model.role import Role
+from model.user import User
+from model.schema_version import SchemaVersion
+from model.contrat import Contrat
+from model.contrat_summary import ContratSummary
+from utils.config import Base
+from utils.migrations import SCHEMA_VERSION, get_schema_version, upgrade_database
+
+
+def test_get_schema_version_missing_table(mock_session):
+    """Vérifie qu'une base sans table de version est considérée comme non initialisée."""
+
+    SchemaVersion.__table__.drop(mock_session.connection())
+    mock_session.commit()
+
+    assert get_schema_version(mock_session) == 0
+
+
+def test_upgrade_database_fresh(mock_session):
+    """Vérifie qu'une base vide reçoit le schéma, les rôles, l'admin et la version courante."""
+
+    Base.metadata.drop_all(mock_session.connection())
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+    assert get_schema_version(mock_session) == SCHEMA_VERSION
+    assert {role.name for role in mock_session.query(Role).all()} == {"commercial", "gestion", "support"}
+    assert mock_session.query(User).filter_by(email="admin@admin.com").count() == 1
+
+
+def test_upgrade_database_up_to_date(mock_session, assert_max_queries, capsys):
+    """Vérifie qu'une base à jour ne déclenche qu'une seule requête et aucun peuplement."""
+
+    upgrade_database(mock_session)
+    capsys.readouterr()
+    mock_session.expunge_all()
+
+    with assert_max_queries(1):
+        assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    assert "Migration" not in capsys.readouterr().out
+    assert mock_session.query(Role).count() == 3, "Les rôles ne doivent pas être recréés."
+
+
+def test_upgrade_database_adds_indexes(mock_session):
+    """Vérifie qu'une base en version 1 sans index reçoit les index des filtres."""
+
+    upgrade_database(mock_session)
+    connection = mock_session.connection()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.drop(connection)
+    mock_session.merge(SchemaVersion(id=1, version=1))
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    inspector = inspect(mock_session.connection())
+    assert "ix_contrats_status_remaining_amount" in {index["name"] for index in inspector.get_indexes("contrats")}
+    assert "ix_events_support_start" in {index["name"] for index in inspector.get_indexes("events")}
+
+
+def test_upgrade_database_adds_token_version(mock_session):
+    """Vérifie qu'une base en version 2 reçoit la colonne token_version sans perdre ses utilisateurs."""
+
+    upgrade_database(mock_session)
+    mock_session.execute(text("ALTER TABLE users DROP COLUMN token_version"))
+    mock_session.merge(SchemaVersion(id=1, version=2))
+    mock_session.commit()
+    users = mock_session.execute(text("SELECT COUNT(*) FROM users")).scalar()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    columns = {column["name"] for column in inspect(mock_session.connection()).get_columns("users")}
+    assert "token_version" in columns
+    assert mock_session.execute(text("SELECT COUNT(*) FROM users WHERE token_version = 0")).scalar() == users
+
+
+def test_upgrade_database_builds_contrat_summaries(mock_session, sample_contrat):
+    """Vérifie qu'une base en version 3 reçoit la synthèse des contrats calculée à partir des contrats existants."""
+
+    upgrade_database(mock_session)
+    ContratSummary.__table__.drop(mock_session.connection())
+    mock_session.execute(text("UPDATE contrats SET total_amount = 10000, remaining_amount = 0"))
+    mock_session.merge(SchemaVersion(id=1, version=3))
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    [summary] = mock_session.query(ContratSummary).all()
+    assert (summary.client_id, summary.contrat_count, summary.total_amount) == (sample_contrat.client_id, 1, 10000)
+
+
+def test_upgrade_database_converts_amounts_to_cents(mock_session, sample_contrat):
+    """Vérifie qu'une base en version 4 (montants flottants en euros) passe en centimes entiers exacts."""
+
+    upgrade_database(mock_session)
+    mock_session.execute(text("UPDATE contrats SET total_amount = 1234567.89, remaining_amount = 0.1"))
+    mock_session.merge(SchemaVersion(id=1, version=4))
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    mock_session.expire_all()
+    contrat = mock_session.get(Contrat, sample_contrat.id)
+    assert (contrat.total_amount, contrat.remaining_amount) == (Decimal("1234567.89"), Decimal("0.10"))
+    assert mock_session.execute(text("SELECT total_amount FROM contrats")).scalar() == 123456789, "Au-delà de 2^24."
+    assert mock_session.query(ContratSummary).one().total_amount == Decimal("1234567.89")
+
+
+def test_upgrade_database_replaces_support_index(mock_session):
+    """Vérifie qu'une base en version 5 remplace l'index events.support_id par (support_id, start_date)."""
+
+    upgrade_database(mock_session)
+    connection = mock_session.connection()
+    connection.execute(text("DROP INDEX ix_events_support_start"))
+    connection.execute(text("CREATE INDEX ix_events_support_id ON events (support_id)"))
+    mock_session.merge(SchemaVersion(id=1, version=5))
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    indexes = {index["name"] for index in inspect(mock_session.connection()).get_indexes("events")}
+    assert "ix_events_support_start" in indexes and "ix_events_support_id" not in indexes
+
+
+def test_upgrade_database_builds_client_search(mock_session, sample_client):
+    """Vérifie qu'une base en version 7 reçoit clients.search_key, calculée, et l'index FTS5 des clients."""
+
+    upgrade_database(mock_session)
+    connection = mock_session.connection()
+    for statement in ("DROP TABLE clients_search", "DROP TRIGGER clients_search_update"):
+        connection.execute(text(statement))
+    connection.execute(text("UPDATE clients SET search_key = ''"))
+    mock_session.merge(SchemaVersion(id=1, version=7))
+    mock_session.commit()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    assert (
+        mock_session.execute(text("SELECT search_key FROM clients")).scalar()
+        == "client test client@test.com test corp 0101010101 0101010101"
+    )
+    found = mock_session.execute(text("SELECT rowid FROM clients_search WHERE clients_search MATCH '\"test.com\"'"))
+    assert found.scalars().all() == [sample_client.id]
+
+
+def test_upgrade_database_legacy_seeds_admin(mock_session, capsys):
+    """Vérifie qu'une base antérieure au suivi des versions (sans users.token_version) reçoit l'administrateur."""
+
+    upgrade_database(mock_session)
+    mock_session.execute(text("DELETE FROM users"))
+    mock_session.execute(text("ALTER TABLE users DROP COLUMN token_version"))
+    SchemaVersion.__table__.drop(mock_session.connection())
+    mock_session.commit()
+    capsys.readouterr()
+
+    assert upgrade_database(mock_session) == SCHEMA_VERSION
+
+    assert "❌" not in capsys.readouterr().out
+    assert mock_session.query(User).filter_by(email="admin@admin.com").one().token_version == 0
@@ -1,6 +1,12 @@
+import pytest
+from sqlalchemy import func, select
+from model.client import Client
+from model.contrat import Contrat
+from model.contrat_summary import ContratSummary
+from model.event import Event
 from model.role import Role
 from model.user import User
-from utils.populate_database import seed_roles, seed_admin_user
+from utils.populate_database import generate_synthetic_data, seed_roles, seed_admin_user
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -82,3 +88,70 @@ def test_seed_roles_sqlalchemy_error(mocker, capsys):
     mock_session.rollback.assert_called_once()
     captured = capsys.readouterr()
     assert "Erreur lors de l'insertion des rôles" in captured.out
+
+
+def _dataset(session):
+    """Contenu complet des tables générées (hors hash de mot de passe, salé aléatoirement)."""
+    return [
+        session.execute(select(*(c for c in table.c if c.name != "password")).order_by(table.c.id)).all()
+        for table in (User.__table__, Client.__table__, Contrat.__table__, Event.__table__)
+    ]
+
+
+def test_generate_synthetic_data(mock_session):
+    """Vérifie les volumes, les relations et les distributions du jeu de données synthétique."""
+    progress = []
+
+    counts = generate_synthetic_data(
+        mock_session,
+        users=20,
+        clients=100,
+        contrats=400,
+        events=150,
+        batch_size=64,
+        progress=lambda *a: progress.append(a),
+    )
+
+    assert counts == {"users": 20, "clients": 100, "contrats": 400, "events": 150}
+    assert mock_session.query(User).count() == 20
+    assert mock_session.query(User).join(Role).filter(Role.name == "commercial").count() == 10
+    assert mock_session.query(Event).count() == 150
+    assert mock_session.query(Event.contrat_id).distinct().count() == 150, "Un seul événement par contrat."
+    assert mock_session.query(Event).join(Contrat).filter(Contrat.status.is_(False)).count() == 0, "Contrats signés."
+    assert (
+        mock_session.query(Client).filter(Client.commercial.has(User.role.has(Role.name != "commercial"))).count() == 0
+    )
+    assert mock_session.query(Contrat).filter(Contrat.remaining_amount > Contrat.total_amount).count() == 0
+    assert mock_session.query(Event).filter(Event.end_date <= Event.start_date).count() == 0
+    assert ("contrats", 400, 400) in progress and ("contrats", 64, 400) in progress
+    assert mock_session.query(User).filter_by(email="commercial1@synthetic.test").one().check_password("password")
+    assert mock_session.query(func.sum(ContratSummary.contrat_count)).scalar() == 400, "Synthèse recalculée."
+
+
+def test_generate_synthetic_data_deterministic(mock_session):
+    """Vérifie qu'une même graine produit exactement les mêmes données."""
+    options = {"users": 10, "clients": 30, "contrats": 60, "events": 20, "progress": None}
+    generate_synthetic_data(mock_session, seed=7, **options)
+    first = _dataset(mock_session)
+
+    for table in (Event, Contrat, Client, User):
+        mock_session.query(table).delete()
+    mock_session.commit()
+    generate_synthetic_data(mock_session, seed=7, **options)
+
+    assert _dataset(mock_session) == first
+
+
+def test_generate_synthetic_data_invalid(mock_session):
+    """Vérifie qu'un volume d'événements supérieur aux contrats est refusé."""
+    with pytest.raises(ValueError):
+        generate_synthetic_data(mock_session, users=1, clients=1, contrats=1, events=2, progress=None)
+
+
+def test_generate_synthetic_data_events_capped_to_signed(mock_session):
+    """Vérifie que le nombre d'événements est plafonné au nombre de contrats signés."""
+    counts = generate_synthetic_data(mock_session, users=4, clients=5, contrats=20, events=20, progress=None)
+
+    signed = mock_session.query(Contrat).filter(Contrat.status.is_(True)).count()
+    assert 0 < signed < 20
+    assert counts["events"] == mock_session.query(Event).count() == signed
@@ -0,0 +1,69 @@
+import os
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from controller.report_controller import ReportController
+from model import Role, User
+from utils.config import Base, dispose_async_engine
+from utils.populate_database import generate_synthetic_data
+
+DATASET = {"users": 60, "clients": 20_000, "contrats": 200_000, "events": 50_000}
+MIN_SPEEDUP = 1.3
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    """Base SQLite fichier peuplée par le générateur synthétique (agrégats sur 200 000 contrats)."""
+    path = tmp_path_factory.mktemp("async_reports") / "crm.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    generate_synthetic_data(session, seed=1, progress=None, **DATASET)
+    yield path, session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+async def reports(database, monkeypatch):
+    """ReportController (gestion) dont le moteur asynchrone lit la base synthétique."""
+    path, session = database
+    monkeypatch.setattr("utils.config.ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr("utils.config._async_engine", None)
+    for module in ("report_controller", "contrat_controller", "event_controller"):
+        monkeypatch.setattr(f"controller.{module}.DBSession", lambda: session)
+    user = session.query(User).join(User.role).filter(Role.name == "gestion").first()
+    yield ReportController(user)
+    await dispose_async_engine()
+
+
+async def _timed(reports, concurrent, rounds=3):
+    """Retourne le meilleur temps sur quelques tours et le résultat du tableau de bord."""
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        dashboard = await reports.collect_dashboard(concurrent)
+        durations.append(time.perf_counter() - start)
+    return min(durations), dashboard
+
+
+async def test_dashboard_concurrent_matches_sequential(reports):
+    """Les agrégats en parallèle et en série portent sur les mêmes données."""
+    sequential = await reports.collect_dashboard(concurrent=False)
+
+    assert await reports.collect_dashboard() == sequential
+    assert sum(count for _, count, _, _ in sequential["contrats_par_statut"]) == DATASET["contrats"]
+    assert sum(count for _, count in sequential["events_par_support"]) == DATASET["events"]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="Requêtes SQLite concurrentes : plusieurs cœurs nécessaires.")
+async def test_dashboard_concurrent_speedup(reports):
+    """Compare le temps du tableau de bord en série et avec asyncio.gather (une connexion par requête)."""
+    await reports.collect_dashboard()  # ouverture des connexions du pool hors mesure
+    sequential, _ = await _timed(reports, concurrent=False)
+    concurrent, _ = await _timed(reports, concurrent=True)
+
+    print(f"\n⏱️ série : {sequential * 1000:.0f} ms, asyncio.gather : {concurrent * 1000:.0f} ms")
+    assert sequential >= concurrent * MIN_SPEEDUP, f"Accélération insuffisante : {sequential / concurrent:.2f}x"
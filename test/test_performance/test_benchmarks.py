@@ -0,0 +1,232 @@
+import itertools
+import os
+import random
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import contains_eager, sessionmaker
+from controller.auth_controller import AuthController
+from controller.client_controller import ClientController
+from controller.contrat_controller import ContratController
+from controller.event_controller import EventController
+from controller.report_controller import ReportController
+from controller.user_controller import UserController
+from model import Role, User
+from utils.config import Base, profile_queries
+from utils.populate_database import SYNTHETIC_PASSWORD, generate_synthetic_data
+from utils.scheduling import assign_supports
+
+# Volume du jeu de données (multiplié par BENCHMARK_SCALE, 1 par défaut).
+SCALE = float(os.getenv("BENCHMARK_SCALE", "1"))
+DATASET = {
+    "users": int(60 * SCALE),
+    "clients": int(5_000 * SCALE),
+    "contrats": int(20_000 * SCALE),
+    "events": int(8_000 * SCALE),
+}
+
+# Nombre maximal de requêtes SQL par appel : un dépassement signale un N+1 quel que soit le temps mesuré.
+STATEMENT_BUDGET = {
+    "read_contrat": 1,
+    "filter_contrats": 1,
+    "filter_event": 1,
+    "list_all_client": 1,
+    "search_clients": 1,
+    "list_users": 1,
+    "create_client": 3,
+    "login": 1,
+    "verify_token": 1,
+    "verify_token_cached": 0,
+    "contrat_totals": 1,
+    "validate_schedule": 1,
+    "auto_assign": 3,
+}
+
+# Rendu des listes neutralisé : les benchmarks mesurent les requêtes et le chargement ORM.
+SILENCED_VIEWS = {
+    ContratController: ("display_contrats", "display_info_message", "ask_filter_option"),
+    EventController: (
+        "display_events",
+        "display_info_message",
+        "display_schedule_conflicts",
+        "display_assignment_report",
+    ),
+    ClientController: ("display_clients", "display_info_message", "display_search_results"),
+    UserController: ("display_users",),
+    AuthController: ("display_success_message",),
+    ReportController: ("display_contrat_totals",),
+}
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    """Base SQLite peuplée par le générateur synthétique, partagée par les benchmarks du module."""
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('benchmarks') / 'crm.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    generate_synthetic_data(session, seed=1, progress=None, **DATASET)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("controller.auth_controller.Session", lambda: session)
+        patch.setattr("controller.auth_controller.SECRET_KEY", "benchmark_secret_key")
+        for module in (
+            "client_controller",
+            "contrat_controller",
+            "event_controller",
+            "user_controller",
+            "report_controller",
+        ):
+            patch.setattr(f"controller.{module}.DBSession", lambda: session)
+        patch.setattr(
+            "controller.auth_controller.SESSION_CACHE_FILE", str(tmp_path_factory.mktemp("session") / ".session")
+        )
+        yield engine, session
+
+    session.close()
+    engine.dispose()
+
+
+def user_with_role(session, role_name):
+    """Premier utilisateur synthétique du rôle donné, détaché avec son rôle comme le principal de la CLI."""
+    user = (
+        session.query(User)
+        .join(User.role)
+        .options(contains_eager(User.role))
+        .filter(Role.name == role_name)
+        .order_by(User.id)
+        .first()
+    )
+    session.expunge(user)
+    return user
+
+
+def controller(cls, session, role_name, **view_overrides):
+    """Crée un contrôleur pour un utilisateur synthétique, sans rendu console."""
+    instance = cls(user_with_role(session, role_name)) if cls is not AuthController else cls()
+    for name in SILENCED_VIEWS[cls]:
+        setattr(instance.view, name, view_overrides.get(name, lambda *args, **kwargs: None))
+    return instance
+
+
+def run(benchmark, dataset, name, action, rounds=10):
+    """Mesure `action` avec une carte d'identité vide à chaque tour (comme un nouveau lancement de la CLI).
+
+    Le nombre de requêtes du dernier appel est enregistré dans le rapport et comparé à STATEMENT_BUDGET.
+    """
+    engine, session = dataset
+    counts = []
+
+    def measured():
+        with profile_queries(engine) as profile:
+            result = action()
+        counts.append(profile.count)
+        return result
+
+    result = benchmark.pedantic(measured, setup=session.expunge_all, rounds=rounds, iterations=1)
+    benchmark.extra_info["statements"] = counts[-1]
+    benchmark.extra_info["rows"] = len(result) if isinstance(result, list) else None
+    assert counts[-1] <= STATEMENT_BUDGET[name], f"{name} : {counts[-1]} requêtes (budget {STATEMENT_BUDGET[name]})"
+    return result
+
+
+def test_benchmark_read_contrat(benchmark, dataset):
+    contrats = controller(ContratController, dataset[1], "gestion")
+    result = run(benchmark, dataset, "read_contrat", contrats.read_contrat, rounds=5)
+    assert len(result) == DATASET["contrats"]
+
+
+@pytest.mark.parametrize("filtre", ["non_signes", "paiement_en_attente"])
+def test_benchmark_filter_contrats(benchmark, dataset, filtre):
+    contrats = controller(ContratController, dataset[1], "commercial", ask_filter_option=lambda: filtre)
+    assert run(benchmark, dataset, "filter_contrats", contrats.filter_contrats)
+
+
+@pytest.mark.parametrize("role_name", ["support", "gestion"])
+def test_benchmark_filter_event(benchmark, dataset, role_name):
+    events = controller(EventController, dataset[1], role_name)
+    assert run(benchmark, dataset, "filter_event", events.filter_event)
+
+
+def test_benchmark_list_all_client(benchmark, dataset):
+    clients = controller(ClientController, dataset[1], "commercial")
+    assert len(run(benchmark, dataset, "list_all_client", clients.list_all_client)) == DATASET["clients"]
+
+
+def test_benchmark_search_clients(benchmark, dataset):
+    clients = controller(ClientController, dataset[1], "commercial")
+    result = run(benchmark, dataset, "search_clients", lambda: clients.search_clients("Client42@Synthetic"))
+    assert [client.email for client in result] == ["client42@synthetic.test"]
+
+
+def test_benchmark_list_users(benchmark, dataset):
+    users = controller(UserController, dataset[1], "gestion")
+    run(benchmark, dataset, "list_users", users.list_users)
+
+
+def test_benchmark_create_client(benchmark, dataset):
+    clients = controller(ClientController, dataset[1], "commercial")
+    numbers = itertools.count()
+    clients.view.input_client_info = lambda: (
+        "Client benchmark",
+        f"benchmark{next(numbers)}@synthetic.test",
+        "0102030405",
+        "Benchmark",
+    )
+    assert run(benchmark, dataset, "create_client", clients.create_client) is not None
+
+
+def test_benchmark_login(benchmark, dataset):
+    """Connexion complète : la vérification Argon2 domine, la requête doit rester unique."""
+    auth = controller(AuthController, dataset[1], None)
+    email = user_with_role(dataset[1], "commercial").email
+    auth.view.prompt_credentials = lambda: (email, SYNTHETIC_PASSWORD)
+    auth.store_token = lambda token: None
+    assert run(benchmark, dataset, "login", auth.login, rounds=5)
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["base", "cache"])
+def test_benchmark_verify_token(benchmark, dataset, monkeypatch, cached):
+    auth = controller(AuthController, dataset[1], None)
+    token = auth.generate_token(user_with_role(dataset[1], "support"))
+    auth.load_token = lambda: token
+    auth.verify_token()
+    if not cached:
+        monkeypatch.setattr("controller.auth_controller.SESSION_CACHE_TTL", 0)
+
+    name = "verify_token_cached" if cached else "verify_token"
+    assert run(benchmark, dataset, name, auth.verify_token) is not None
+
+
+@pytest.mark.parametrize("live", [False, True], ids=["synthese", "contrats"])
+@pytest.mark.parametrize("group_by", ["commercial", "month"])
+def test_benchmark_contrat_totals(benchmark, dataset, group_by, live):
+    """Totaux des contrats : table de synthèse (quelques lignes par client et par mois) contre table des contrats."""
+    reports = controller(ReportController, dataset[1], "gestion")
+    totals = run(benchmark, dataset, "contrat_totals", lambda: reports.contrat_totals(group_by, live))
+    assert sum(row[-3] for row in totals) == DATASET["contrats"]
+
+
+def test_benchmark_validate_schedule(benchmark, dataset):
+    """Chevauchements de tout le planning : une requête, puis un index d'intervalles par support."""
+    events = controller(EventController, dataset[1], "gestion")
+    run(benchmark, dataset, "validate_schedule", events.validate_schedule, rounds=5)
+
+
+def test_benchmark_auto_assign(benchmark, dataset):
+    """Assignation automatique des événements non assignés (simulation : le jeu de données reste intact)."""
+    events = controller(EventController, dataset[1], "gestion")
+    assignments, unassigned = run(benchmark, dataset, "auto_assign", lambda: events.auto_assign(dry_run=True), rounds=5)
+    assert assignments
+
+
+def test_benchmark_assign_supports(benchmark):
+    """Répartition gloutonne seule : 30 000 événements sur un trimestre entre 60 supports."""
+    rng = random.Random(5)
+    start = datetime(2025, 1, 1)
+    events = []
+    for i in range(30_000):
+        begin = start + timedelta(minutes=rng.randrange(90 * 24 * 60))
+        events.append((i, begin, begin + timedelta(hours=rng.randint(2, 12))))
+
+    assignments, unassigned = benchmark.pedantic(assign_supports, args=(events, range(60)), rounds=3, iterations=1)
+    assert len(assignments) + len(unassigned) == len(events)
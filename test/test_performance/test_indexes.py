@@ -0,0 +1,140 @@
+import random
+import time
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from model import Client, Contrat, Event, Role, User
+from utils.config import Base
+
+N_COMMERCIAUX = 200
+N_CLIENTS = 5_000
+N_CONTRATS = 50_000
+N_EVENTS = 20_000
+
+# Requêtes des contrôleurs (filter_contrats, filter_event, list_personnal_client, login, create_contrat...)
+# et index attendu dans le plan d'exécution.
+ACCESS_PATHS = {
+    "contrats_non_signes": (select(Contrat).filter_by(status=False), "ix_contrats_status_remaining_amount"),
+    "contrats_paiement_en_attente": (select(Contrat).where(Contrat.remaining_amount > 0), "ix_contrats_unpaid"),
+    "contrats_du_client": (select(Contrat).filter_by(client_id=42), "ix_contrats_client_id"),
+    "events_du_support": (select(Event).filter_by(support_id=7), "ix_events_support_start"),
+    "events_non_assignes": (select(Event).filter_by(support_id=None), "ix_events_support_start"),
+    "event_du_contrat": (select(Event).filter_by(contrat_id=42), "ix_events_contrat_id"),
+    "events_a_venir": (
+        select(Event).where(Event.start_date >= datetime(2025, 6, 1), Event.start_date < datetime(2025, 6, 8)),
+        "ix_events_start_date",
+    ),
+    "events_en_cours": (select(Event).where(Event.end_date > datetime(2026, 1, 2)), "ix_events_end_date"),
+    "events_du_lieu": (
+        select(Event).where(*Event.window_criteria(location="Lyon")).order_by(Event.start_date),
+        "ix_events_location_start",
+    ),
+    "clients_du_commercial": (select(Client).filter_by(commercial_id=7), "ix_clients_commercial_id"),
+    "recherche_clients": (Client.search_statement("sqlite", "client42@test"), "clients_search VIRTUAL TABLE"),
+    "login": (select(User).filter_by(email="commercial7@test.com"), "ix_users_email"),
+}
+
+
+@pytest.fixture(scope="module")
+def large_engine():
+    """Base SQLite en mémoire peuplée avec un jeu de données volumineux."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rng = random.Random(12)
+    start = datetime(2025, 1, 1)
+
+    with engine.begin() as connection:
+        connection.execute(insert(Role), [{"id": 1, "name": "commercial"}, {"id": 2, "name": "support"}])
+        connection.execute(
+            insert(User),
+            [
+                {"id": i, "name": f"User {i}", "email": f"commercial{i}@test.com", "password": "x", "role_id": 1}
+                for i in range(1, N_COMMERCIAUX + 1)
+            ],
+        )
+        connection.execute(
+            insert(Client),
+            [
+                {"id": i, "name": f"Client {i}", "email": f"client{i}@test.com", "commercial_id": i % N_COMMERCIAUX + 1}
+                for i in range(1, N_CLIENTS + 1)
+            ],
+        )
+        connection.execute(
+            insert(Contrat),
+            [
+                {
+                    "id": i,
+                    "client_id": rng.randint(1, N_CLIENTS),
+                    "total_amount": 1000.0,
+                    "remaining_amount": 0.0 if rng.random() < 0.9 else 500.0,
+                    "status": rng.random() < 0.99,
+                }
+                for i in range(1, N_CONTRATS + 1)
+            ],
+        )
+        connection.execute(
+            insert(Event),
+            [
+                {
+                    "id": i,
+                    "name": f"Event {i}",
+                    "contrat_id": i,
+                    "start_date": start + timedelta(hours=rng.randint(0, 24 * 365)),
+                    "end_date": start + timedelta(days=366),
+                    "location": "Paris",
+                    "attendees": 10,
+                    "support_id": None if rng.random() < 0.05 else rng.randint(1, N_COMMERCIAUX),
+                }
+                for i in range(1, N_EVENTS + 1)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement):
+    """Retourne le plan d'exécution SQLite d'une requête sous forme de texte."""
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        return " | ".join(row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+def timed(engine, statement, repeat=20):
+    """Meilleure durée d'exécution d'une requête sur plusieurs essais (en secondes)."""
+    durations = []
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            connection.execute(statement).all()
+            durations.append(time.perf_counter() - begin)
+    return min(durations)
+
+
+@pytest.mark.parametrize("name", ACCESS_PATHS)
+def test_access_path_uses_index(large_engine, name):
+    """Vérifie que chaque filtre des contrôleurs est servi par l'index prévu."""
+    statement, index_name = ACCESS_PATHS[name]
+
+    plan = query_plan(large_engine, statement)
+
+    assert index_name in plan, f"{name} : index {index_name} non utilisé ({plan})"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "name", ["contrats_non_signes", "contrats_du_client", "events_du_support", "clients_du_commercial"]
+)
+def test_index_speedup(large_engine, name):
+    """Compare la durée des filtres sélectifs avec et sans index (l'usage de l'index est vérifié par le plan)."""
+    statement, index_name = ACCESS_PATHS[name]
+    index = next(index for table in Base.metadata.sorted_tables for index in table.indexes if index.name == index_name)
+
+    with_index = timed(large_engine, statement)
+    index.drop(large_engine)
+    try:
+        without_index = timed(large_engine, statement)
+    finally:
+        index.create(large_engine)
+
+    print(f"\n{name} : {without_index * 1000:.2f} ms sans index, {with_index * 1000:.2f} ms avec index")
+    assert with_index < without_index, f"{name} : l'index n'accélère pas la requête"
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MAIN = os.path.join(ROOT_DIR, "main.py")
+
+# Budget de démarrage (somme des imports de premier niveau), ajustable selon la machine d'intégration.
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+# Modules qui ne doivent pas être chargés par `login` / `logout`.
+HEAVY_MODULES = {
+    "rich",
+    "sentry_sdk",
+    "view.menu_view",
+    "utils.migrations",
+    "controller.user_controller",
+    "controller.client_controller",
+    "controller.contrat_controller",
+    "controller.event_controller",
+}
+
+
+def measure_imports(args, cwd):
+    """Lance Python avec `-X importtime` et retourne (modules importés, temps total en ms)."""
+    env = dict(os.environ, DATABASE_URL=os.getenv("DATABASE_URL", "sqlite://"), SENTRY="")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        input="",
+    )
+    assert result.returncode == 0, result.stderr
+
+    modules = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        if not name.startswith("   "):
+            total_us += int(cumulative)
+    return modules, total_us / 1000
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param([MAIN, "logout"], id="logout"),
+        pytest.param(
+            ["-c", f"import sys; sys.path.insert(0, {ROOT_DIR!r}); import main, controller.auth_controller"], id="login"
+        ),
+    ],
+)
+def test_startup_imports_only_auth(tmp_path, args):
+    """Vérifie que les commandes d'authentification n'importent pas le menu et respectent le budget."""
+    modules, total_ms = measure_imports(args, cwd=tmp_path)
+
+    loaded = HEAVY_MODULES & modules
+    assert not loaded, f"Modules chargés inutilement au démarrage : {sorted(loaded)}"
+    assert total_ms <= STARTUP_BUDGET_MS, f"Démarrage en {total_ms:.0f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)"
@@ -0,0 +1,41 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from utils.password_hashing import build_hasher, hash_passwords
+
+# Paramètres Argon2 par défaut : c'est leur coût réel que le pool doit répartir sur les cœurs.
+HASHER = build_hasher(time_cost=3, memory_cost=65536, parallelism=4)
+PASSWORDS = [f"motdepasse-{i}" for i in range(24)]
+MIN_SPEEDUP = 1.5
+
+
+def _throughput(executor=None):
+    """Retourne le nombre de mots de passe hachés par seconde."""
+    start = time.perf_counter()
+    hashes = hash_passwords(PASSWORDS, HASHER, executor)
+    elapsed = time.perf_counter() - start
+    assert len(hashes) == len(PASSWORDS)
+    return len(PASSWORDS) / elapsed
+
+
+@pytest.mark.slow
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="Le hachage parallèle nécessite plusieurs cœurs.")
+def test_parallel_hashing_throughput():
+    """Compare le débit de hachage en série et dans un pool de processus (un par cœur)."""
+    serial = _throughput()
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        executor.submit(int).result()  # démarrage des processus hors mesure
+        parallel = _throughput(executor)
+
+    print(f"\n⏱️ série : {serial:.1f} hachages/s, pool ({os.cpu_count()} processus) : {parallel:.1f} hachages/s")
+    assert parallel >= serial * MIN_SPEEDUP, f"Accélération insuffisante : {parallel / serial:.2f}x"
+
+
+def test_parallel_hashing_verifiable():
+    """Vérifie que les hachages calculés dans le pool sont vérifiables par le hasher configuré."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        hashes = hash_passwords(PASSWORDS[:4], build_hasher(1, 8, 1), executor, chunksize=1)
+
+    assert all(build_hasher(1, 8, 1).verify(h, p) for h, p in zip(hashes, PASSWORDS))
@@ -1,6 +1,9 @@
 import pytest
+import os
 import jwt
 from controller.auth_controller import AuthController
+from utils.password_hashing import build_hasher
+from utils.session_cache import Principal
 import datetime
 from datetime import timezone
 
@@ -9,7 +12,15 @@ TEST_SECRET_KEY = "test_secret_key"
 
 
 @pytest.fixture
-def auth_controller(monkeypatch, mock_session):
+def session_cache_file(tmp_path, monkeypatch):
+    """Fixture qui place le cache de session dans un répertoire temporaire."""
+    path = str(tmp_path / ".session")
+    monkeypatch.setattr("controller.auth_controller.SESSION_CACHE_FILE", path)
+    return path
+
+
+@pytest.fixture
+def auth_controller(monkeypatch, mock_session, session_cache_file):
     """Fixture qui retourne une instance de AuthController avec SECRET_KEY et DBSession patchés."""
     monkeypatch.setattr("controller.auth_controller.SECRET_KEY", TEST_SECRET_KEY)
     monkeypatch.setattr("controller.auth_controller.Session", lambda: mock_session)
@@ -165,3 +176,80 @@ def test_logout(auth_controller, mocker):
     mock_display_success = mocker.patch.object(auth_controller.view, "display_success_message")
     auth_controller.logout()
     mock_display_success.assert_called_once_with("👋 Déconnexion réussie.")
+
+
+def test_verify_token_uses_session_cache(auth_controller, mocker, sample_user, session_cache_file, assert_max_queries):
+    """Test qu'après une première vérification, le principal est résolu sans requête en base."""
+
+    token = auth_controller.generate_token(sample_user)
+    mocker.patch.object(auth_controller, "load_token", return_value=token)
+
+    user = auth_controller.verify_token()
+    assert user.id == sample_user.id
+    assert os.path.exists(session_cache_file), "Le cache de session doit être écrit."
+
+    with assert_max_queries(0):
+        principal = auth_controller.verify_token()
+
+    assert isinstance(principal, Principal)
+    assert principal.id == sample_user.id
+    assert principal.name == sample_user.name
+    assert principal.role.name == "gestion"
+    assert principal.role.has_permission("create_user") is True
+
+
+def test_verify_token_version_mismatch(auth_controller, mock_session, mocker, sample_user, session_cache_file):
+    """Test qu'un token émis avant une modification du compte est refusé."""
+
+    token = auth_controller.generate_token(sample_user)
+    mocker.patch.object(auth_controller, "load_token", return_value=token)
+    sample_user.token_version = 1
+    mock_session.commit()
+    mock_display_error = mocker.patch.object(auth_controller.view, "display_error_message")
+
+    assert auth_controller.verify_token() is None
+    mock_display_error.assert_called_once()
+    assert not os.path.exists(session_cache_file)
+
+
+def test_verify_token_cache_revalidated_after_ttl(auth_controller, mock_session, mocker, sample_user, monkeypatch):
+    """Test qu'un cache plus ancien que SESSION_CACHE_TTL est revérifié en base."""
+
+    token = auth_controller.generate_token(sample_user)
+    mocker.patch.object(auth_controller, "load_token", return_value=token)
+    auth_controller.verify_token()
+
+    sample_user.token_version = 1
+    mock_session.commit()
+    monkeypatch.setattr("controller.auth_controller.SESSION_CACHE_TTL", 0)
+
+    assert auth_controller.verify_token() is None, "La nouvelle version de session doit être détectée."
+
+
+def test_logout_clears_session_cache(auth_controller, mocker, sample_user, session_cache_file):
+    """Test que logout supprime le cache de session."""
+
+    token = auth_controller.generate_token(sample_user)
+    mocker.patch.object(auth_controller, "load_token", return_value=token)
+    auth_controller.verify_token()
+    mocker.patch("controller.auth_controller.open", mocker.mock_open(), create=True)
+
+    auth_controller.logout()
+
+    assert not os.path.exists(session_cache_file)
+
+
+def test_login_rehashes_outdated_password(auth_controller, mock_session, mocker, sample_user, monkeypatch):
+    """Test que login re-hache le mot de passe lorsque les paramètres Argon2 configurés ont changé."""
+
+    monkeypatch.setattr("model.user.ph", build_hasher(time_cost=1, memory_cost=8, parallelism=1))
+    monkeypatch.setattr(auth_controller.view, "prompt_credentials", lambda: (sample_user.email, "securepass"))
+    mocker.patch.object(auth_controller, "store_token")
+    old_hash = sample_user.password
+
+    assert auth_controller.login() is not None
+
+    mock_session.refresh(sample_user)
+    assert sample_user.password != old_hash
+    assert "$m=8,t=1,p=1$" in sample_user.password
+    assert sample_user.check_password("securepass") is True
@@ -217,3 +217,164 @@ def test_update_client_permission_denied(client_controller, monkeypatch):
     monkeypatch.setattr(client_controller, "check_permission", lambda action: False)
     return_value = client_controller.update_client(1)
     assert return_value is None, "Le client ne devrait pas être mis à jour."
+
+
+def test_list_all_client_single_query(client_controller, sample_client, assert_max_queries, monkeypatch):
+    """Test que list_all_client affiche les clients en une seule requête."""
+
+    monkeypatch.setattr(client_controller, "check_permission", lambda _: True)
+
+    with assert_max_queries(1):
+        client_controller.list_all_client()
+
+
+def test_import_clients_csv(client_controller, mock_session, sample_client, tmp_path):
+    """Test que import_clients insère les lignes valides et signale les erreurs sans s'arrêter."""
+
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "name,email,phone,company\n"
+        "Client A,a@test.com,0101,Corp A\n"
+        "Client B,b@test.com,,\n"
+        f"Client Existant,{sample_client.email},,\n"
+        "Client A bis,a@test.com,,\n"
+        ",sans-nom@test.com,,\n"
+        "Client C,c@test.com,0303,Corp C\n",
+        encoding="utf-8",
+    )
+
+    inserted, errors = client_controller.import_clients(str(path), batch_size=2)
+
+    assert inserted == 3, "Trois clients valides doivent être importés."
+    assert [line for line, _ in errors] == [4, 5, 6], "Les lignes en erreur doivent être signalées."
+    client_a = mock_session.query(Client).filter_by(email="a@test.com").one()
+    assert client_a.company == "Corp A"
+    assert client_a.commercial_id == client_controller.user.id
+    assert mock_session.query(Client).filter_by(email="b@test.com").one().phone is None
+
+
+def test_import_clients_jsonl(client_controller, mock_session, tmp_path):
+    """Test que import_clients lit le format JSONL et ignore les lignes illisibles."""
+
+    path = tmp_path / "clients.jsonl"
+    path.write_text(
+        '{"name": "Client A", "email": "a@test.com"}\n' "pas du json\n" '{"name": "Client B", "email": "b@test.com"}\n',
+        encoding="utf-8",
+    )
+
+    inserted, errors = client_controller.import_clients(str(path))
+
+    assert inserted == 2
+    assert len(errors) == 1 and errors[0][0] == 2
+    assert mock_session.query(Client).count() == 2
+
+
+def test_import_clients_batched_queries(client_controller, tmp_path, assert_max_queries, monkeypatch):
+    """Test que chaque lot coûte une requête de doublons et un INSERT."""
+
+    path = tmp_path / "clients.csv"
+    path.write_text("name,email\n" + "".join(f"Client {i},c{i}@test.com\n" for i in range(10)), encoding="utf-8")
+    monkeypatch.setattr(client_controller, "check_permission", lambda _: True)
+
+    with assert_max_queries(3 * 2) as statements:
+        inserted, errors = client_controller.import_clients(str(path), batch_size=5)
+
+    assert inserted == 10 and not errors
+    assert sum(statement.startswith("INSERT") for statement in statements) == 2
+
+
+def test_import_clients_permission_denied(client_controller, tmp_path, monkeypatch):
+    """Test que import_clients est refusé sans la permission create_client."""
+
+    monkeypatch.setattr(client_controller, "check_permission", lambda _: False)
+    assert client_controller.import_clients(str(tmp_path / "clients.csv")) is None
+
+
+@pytest.fixture
+def annuaire(mock_session, sample_commercial):
+    """Fixture qui crée des clients aux noms accentués, entreprises et téléphones variés."""
+    clients = [
+        Client("Élodie Dupont", "elodie@lyon-events.fr", "06 12 34 56 78", "Lyon Events", sample_commercial.id),
+        Client("Marc Durand", "marc.durand@mail.com", "0698765432", "Dupont & Fils", sample_commercial.id),
+        Client("Léa Martin", "lea@exemple.fr", None, "Château Événements", sample_commercial.id),
+    ]
+    mock_session.add_all(clients)
+    mock_session.commit()
+    return clients
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("dupont", [0, 1]),
+        ("ELODIE", [0]),
+        ("chateau evene", [2]),
+        ("durand@mail", [1]),
+        ("0612345678", [0]),
+        ("56 78", [0]),
+        ("fr lea", [2]),
+        ("introuvable", []),
+    ],
+    ids=[
+        "nom_et_entreprise",
+        "casse",
+        "accents",
+        "email",
+        "telephone_chiffres",
+        "termes_courts",
+        "terme_court",
+        "aucun",
+    ],
+)
+def test_search_clients(client_controller, annuaire, monkeypatch, query, expected):
+    """Test la recherche par sous-chaîne sur le nom, l'email, l'entreprise et le téléphone, sans accents ni casse."""
+    monkeypatch.setattr(client_controller.view, "display_search_results", lambda *args: None)
+
+    assert sorted(client.id for client in client_controller.search_clients(query)) == [annuaire[i].id for i in expected]
+
+
+def test_search_clients_pages_and_updates(client_controller, mock_session, annuaire, capsys):
+    """Test le classement, la pagination et la mise à jour de l'index après modification et suppression."""
+    transports = Client("Dupont Transports", "contact@transports.fr", commercial_id=annuaire[0].commercial_id)
+    mock_session.add(transports)
+    mock_session.commit()
+    assert client_controller.search_clients("dupont")[0] == transports, "Nom commençant par le terme en tête."
+
+    assert client_controller.search_clients("r", page_size=2) == [transports, annuaire[2]]
+    assert "page 2" in capsys.readouterr().out
+    assert client_controller.search_clients("r", page=2, page_size=2) == [annuaire[1], annuaire[0]]
+
+    annuaire[1].company = "Martin SA"
+    mock_session.delete(annuaire[2])
+    mock_session.commit()
+
+    assert client_controller.search_clients("martin") == [annuaire[1]]
+    assert client_controller.search_clients("dupont") == [transports, annuaire[0]]
+    assert client_controller.search_clients("  ") is None
+
+
+def test_import_clients_invalid_types_and_rejected_rows(client_controller, mock_session, tmp_path, monkeypatch):
+    """Test que les champs non textuels et les lignes refusées par la base sont signalés sans rejeter le lot."""
+    path = tmp_path / "clients.jsonl"
+    path.write_text(
+        '{"name": "Client A", "email": "a@test.com", "phone": 612345678}\n'
+        '{"name": ["x"], "email": "liste@test.com"}\n'
+        '{"name": "Refusé", "email": "refuse@test.com"}\n'
+        '{"name": "Client B", "email": "b@test.com"}\n',
+        encoding="utf-8",
+    )
+    parse = client_controller._parse_client_record
+
+    def parse_with_db_error(record):
+        row = parse(record)
+        if row["email"] == "refuse@test.com":
+            row["name"] = None  # NOT NULL : refusé par la base, pas par la validation.
+        return row
+
+    monkeypatch.setattr(client_controller, "_parse_client_record", parse_with_db_error)
+
+    inserted, errors = client_controller.import_clients(str(path))
+
+    assert inserted == 2
+    assert errors == [(2, "Champ name : texte attendu."), (3, "Ligne rejetée : IntegrityError")]
+    assert mock_session.query(Client).filter_by(email="a@test.com").one().phone == "612345678"
@@ -93,3 +93,12 @@ def test_display_client_details_no_commercial(client_view, capsys):
     assert f"🔹 Téléphone : {client.phone}" in captured.out
     assert f"🔹 Entreprise : {client.company}" in captured.out
     assert "🔹 Commercial : Non attribué" in captured.out
+
+
+def test_display_import_report(capsys):
+    """Test que display_import_report affiche le bilan et chaque ligne en erreur."""
+    ClientView().display_import_report(3, [(4, "Email en double")])
+
+    captured = capsys.readouterr()
+    assert "3 client(s) importé(s), 1 ligne(s) en erreur." in captured.out
+    assert "❌ Ligne 4 : Email en double" in captured.out
@@ -0,0 +1,165 @@
+import json
+import pytest
+from controller.command_controller import CommandController
+from model.client import Client
+from model.contrat import Contrat
+from model.event import Event
+
+
+@pytest.fixture
+def commands(mock_session, monkeypatch):
+    """Fabrique un CommandController pour un utilisateur, avec les contrôleurs liés à la session de test."""
+    for module in (
+        "user_controller",
+        "client_controller",
+        "contrat_controller",
+        "event_controller",
+        "report_controller",
+    ):
+        monkeypatch.setattr(f"controller.{module}.DBSession", lambda: mock_session)
+    return CommandController
+
+
+def outputs(capsys):
+    """Lignes JSON affichées par les commandes."""
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_user_list_json(commands, sample_user, capsys):
+    """Test que `user list` retourne les utilisateurs en JSON, sans mot de passe."""
+    assert commands(sample_user).execute(["user", "list"]) is True
+
+    [result] = outputs(capsys)
+    assert result["ok"] is True
+    assert result["data"] == [{"id": sample_user.id, "name": "John Doe", "email": "john@example.com", "role_id": 1}]
+
+
+def test_client_create_and_list_mine(commands, mock_session, sample_commercial, capsys):
+    """Test la création d'un client puis `client list --mine` pour un commercial."""
+    controller = commands(sample_commercial)
+
+    assert controller.execute(["client", "create", "--name", "Client A", "--email", "a@test.com"]) is True
+    assert controller.execute(["client", "list", "--mine"]) is True
+
+    created, listed = outputs(capsys)
+    assert created["data"]["commercial_id"] == sample_commercial.id
+    assert [client["email"] for client in listed["data"]] == ["a@test.com"]
+    assert mock_session.query(Client).count() == 1
+
+
+def test_contrat_commands(commands, mock_session, sample_commercial, sample_client, capsys):
+    """Test la création, la signature et le filtrage des contrats par arguments."""
+    controller = commands(sample_commercial)
+
+    controller.execute(
+        ["contrat", "create", "--client", str(sample_client.id), "--total", "1000", "--remaining", "400"]
+    )
+    contrat_id = outputs(capsys)[0]["data"]["id"]
+    controller.execute(["contrat", "filter", "--unsigned"])
+    assert [contrat["id"] for contrat in outputs(capsys)[0]["data"]] == [contrat_id]
+
+    assert controller.execute(["contrat", "update", str(contrat_id), "--sign", "--remaining", "0"]) is True
+    contrat = mock_session.get(Contrat, contrat_id)
+    assert (contrat.status, contrat.total_amount, contrat.remaining_amount) == (True, 1000, 0)
+
+
+def test_event_assign(commands, mock_session, sample_user, sample_event, sample_support, capsys):
+    """Test `event assign` (gestion) et le refus d'une saisie non fournie (`event notes` par la gestion)."""
+    controller = commands(sample_user)
+
+    assert controller.execute(["event", "assign", str(sample_event.id), "--support", str(sample_support.id)])
+    assert mock_session.get(Event, sample_event.id).support_id == sample_support.id
+
+    assert controller.execute(["event", "notes", str(sample_event.id), "--notes", "RAS"]) is False
+    assert "input_support_assignment" in outputs(capsys)[-1]["errors"][0]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["client", "list", "--mine"], ["contrat", "filter"], ["inconnu"], ["event", "create", "--contrat", "x"]],
+    ids=["permission", "filtre_manquant", "entite_inconnue", "argument_invalide"],
+)
+def test_command_errors(commands, sample_user, capsys, argv):
+    """Test que les refus et erreurs d'arguments sont signalés en JSON sans quitter le processus."""
+    assert commands(sample_user).execute(argv) is False
+
+    [result] = outputs(capsys)
+    assert result["ok"] is False and result["errors"]
+
+
+def test_run_batch(commands, sample_user, capsys):
+    """Test l'exécution d'une commande par ligne et le décompte des échecs."""
+    lines = ["# commentaire", "", "user list", "user show 999", "contrat filter --unpaid", "user show 'non fermé"]
+
+    assert commands(sample_user).run_batch(lines) == 2
+
+    results = outputs(capsys)
+    assert [result["ok"] for result in results] == [True, False, True, False]
+
+
+def test_report_totals(commands, sample_user, sample_contrat, capsys):
+    """Test `report totals --by status` : totaux lus dans la synthèse des contrats."""
+    assert commands(sample_user).execute(["report", "totals", "--by", "status"]) is True
+
+    [result] = outputs(capsys)
+    assert result["data"] == [[False, 1, 10000.0, 5000.0]]
+
+
+def test_report_dashboard_amounts(commands, sample_user, sample_event, async_database, capsys):
+    """Test `report dashboard` : les montants du tableau de bord sont des nombres JSON, comme `report totals`."""
+    async_database()
+
+    assert commands(sample_user).execute(["report", "dashboard"]) is True
+
+    [result] = outputs(capsys)
+    assert result["data"]["contrats_par_statut"] == [[True, 1, 10000.0, 5000.0]]
+    assert result["data"]["reste_par_commercial"] == [[sample_event.contrat.client.commercial_id, 5000.0]]
+
+
+def test_profile_reports_action_queries(commands, mock_session, sample_user, monkeypatch, capsys):
+    """Test qu'avec --profile le profil SQL de l'action est affiché sur stderr, hors de la ligne JSON."""
+    monkeypatch.setattr("utils.config.PROFILE_ACTIONS", True)
+    monkeypatch.setattr("utils.config.get_engine", lambda: mock_session.get_bind())
+
+    assert commands(sample_user).execute(["user", "list"]) is True
+
+    output = capsys.readouterr()
+    [result] = [json.loads(line) for line in output.out.splitlines()]
+    assert result["ok"] is True
+    assert "📊 1 requête(s) SQL" in output.err
+
+
+def test_event_calendar(commands, sample_user, sample_event, capsys):
+    """Test `event calendar` : événements d'une fenêtre et d'un lieu."""
+    controller = commands(sample_user)
+
+    assert controller.execute(["event", "calendar", "--from", "2025-03-15T12:00", "--location", "Paris"]) is True
+    assert controller.execute(["event", "calendar", "--to", "2025-03-15T10:00"]) is True
+
+    found, empty = outputs(capsys)
+    assert [event["id"] for event in found["data"]] == [sample_event.id]
+    assert empty["data"] == [] and empty["messages"]
+
+
+def test_client_search(commands, sample_commercial, sample_client, capsys):
+    """Test `client search` : termes libres et page de résultats."""
+    controller = commands(sample_commercial)
+
+    assert controller.execute(["client", "search", "TEST", "corp"]) is True
+    assert controller.execute(["client", "search", "test", "--page", "2"]) is True
+
+    found, empty = outputs(capsys)
+    assert [client["id"] for client in found["data"]] == [sample_client.id]
+    assert "search_key" not in found["data"][0] and empty["data"] == []
+
+
+def test_main_report_routes_command_mode(commands, sample_user, sample_contrat, monkeypatch, capsys):
+    """Test que `python main.py report totals --by status` passe par le mode commande."""
+    import main
+
+    monkeypatch.setattr(main, "command_user", lambda: sample_user)
+
+    main.report(["totals", "--by", "status"])
+
+    [result] = outputs(capsys)
+    assert result["command"] == "report totals --by status" and result["data"] == [[False, 1, 10000.0, 5000.0]]
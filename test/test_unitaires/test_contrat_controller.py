@@ -303,6 +303,83 @@ def test_display_all_contrats_empty(contrat_controller, mock_session, monkeypatc
     assert "📭 Aucun contrat trouvé." in info_message[0], "Le message d'absence de contrat doit être affiché"
 
 
+def test_iter_contrat_pages_keyset(contrat_controller, mock_session, sample_client):
+    """Test que iter_contrat_pages découpe les contrats en pages ordonnées par ID."""
+
+    contrats = [
+        Contrat(client_id=sample_client.id, total_amount=1000 * i, remaining_amount=0, status=False)
+        for i in range(1, 6)
+    ]
+    mock_session.add_all(contrats)
+    mock_session.commit()
+
+    pages = list(contrat_controller.iter_contrat_pages(page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1], "Les contrats doivent être découpés en pages de 2."
+    assert [c.id for page in pages for c in page] == sorted(c.id for c in contrats)
+    assert "client" in pages[0][0].__dict__, "Le client doit être chargé avec la page."
+
+
+def test_browse_contrats_all_pages(contrat_controller, mock_session, sample_client, monkeypatch):
+    """Test que browse_contrats affiche toutes les pages si l'utilisateur continue."""
+
+    mock_session.add_all(
+        [Contrat(client_id=sample_client.id, total_amount=100, remaining_amount=0) for _ in range(3)]
+    )
+    mock_session.commit()
+
+    displayed = []
+    monkeypatch.setattr(contrat_controller.view, "display_contrats", lambda page: displayed.append(len(page)))
+    monkeypatch.setattr(contrat_controller.view, "ask_next_page", lambda: True)
+
+    total = contrat_controller.browse_contrats(page_size=2)
+
+    assert total == 3, "Les trois contrats doivent être affichés."
+    assert displayed == [2, 1]
+
+
+def test_browse_contrats_stop(contrat_controller, mock_session, sample_client, monkeypatch):
+    """Test que browse_contrats s'arrête si l'utilisateur quitte après la première page."""
+
+    mock_session.add_all(
+        [Contrat(client_id=sample_client.id, total_amount=100, remaining_amount=0) for _ in range(3)]
+    )
+    mock_session.commit()
+
+    displayed = []
+    monkeypatch.setattr(contrat_controller.view, "display_contrats", lambda page: displayed.append(len(page)))
+    monkeypatch.setattr(contrat_controller.view, "ask_next_page", lambda: False)
+
+    total = contrat_controller.browse_contrats(page_size=2)
+
+    assert total == 2, "Seule la première page doit être affichée."
+    assert displayed == [2]
+
+
+def test_browse_contrats_empty(contrat_controller, monkeypatch):
+    """Test que browse_contrats affiche un message si aucun contrat n'existe."""
+
+    info_message = []
+    monkeypatch.setattr(contrat_controller.view, "display_info_message", lambda msg: info_message.append(msg))
+
+    total = contrat_controller.browse_contrats(page_size=2)
+
+    assert total == 0
+    assert "📭 Aucun contrat trouvé." in info_message
+
+
+def test_browse_contrats_no_permission(contrat_controller, monkeypatch):
+    """Test que browse_contrats refuse l'accès sans permission."""
+
+    monkeypatch.setattr(contrat_controller, "check_permission", lambda action: False)
+
+    error_message = []
+    monkeypatch.setattr(contrat_controller.view, "display_error_message", lambda msg: error_message.append(msg))
+
+    assert contrat_controller.browse_contrats(page_size=2) == 0
+    assert "❌ Accès refusé" in error_message[0]
+
+
 def test_filter_contrats_non_signes(contrat_controller, mock_session, sample_client, monkeypatch):
     """Test que filter_contrats retourne uniquement les contrats non signés."""
 
@@ -381,3 +458,59 @@ def test_no_contrat_to_display_for_filter(contrat_controller, monkeypatch):
 
     assert contrats == [], "Aucun contrat ne doit être retourné."
     assert "📭 Aucun contrat trouvé pour ce filtre." in info_message, "Un message informatif doit être affiché."
+
+
+def test_contrat_listings_no_n_plus_one(contrat_controller, mock_session, sample_client, assert_max_queries, monkeypatch):
+    """Test que les listings de contrats chargent les clients sans requête supplémentaire par ligne."""
+
+    mock_session.add_all(
+        [Contrat(client_id=sample_client.id, total_amount=100, remaining_amount=10) for _ in range(5)]
+    )
+    mock_session.commit()
+    mock_session.expunge_all()
+
+    monkeypatch.setattr(contrat_controller, "check_permission", lambda _: True)
+    monkeypatch.setattr(contrat_controller.view, "ask_filter_option", lambda: "paiement_en_attente")
+    monkeypatch.setattr(contrat_controller.view, "ask_next_page", lambda: True)
+
+    with assert_max_queries(1):
+        contrat_controller.read_contrat()
+    mock_session.expunge_all()
+    with assert_max_queries(1):
+        contrat_controller.filter_contrats()
+    mock_session.expunge_all()
+    with assert_max_queries(3):
+        contrat_controller.browse_contrats(page_size=2)
+
+
+async def test_contrats_per_status_async(contrat_controller, sample_contrat, mock_session, async_database):
+    """Test l'agrégat asynchrone des contrats par statut (nombre, total, restant dû)."""
+    mock_session.add(Contrat(client_id=sample_contrat.client_id, total_amount=2000, remaining_amount=0, status=True))
+    async_database()
+
+    rows = await contrat_controller.contrats_per_status_async()
+
+    assert sorted(rows) == [(False, 1, 10000, 5000), (True, 1, 2000, 0)]
+
+
+async def test_remaining_per_commercial_async(contrat_controller, sample_contrat, sample_commercial, async_database):
+    """Test que le restant dû est agrégé par commercial du client."""
+    async_database()
+
+    assert await contrat_controller.remaining_per_commercial_async() == [(sample_commercial.id, 5000)]
+
+
+async def test_filter_contrats_async(contrat_controller, sample_contrat, async_database):
+    """Test les filtres asynchrones, avec le client chargé par jointure."""
+    async_database()
+
+    [contrat] = await contrat_controller.filter_contrats_async("non_signes")
+    assert contrat.id == sample_contrat.id and contrat.client.name == "Client Test"
+    assert await contrat_controller.filter_contrats_async("inconnu") == []
+
+
+async def test_read_contrat_async_permission_denied(contrat_controller, async_database, monkeypatch):
+    """Test qu'un utilisateur sans permission obtient une liste vide, sans requête."""
+    monkeypatch.setattr(contrat_controller, "check_permission", lambda action: False)
+
+    assert await contrat_controller.read_contrat_async() == []
@@ -1,4 +1,6 @@
 import pytest
+from decimal import Decimal
+from sqlalchemy import func, text
 from model.contrat import Contrat
 from model.client import Client
 import re
@@ -70,3 +72,17 @@ def test_contrat_remaining_greater_than_total(mock_session):
         contrat = Contrat(client_id=1, total_amount=5000, remaining_amount=6000)
         mock_session.add(contrat)
         mock_session.commit()
+
+
+def test_contrat_amounts_in_cents(session):
+    """Test que les montants sont arrondis au centime, stockés en entiers et sommés exactement."""
+    client = Client(name="Client Z", email="z@test.com", phone="0102030405", company="Z Corp")
+    session.add(client)
+    session.commit()
+    session.add_all([Contrat(client_id=client.id, total_amount=0.1, remaining_amount=0.1) for _ in range(3)])
+    session.add(Contrat(client_id=client.id, total_amount="19.999", remaining_amount=0))
+    session.commit()
+
+    assert session.execute(text("SELECT total_amount FROM contrats ORDER BY id")).scalars().all() == [10, 10, 10, 2000]
+    assert session.query(func.sum(Contrat.remaining_amount)).scalar() == Decimal("0.30")
+    assert session.query(Contrat).order_by(Contrat.id.desc()).first().total_amount == Decimal("20.00")
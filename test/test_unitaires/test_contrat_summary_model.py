@@ -0,0 +1,96 @@
+from datetime import datetime
+from sqlalchemy import update
+from utils import config
+from model.client import Client
+from model.contrat import Contrat
+from model.contrat_summary import ContratSummary, rebuild_contrat_summaries
+
+
+def _summaries(session):
+    """Lignes de synthèse sous forme de tuples comparables."""
+    return sorted(
+        (s.client_id, s.year, s.month, s.status, s.contrat_count, s.total_amount, s.remaining_amount)
+        for s in session.query(ContratSummary)
+    )
+
+
+def _client(session, name="Client A"):
+    client = Client(name=name, email=f"{name.replace(' ', '').lower()}@test.com", phone="0102030405", company="X")
+    session.add(client)
+    session.commit()
+    return client
+
+
+def test_summary_on_create(session):
+    """Test que la création de contrats alimente la ligne (client, mois, statut) correspondante."""
+    client = _client(session)
+    session.add_all(
+        [
+            Contrat(client_id=client.id, total_amount=1000, remaining_amount=400),
+            Contrat(client_id=client.id, total_amount=500, remaining_amount=500),
+        ]
+    )
+    session.commit()
+
+    today = datetime.now()
+    assert _summaries(session) == [(client.id, today.year, today.month, False, 2, 1500, 900)]
+
+
+def test_summary_on_update_and_delete(session):
+    """Test qu'une signature déplace le contrat vers le statut signé et qu'une suppression le retire."""
+    client = _client(session)
+    contrat = Contrat(client_id=client.id, total_amount=1000, remaining_amount=1000)
+    other = Contrat(client_id=client.id, total_amount=200, remaining_amount=200)
+    session.add_all([contrat, other])
+    session.commit()
+
+    contrat.sign_contrat()
+    contrat.remaining_amount = 250
+    session.commit()
+    assert [row[3:] for row in _summaries(session)] == [(False, 1, 200, 200), (True, 1, 1000, 250)]
+
+    session.delete(other)
+    session.commit()
+    assert [row[3:] for row in _summaries(session)] == [(True, 1, 1000, 250)], "Les groupes vides sont supprimés."
+
+
+def test_rebuild_matches_incremental(session):
+    """Test que le recalcul complet (GROUP BY) retrouve la synthèse tenue à jour incrémentalement."""
+    first, second = _client(session, "Client A"), _client(session, "Client B")
+    for i, client in enumerate([first, second, first, first]):
+        contrat = Contrat(client_id=client.id, total_amount=100 * (i + 1), remaining_amount=10 * i, status=i % 2 == 0)
+        contrat.date_created = datetime(2025, 1 + i % 2, 15)
+        session.add(contrat)
+    session.commit()
+    incremental = _summaries(session)
+
+    assert rebuild_contrat_summaries(session) == len(incremental) == 3
+    assert _summaries(session) == incremental
+
+
+def test_summary_delta_is_atomic(session):
+    """Test que l'écart est additionné en base : une écriture concurrente sur la ligne n'est pas écrasée."""
+    client = _client(session)
+    session.add(Contrat(client_id=client.id, total_amount=100, remaining_amount=0))
+    session.commit()
+    summary = session.query(ContratSummary).one()
+    # Un autre processus ajoute 4 contrats entre-temps ; la session garde l'ancienne ligne en mémoire.
+    session.execute(
+        update(ContratSummary).values(contrat_count=5, total_amount=500),
+        execution_options={"synchronize_session": False},
+    )
+
+    session.add(Contrat(client_id=client.id, total_amount=100, remaining_amount=0))
+    session.commit()
+
+    session.refresh(summary)
+    assert (summary.contrat_count, summary.total_amount) == (6, 600)
+
+
+def test_model_star_import_keeps_app_session():
+    """Test que `from model import *` n'exporte pas la classe Session de SQLAlchemy (elle masquerait utils.config)."""
+    namespace = {}
+    exec("from utils.config import Session\nfrom model import *", namespace)
+
+    assert namespace["Session"] is config.Session
+    assert {"ContratSummary", "rebuild_contrat_summaries"} <= namespace.keys()
@@ -171,3 +171,13 @@ def test_ask_filter_option(contrat_view, monkeypatch):
 
     monkeypatch.setattr("builtins.input", lambda _: "abc")
     assert contrat_view.ask_filter_option() is None, "Une entrée non numérique doit retourner None"
+
+
+def test_ask_next_page(contrat_view, monkeypatch):
+    """Test que ask_next_page continue par défaut et s'arrête sur 'q'."""
+
+    monkeypatch.setattr("builtins.input", lambda _: "")
+    assert contrat_view.ask_next_page() is True, "Entrée doit passer à la page suivante"
+
+    monkeypatch.setattr("builtins.input", lambda _: "Q")
+    assert contrat_view.ask_next_page() is False, "'q' doit arrêter la pagination"
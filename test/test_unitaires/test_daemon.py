@@ -0,0 +1,187 @@
+import json
+import os
+import threading
+import jwt
+import pytest
+import crm
+from controller.auth_controller import AuthController
+from controller.command_controller import CommandController
+from utils.daemon import CRMServer, remove_stale_socket
+
+TEST_SECRET_KEY = "test_secret_key"
+
+
+@pytest.fixture
+def server(tmp_path, mock_session, monkeypatch):
+    """Serveur CRM sur un socket temporaire, contrôleurs liés à la session de test."""
+    monkeypatch.setattr("controller.auth_controller.SECRET_KEY", TEST_SECRET_KEY)
+    monkeypatch.setattr("controller.auth_controller.Session", lambda: mock_session)
+    monkeypatch.setattr("controller.auth_controller.SESSION_CACHE_FILE", str(tmp_path / ".session"))
+    for module in ("user_controller", "client_controller", "contrat_controller", "event_controller"):
+        monkeypatch.setattr(f"controller.{module}.DBSession", lambda: mock_session)
+    server = CRMServer(str(tmp_path / "crm.sock"))
+    yield server
+    server.server_close()
+
+
+@pytest.fixture
+def token(sample_user):
+    """Token JWT valide de l'utilisateur de test."""
+    return jwt.encode({"user_id": sample_user.id, "ver": 0}, TEST_SECRET_KEY, algorithm="HS256")
+
+
+def test_handle_request(server, token, sample_user):
+    """Test qu'une requête authentifiée est exécutée et que le contrôleur de l'utilisateur est réutilisé."""
+    response = json.loads(server.handle_request(json.dumps({"token": token, "argv": ["user", "show", "1"]})))
+
+    assert response["ok"] is True
+    assert response["data"]["email"] == sample_user.email
+    commands = server.commands[token]
+
+    server.handle_request(json.dumps({"token": token, "argv": ["user", "list"]}))
+    assert server.commands[token] is commands
+
+
+@pytest.mark.parametrize(
+    "line, error",
+    [
+        ('{"token": "", "argv": ["user", "list"]}', "⚠️ Vous devez vous connecter !"),
+        ('{"token": "invalide", "argv": ["user", "list"]}', "⚠️ Vous devez vous connecter !"),
+        ("pas du json", "Requête invalide."),
+    ],
+    ids=["sans_token", "token_invalide", "json_invalide"],
+)
+def test_handle_request_refused(server, line, error):
+    """Test que les requêtes non authentifiées ou mal formées sont refusées en JSON."""
+    response = json.loads(server.handle_request(line))
+
+    assert response["ok"] is False
+    assert response["errors"] == [error]
+
+
+def test_socket_round_trip(server):
+    """Test l'échange client léger / serveur sur le socket Unix (plusieurs requêtes par connexion)."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = crm.connect(server.path)
+        with connection:
+            first = crm.send(connection, "", ["user", "list"])
+            second = crm.send(connection, "", ["client", "list"])
+    finally:
+        server.shutdown()
+
+    assert first["command"] == "user list" and second["command"] == "client list"
+    assert oct(os.stat(server.path).st_mode & 0o777) == "0o600"
+
+
+def test_thin_client_batch_unbalanced_quote(server, tmp_path, monkeypatch, capsys):
+    """Test qu'une ligne aux guillemets non fermés est signalée en JSON sans interrompre le batch du client léger."""
+    batch = tmp_path / "operations.txt"
+    batch.write_text('client search "foo\nuser list\n', encoding="utf-8")
+    connect = crm.connect
+    monkeypatch.setattr(crm, "connect", lambda: connect(server.path))
+    monkeypatch.setattr(crm, "load_token", lambda: "")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert crm.main(["batch", str(batch)]) == 1
+    finally:
+        server.shutdown()
+
+    first, second = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert first["ok"] is False and first["errors"] == ["No closing quotation"]
+    # La ligne suivante est bien transmise au serveur (refusée ici faute de token).
+    assert second["command"] == "user list" and second["errors"] == ["⚠️ Vous devez vous connecter !"]
+
+
+def test_socket_created_private(tmp_path, monkeypatch):
+    """Test que le socket est réservé à son propriétaire dès sa création, même avec un umask permissif."""
+    modes = []
+
+    class ProbeServer(CRMServer):
+        def server_activate(self):
+            modes.append(os.stat(self.path).st_mode & 0o777)
+            super().server_activate()
+
+    umask = os.umask(0o000)
+    try:
+        server = ProbeServer(str(tmp_path / "crm.sock"))
+    finally:
+        os.umask(umask)
+    server.server_close()
+
+    assert modes == [0o600]
+
+
+def test_remove_stale_socket(server, tmp_path):
+    """Test qu'un socket abandonné est supprimé et qu'un serveur actif n'est pas remplacé."""
+    stale = tmp_path / "stale.sock"
+    stale.write_text("")
+    remove_stale_socket(str(stale))
+    assert not stale.exists()
+
+    with pytest.raises(RuntimeError):
+        remove_stale_socket(server.path)
+
+
+def test_principal_kept_in_memory(server, token, tmp_path, monkeypatch):
+    """Test que l'utilisateur vérifié est gardé en mémoire, sans lire ni écrire le fichier de cache de session."""
+    calls = []
+    verify_token = AuthController.verify_token
+    monkeypatch.setattr(
+        AuthController, "verify_token", lambda self, *a, **kw: calls.append(kw) or verify_token(self, *a, **kw)
+    )
+
+    for _ in range(3):
+        assert json.loads(server.handle_request(json.dumps({"token": token, "argv": ["user", "list"]})))["ok"]
+
+    assert calls == [{"cache": False}]
+    assert not (tmp_path / ".session").exists()
+
+    server.verified_until[token] = 0
+    server.handle_request(json.dumps({"token": token, "argv": ["user", "list"]}))
+    assert len(calls) == 2, "Vérification renouvelée en base après expiration."
+
+
+def test_sessions_evicted(server, token, sample_commercial):
+    """Test que seuls les `max_sessions` utilisateurs les plus récents restent en mémoire."""
+    other = jwt.encode({"user_id": sample_commercial.id, "ver": 0}, TEST_SECRET_KEY, algorithm="HS256")
+    server.max_sessions = 1
+
+    for current in (token, other):
+        server.handle_request(json.dumps({"token": current, "argv": ["user", "list"]}))
+
+    assert list(server.commands) == [other] and list(server.verified_until) == [other]
+
+
+def test_handle_request_internal_error(server, token, monkeypatch):
+    """Test qu'une exception pendant une commande produit une réponse JSON d'erreur."""
+    monkeypatch.setattr(CommandController, "execute", lambda self, argv: 1 / 0)
+
+    response = json.loads(server.handle_request(json.dumps({"token": token, "argv": ["user", "list"]})))
+
+    assert response == {
+        "command": "user list",
+        "ok": False,
+        "data": None,
+        "messages": [],
+        "errors": ["Erreur interne : ZeroDivisionError"],
+    }
+
+
+def test_idle_connection_does_not_block(server):
+    """Test qu'une connexion ouverte mais inactive ne bloque pas les autres clients."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    idle = crm.connect(server.path)
+    try:
+        connection = crm.connect(server.path)
+        connection.settimeout(5)
+        with connection:
+            response = crm.send(connection, "", ["user", "list"])
+    finally:
+        idle.close()
+        server.shutdown()
+
+    assert response["command"] == "user list"
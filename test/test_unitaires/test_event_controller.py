@@ -314,3 +314,160 @@ def test_update_event_inexistant(event_controller_gestion, monkeypatch):
     assert "⚠️ Événement inexistant." in error_message[0], (
         "Le message d'erreur doit être affiché pour un événement inexistant."
     )
+
+
+def test_read_event_single_query(event_controller, sample_event, assert_max_queries, monkeypatch):
+    """Test que read_event affiche les événements en une seule requête."""
+
+    monkeypatch.setattr(event_controller, "check_permission", lambda _: True)
+
+    with assert_max_queries(1):
+        event_controller.read_event()
+
+
+async def test_filter_event_async(event_controller_gestion, event_controller_support, sample_event, async_database):
+    """Test le filtre asynchrone : non assignés pour la gestion, aucun pour un support sans événement."""
+    async_database()
+
+    assert [event.id for event in await event_controller_gestion.filter_event_async()] == [sample_event.id]
+    assert await event_controller_support.filter_event_async() == []
+
+
+async def test_events_per_support_async(event_controller_gestion, sample_event, sample_support, async_database):
+    """Test le décompte asynchrone des événements par support (None : non assignés)."""
+    sample_event.support_id = sample_support.id
+    async_database()
+
+    assert await event_controller_gestion.events_per_support_async() == [(sample_support.id, 1)]
+    assert [event.id for event in await event_controller_gestion.read_event_async()] == [sample_event.id]
+
+
+def _event(mock_session, contrat_id, name, start_hour, end_hour, support_id):
+    event = Event(
+        name=name,
+        contrat_id=contrat_id,
+        start_date=datetime(2025, 3, 15, start_hour),
+        end_date=datetime(2025, 3, 15, end_hour),
+        location="Lyon",
+        attendees=10,
+        support_id=support_id,
+    )
+    mock_session.add(event)
+    mock_session.commit()
+    return event
+
+
+def test_create_event_support_conflict(event_controller, sample_event, sample_support, mock_session, monkeypatch):
+    """Test qu'un événement n'est pas créé si son support est déjà pris sur ce créneau."""
+    sample_event.support_id = sample_support.id
+    mock_session.commit()
+    monkeypatch.setattr(
+        event_controller.view,
+        "input_event_info",
+        lambda contrats: (
+            sample_event.contrat_id,
+            "Conflit",
+            datetime(2025, 3, 15, 17, 0),
+            datetime(2025, 3, 15, 20, 0),
+            "Lyon",
+            10,
+            sample_support.id,
+            None,
+        ),
+    )
+    errors = []
+    monkeypatch.setattr(event_controller.view, "display_error_message", errors.append)
+
+    assert event_controller.create_event() is None
+    assert "Événement Test" in errors[0]
+    assert mock_session.query(Event).count() == 1
+
+
+def test_update_event_assign_support_conflict(event_controller_gestion, sample_event, sample_support, mock_session):
+    """Test que l'assignation est refusée si le support a déjà un événement qui chevauche, acceptée sinon."""
+    _event(mock_session, sample_event.contrat_id, "Atelier", 9, 11, sample_support.id)
+    _event(mock_session, sample_event.contrat_id, "Soirée", 18, 22, sample_support.id)
+    event_controller_gestion.view.input_support_assignment = lambda: sample_support.id
+
+    assert event_controller_gestion.update_event(sample_event.id) is None
+    assert sample_event.support_id is None
+
+    sample_event.start_date = datetime(2025, 3, 15, 11, 0)
+    mock_session.commit()
+    assert event_controller_gestion.update_event(sample_event.id).support_id == sample_support.id
+
+
+def test_support_conflicts(event_controller_gestion, sample_event, sample_support, mock_session):
+    """Test que les conflits d'un créneau sont ceux de l'IntervalIndex : bornes exclues, triés, événement ignoré."""
+    soiree = _event(mock_session, sample_event.contrat_id, "Soirée", 18, 22, sample_support.id)
+    atelier = _event(mock_session, sample_event.contrat_id, "Atelier", 9, 11, sample_support.id)
+    _event(mock_session, sample_event.contrat_id, "Matin", 7, 9, sample_support.id)
+    conflicts = event_controller_gestion.support_conflicts
+
+    assert conflicts(sample_support.id, datetime(2025, 3, 15, 9), datetime(2025, 3, 15, 19)) == [atelier, soiree]
+    assert conflicts(sample_support.id, datetime(2025, 3, 15, 10), datetime(2025, 3, 15, 12), atelier.id) == []
+
+
+def test_validate_schedule(event_controller_gestion, sample_event, sample_support, mock_session, capsys):
+    """Test la détection des chevauchements par support, avec et sans fenêtre de dates."""
+    first = _event(mock_session, sample_event.contrat_id, "Atelier", 9, 12, sample_support.id)
+    second = _event(mock_session, sample_event.contrat_id, "Déjeuner", 11, 14, sample_support.id)
+    _event(mock_session, sample_event.contrat_id, "Soirée", 18, 22, sample_support.id)
+
+    conflicts = event_controller_gestion.validate_schedule()
+
+    assert conflicts == [(sample_support.id, (first.id, "Atelier"), (second.id, "Déjeuner"))]
+    assert "1 chevauchement(s)" in capsys.readouterr().out
+    assert event_controller_gestion.validate_schedule(start_date=datetime(2025, 3, 15, 15, 0)) == []
+
+
+def test_auto_assign(event_controller_gestion, sample_event, sample_support, mock_session, capsys):
+    """Test l'assignation automatique : simulation sans enregistrement, puis attribution sans chevauchement."""
+    busy = _event(mock_session, sample_event.contrat_id, "Déjà planifié", 9, 12, sample_support.id)
+    free = _event(mock_session, sample_event.contrat_id, "Libre", 18, 20, None)
+
+    assert event_controller_gestion.auto_assign(dry_run=True) == ([(free.id, sample_support.id)], [sample_event.id])
+    mock_session.expire_all()
+    assert mock_session.get(Event, free.id).support_id is None
+    assert "Simulation" in capsys.readouterr().out
+
+    event_controller_gestion.auto_assign()
+    mock_session.expire_all()
+    assert mock_session.get(Event, free.id).support_id == sample_support.id
+    assert mock_session.get(Event, sample_event.id).support_id is None, "Conflit avec l'événement de 9h à 12h."
+    assert busy.support_id == sample_support.id
+
+
+def test_auto_assign_reserved_to_gestion(event_controller_support, sample_event, capsys):
+    """Test qu'un support ne peut pas lancer l'assignation automatique."""
+    assert event_controller_support.auto_assign() == ([], [])
+    assert "Seule la gestion" in capsys.readouterr().out
+
+
+def test_search_events_window_and_location(event_controller_gestion, sample_event, mock_session):
+    """Test le filtre par fenêtre (chevauchement, bornes exclues) et par lieu, trié par date de début."""
+    soiree = _event(mock_session, sample_event.contrat_id, "Soirée", 18, 22, None)
+    atelier = _event(mock_session, sample_event.contrat_id, "Atelier", 8, 9, None)
+
+    assert event_controller_gestion.search_events() == [atelier, sample_event, soiree]
+    assert event_controller_gestion.search_events(datetime(2025, 3, 15, 17), datetime(2025, 3, 15, 19)) == [
+        sample_event,
+        soiree,
+    ]
+    assert event_controller_gestion.search_events(start_date=datetime(2025, 3, 15, 18)) == [soiree]
+    assert event_controller_gestion.search_events(end_date=datetime(2025, 3, 15, 8)) == []
+    assert event_controller_gestion.search_events(location="Lyon") == [atelier, soiree]
+
+
+def test_browse_calendar_pages(event_controller_gestion, sample_event, mock_session, monkeypatch):
+    """Test la pagination par (date, id) : événements simultanés répartis sans doublon ni oubli."""
+    same_time = [_event(mock_session, sample_event.contrat_id, f"Stand {i}", 9, 10, None) for i in range(3)]
+    pages = []
+    monkeypatch.setattr(event_controller_gestion.view, "display_events", pages.append)
+    monkeypatch.setattr(event_controller_gestion.view, "ask_next_page", lambda: True)
+
+    assert event_controller_gestion.browse_calendar(page_size=2) == 4
+    assert pages == [same_time[:2], [same_time[2], sample_event]]
+
+    monkeypatch.setattr(event_controller_gestion.view, "ask_next_page", lambda: False)
+    assert event_controller_gestion.browse_calendar(location="Paris", page_size=1) == 1
@@ -0,0 +1,154 @@
+import csv
+import json
+import pytest
+from controller.export_controller import ExportController
+from model.contrat import Contrat
+from model.event import Event
+from datetime import datetime
+
+
+@pytest.fixture
+def export_controller(sample_user, mock_session, monkeypatch):
+    """Fixture qui retourne un ExportController (rôle gestion) avec la session de test."""
+
+    monkeypatch.setattr("controller.export_controller.DBSession", lambda: mock_session)
+    return ExportController(sample_user)
+
+
+@pytest.fixture
+def contrats(mock_session, sample_client):
+    """Fixture qui crée des contrats signés, non signés et soldés."""
+    contrats = [
+        Contrat(client_id=sample_client.id, total_amount=1000, remaining_amount=500, status=False),
+        Contrat(client_id=sample_client.id, total_amount=2000, remaining_amount=0, status=True),
+        Contrat(client_id=sample_client.id, total_amount=3000, remaining_amount=100, status=True),
+    ]
+    mock_session.add_all(contrats)
+    mock_session.commit()
+    return contrats
+
+
+def test_export_contrats_csv(export_controller, contrats, tmp_path):
+    """Test l'export CSV de tous les contrats par petits lots."""
+    path = tmp_path / "contrats.csv"
+
+    count = export_controller.export("contrats", str(path), batch_size=2)
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert count == 3
+    assert [int(row["id"]) for row in rows] == [c.id for c in contrats]
+    assert rows[0]["total_amount"] == "1000.00"
+
+
+def test_export_contrats_filter_jsonl(export_controller, contrats, tmp_path):
+    """Test que le filtre 'paiement_en_attente' est appliqué à l'export JSONL."""
+    path = tmp_path / "contrats.jsonl"
+
+    count = export_controller.export("contrats", str(path), filtre="paiement_en_attente")
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert count == 2
+    assert [row["id"] for row in rows] == [contrats[0].id, contrats[2].id]
+    assert "date_created" in rows[0] and "T" in rows[0]["date_created"], "Les dates sont au format ISO."
+
+
+def test_export_events_columnar(export_controller, mock_session, sample_contrat, sample_support, tmp_path):
+    """Test l'export colonnaire des événements non assignés."""
+    for i, support_id in enumerate([None, sample_support.id, None]):
+        mock_session.add(
+            Event(
+                name=f"Event {i}",
+                contrat_id=sample_contrat.id,
+                start_date=datetime(2025, 3, 1 + i, 10),
+                end_date=datetime(2025, 3, 1 + i, 18),
+                location="Paris",
+                attendees=10,
+                support_id=support_id,
+            )
+        )
+    mock_session.commit()
+    path = tmp_path / "events.cjsonl"
+
+    count = export_controller.export("events", str(path), filtre="unassigned", batch_size=1)
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    columns = lines[0]["columns"]
+    names = [value for group in lines[1:] for value in group[columns.index("name")]]
+    assert count == 2
+    assert names == ["Event 0", "Event 2"]
+
+
+def test_export_users_without_password(export_controller, sample_user, tmp_path):
+    """Test que l'export des utilisateurs inclut le rôle mais jamais le mot de passe."""
+    path = tmp_path / "users.jsonl"
+
+    export_controller.export("users", str(path))
+
+    row = json.loads(path.read_text(encoding="utf-8").splitlines()[0])
+    assert row["email"] == sample_user.email
+    assert row["role"] == "gestion"
+    assert "password" not in row
+
+
+@pytest.mark.parametrize(
+    "entity, filtre",
+    [("factures", None), ("contrats", "mine"), ("clients", "non_signes")],
+)
+def test_export_invalid_request(export_controller, tmp_path, entity, filtre, capsys):
+    """Test qu'une entité ou un filtre inconnu est refusé."""
+    assert export_controller.export(entity, str(tmp_path / "out.csv"), filtre=filtre) is None
+    assert "❌" in capsys.readouterr().out
+
+
+def test_export_permission_denied(export_controller, tmp_path, monkeypatch):
+    """Test que l'export est refusé sans la permission de lecture."""
+    monkeypatch.setattr(export_controller, "check_permission", lambda _: False)
+    path = tmp_path / "clients.csv"
+
+    assert export_controller.export("clients", str(path)) is None
+    assert not path.exists()
+
+
+def test_export_unknown_format(export_controller, tmp_path, capsys):
+    """Test qu'une extension inconnue produit un message d'erreur."""
+    assert export_controller.export("clients", str(tmp_path / "clients.xlsx")) is None
+    assert "Format de fichier non supporté" in capsys.readouterr().out
+
+
+def test_export_calendar(export_controller, mock_session, sample_contrat, sample_support, tmp_path):
+    """Test l'export iCalendar d'une fenêtre de dates, par lots, trié par date de début."""
+    for day in (20, 3, 10):
+        mock_session.add(
+            Event(
+                name=f"Event {day}",
+                contrat_id=sample_contrat.id,
+                start_date=datetime(2025, 3, day, 10),
+                end_date=datetime(2025, 3, day, 18),
+                location="Paris",
+                attendees=10,
+                support_id=sample_support.id if day == 10 else None,
+            )
+        )
+    mock_session.commit()
+    path = tmp_path / "planning.ics"
+
+    count = export_controller.export_calendar(str(path), start_date=datetime(2025, 3, 5), batch_size=1)
+
+    summaries = [line for line in path.read_text(encoding="utf-8").splitlines() if line.startswith("SUMMARY:")]
+    assert count == 2
+    assert summaries == ["SUMMARY:Event 10", "SUMMARY:Event 20"]
+
+    export_controller.user = sample_support
+    assert export_controller.export_calendar(str(path), mine=True) == 1
+
+
+def test_export_clients_without_search_key(export_controller, sample_client, tmp_path):
+    """Test que la clé de recherche interne n'apparaît pas dans l'export des clients."""
+    path = tmp_path / "clients.csv"
+
+    assert export_controller.export("clients", str(path)) == 1
+
+    with open(path, newline="", encoding="utf-8") as file:
+        header = next(csv.reader(file))
+    assert header == ["id", "name", "email", "phone", "company", "date_created", "date_updated", "commercial_id"]
@@ -0,0 +1,39 @@
+from datetime import datetime
+from utils.ics import escape_text, fold, write_ics
+
+
+def test_escape_text():
+    """Test l'échappement des caractères spéciaux d'une valeur texte iCalendar."""
+    assert escape_text("Salle 1, étage 2; accès\\nord\nParking") == "Salle 1\\, étage 2\\; accès\\\\nord\\nParking"
+
+
+def test_fold_utf8():
+    """Test le repli à 75 octets sans couper un caractère accentué."""
+    line = "DESCRIPTION:" + "é" * 80
+
+    folded = fold(line)
+
+    parts = folded.split("\r\n ")
+    assert folded.endswith("\r\n") and fold("SUMMARY:court") == "SUMMARY:court\r\n"
+    assert all(len(part.rstrip("\r\n").encode("utf-8")) <= 75 for part in parts)
+    assert "".join(part.rstrip("\r\n") for part in parts) == line
+
+
+def test_write_ics(tmp_path):
+    """Test l'écriture en flux d'un calendrier à partir de lots de lignes."""
+    path = tmp_path / "planning.ics"
+    batches = [
+        [(1, "Salon", datetime(2025, 3, 15, 10), datetime(2025, 3, 15, 18), "Paris", None)],
+        [(2, "Gala, soirée", datetime(2025, 3, 16, 19), datetime(2025, 3, 16, 23, 30), "Lyon", "Tenue\nde soirée")],
+    ]
+
+    assert write_ics(str(path), iter(batches)) == 2
+
+    content = path.read_bytes().decode("utf-8")
+    lines = content.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2:] == ["END:VCALENDAR", ""]
+    assert lines.count("BEGIN:VEVENT") == 2
+    assert "UID:event-2@crm.epicevents" in lines
+    assert "DTSTART:20250316T190000" in lines and "DTEND:20250316T233000" in lines
+    assert "SUMMARY:Gala\\, soirée" in lines and "DESCRIPTION:Tenue\\nde soirée" in lines
+    assert "DESCRIPTION" not in content.split("BEGIN:VEVENT")[1]
@@ -0,0 +1,26 @@
+from utils.password_hashing import build_hasher, calibrate, measure_hash
+
+
+def test_build_hasher_parameters():
+    """Test que le hasher encode les paramètres configurés dans le hash produit."""
+    hasher = build_hasher(time_cost=2, memory_cost=16, parallelism=1)
+    assert "$m=16,t=2,p=1$" in hasher.hash("securepass")
+
+
+def test_calibrate_reaches_target(monkeypatch):
+    """Test que la calibration s'arrête au premier time_cost atteignant la latence visée."""
+    monkeypatch.setattr("utils.password_hashing.measure_hash", lambda hasher, samples: hasher.time_cost * 40.0)
+
+    assert calibrate(target_ms=100, memory_cost=16, parallelism=1) == (3, 16, 1, 120.0)
+
+
+def test_calibrate_capped(monkeypatch):
+    """Test que la calibration ne dépasse pas max_time_cost si la cible est inatteignable."""
+    monkeypatch.setattr("utils.password_hashing.measure_hash", lambda hasher, samples: 1.0)
+
+    assert calibrate(target_ms=100, memory_cost=16, parallelism=1, max_time_cost=4) == (4, 16, 1, 1.0)
+
+
+def test_measure_hash_returns_duration():
+    """Test que la mesure retourne une durée positive en millisecondes."""
+    assert measure_hash(build_hasher(1, 8, 1), samples=2) > 0
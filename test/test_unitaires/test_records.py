@@ -0,0 +1,76 @@
+import json
+import pytest
+from datetime import datetime
+from utils.records import chunked, detect_format, read_records, text_field, write_records
+
+
+def test_detect_format():
+    """Test que le format est déduit de l'extension."""
+    assert detect_format("clients.csv") == "csv"
+    assert detect_format("clients.JSONL") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("clients.xlsx")
+
+
+def test_read_records_csv(tmp_path):
+    """Test la lecture d'un CSV avec numéros de ligne."""
+    path = tmp_path / "data.csv"
+    path.write_text("name,email\nA,a@test.com\nB,b@test.com\n", encoding="utf-8")
+
+    records = list(read_records(str(path)))
+
+    assert records == [(2, {"name": "A", "email": "a@test.com"}, None), (3, {"name": "B", "email": "b@test.com"}, None)]
+
+
+def test_read_records_jsonl_errors(tmp_path):
+    """Test qu'une ligne JSONL invalide produit une erreur sans arrêter la lecture."""
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"name": "A"}\n\n[1, 2]\n{invalide\n{"name": "B"}\n', encoding="utf-8")
+
+    records = list(read_records(str(path)))
+
+    assert [(line, record) for line, record, _ in records] == [
+        (1, {"name": "A"}),
+        (3, None),
+        (4, None),
+        (5, {"name": "B"}),
+    ]
+    assert records[2][2] is not None
+
+
+def test_chunked():
+    """Test le découpage en lots."""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_write_records_columnar(tmp_path):
+    """Test que le format colonnaire écrit l'en-tête puis un tableau par colonne et par lot."""
+    path = tmp_path / "data.cjsonl"
+    batches = iter([[(1, "A"), (2, "B")], [(3, datetime(2025, 1, 2, 3, 4))]])
+
+    count = write_records(str(path), ["id", "name"], batches)
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert count == 3
+    assert lines == [{"columns": ["id", "name"]}, [[1, 2], ["A", "B"]], [[3], ["2025-01-02T03:04:00"]]]
+
+
+def test_write_records_csv_roundtrip(tmp_path):
+    """Test qu'un fichier CSV écrit peut être relu par read_records."""
+    path = tmp_path / "data.csv"
+
+    write_records(str(path), ["name", "email"], [[("A", "a@test.com")]])
+
+    assert list(read_records(str(path))) == [(2, {"name": "A", "email": "a@test.com"}, None)]
+
+
+def test_text_field():
+    """Test la conversion des champs : texte nettoyé, nombres convertis, autres types refusés."""
+    record = {"name": "  A  ", "phone": 612345678, "company": None, "tags": ["x"], "vip": True}
+
+    assert (text_field(record, "name"), text_field(record, "phone")) == ("A", "612345678")
+    assert text_field(record, "company") == text_field(record, "email") == ""
+    for field in ("tags", "vip"):
+        with pytest.raises(ValueError):
+            text_field(record, field)
@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import update
+from controller.report_controller import ReportController
+from model.contrat import Contrat
+
+
+@pytest.fixture
+def report_controller(sample_user, mock_session, monkeypatch):
+    """Fixture qui retourne un ReportController (gestion) avec une session de test."""
+    for module in ("report_controller", "contrat_controller", "event_controller"):
+        monkeypatch.setattr(f"controller.{module}.DBSession", lambda: mock_session)
+    return ReportController(sample_user)
+
+
+async def test_collect_dashboard_concurrent(report_controller, sample_event, async_database):
+    """Test que les agrégats lancés en parallèle donnent le même résultat qu'en série."""
+    async_database()
+
+    dashboard = await report_controller.collect_dashboard()
+
+    assert dashboard == await report_controller.collect_dashboard(concurrent=False)
+    assert dashboard["contrats_par_statut"] == [(True, 1, 10000, 5000)]
+    assert dashboard["events_par_support"] == [(None, 1)]
+
+
+def test_show_dashboard(report_controller, sample_event, async_database, capsys):
+    """Test l'affichage du tableau de bord (boucle asyncio dédiée, moteur fermé à la fin)."""
+    async_database()
+
+    dashboard = report_controller.show_dashboard()
+
+    assert dashboard["reste_par_commercial"] == [(sample_event.contrat.client.commercial_id, 5000)]
+    output = capsys.readouterr().out
+    assert "✅ Signés : 1" in output and "Non assignés : 1" in output
+
+
+def test_show_dashboard_permission_denied(report_controller, monkeypatch, capsys):
+    """Test qu'un utilisateur sans accès aux contrats n'obtient pas le tableau de bord."""
+    monkeypatch.setattr(report_controller, "check_permission", lambda action: False)
+
+    assert report_controller.show_dashboard() is None
+    assert "Accès refusé" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "group_by, expected",
+    [
+        ("client", [(1, "Client Test", 2, 12000, 5000)]),
+        ("commercial", [(2, "Alice", 2, 12000, 5000)]),
+        ("status", [(False, 1, 2000, 0), (True, 1, 10000, 5000)]),
+    ],
+)
+def test_contrat_totals(report_controller, sample_event, mock_session, group_by, expected, capsys):
+    """Test les totaux par regroupement, lus dans la synthèse et identiques à l'agrégation directe."""
+    mock_session.add(Contrat(client_id=sample_event.contrat.client_id, total_amount=2000, remaining_amount=0))
+    mock_session.commit()
+
+    assert report_controller.contrat_totals(group_by) == expected
+    assert report_controller.contrat_totals(group_by, live=True) == expected
+    assert "Totaux des contrats" in capsys.readouterr().out
+
+
+def test_contrat_totals_per_month(report_controller, sample_client, mock_session):
+    """Test le regroupement par mois de création."""
+    for month, amount in [(1, 100), (1, 200), (3, 50)]:
+        contrat = Contrat(client_id=sample_client.id, total_amount=amount, remaining_amount=amount)
+        contrat.date_created = datetime(2025, month, 10)
+        mock_session.add(contrat)
+    mock_session.commit()
+
+    assert report_controller.contrat_totals("month") == [(2025, 1, 2, 300, 300), (2025, 3, 1, 50, 50)]
+
+
+def test_rebuild_summaries(report_controller, sample_contrat, mock_session):
+    """Test le recalcul de la synthèse après une modification hors ORM."""
+    mock_session.execute(update(Contrat).values(remaining_amount=0))
+
+    assert report_controller.rebuild_summaries() == 1
+    assert report_controller.contrat_totals("status") == [(False, 1, 10000, 0)]
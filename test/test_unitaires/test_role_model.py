@@ -1,5 +1,5 @@
 import pytest
-from model.role import Role
+from model.role import Role, RolePermission, load_permissions, reset_permissions
 
 
 @pytest.mark.parametrize(
@@ -81,3 +81,35 @@ def test_unknown_role():
     """Test que get_permissions() retourne un set vide pour un rôle inconnu."""
     role = Role(name="random_role")
     assert role.get_permissions() == set()
+
+
+def test_permissions_are_frozen():
+    """Test que les permissions compilées ne peuvent pas être modifiées."""
+    role = Role(name="support")
+    assert isinstance(role.get_permissions(), frozenset)
+    assert role.get_permissions() is Role(name="support").get_permissions(), "La table ne doit pas être reconstruite."
+
+
+def test_load_permissions_from_db(mock_session, role_support, role_commercial):
+    """Test que load_permissions remplace les permissions des rôles présents en base."""
+    mock_session.add(RolePermission(role_id=role_support.id, action="create_client"))
+    mock_session.commit()
+
+    try:
+        load_permissions(mock_session)
+        assert role_support.has_permission("create_client") is True
+        assert role_support.has_permission("read_event") is False, "Seules les permissions en base s'appliquent."
+        assert role_commercial.has_permission("create_client") is True, "Les autres rôles gardent leurs permissions."
+    finally:
+        reset_permissions()
+
+    assert role_support.has_permission("create_client") is False
+
+
+def test_load_permissions_empty_table(mock_session, role_gestion):
+    """Test qu'une table role_permissions vide conserve les permissions du code."""
+    try:
+        load_permissions(mock_session)
+        assert role_gestion.has_permission("create_user") is True
+    finally:
+        reset_permissions()
@@ -0,0 +1,91 @@
+import random
+from datetime import datetime, timedelta
+from utils.scheduling import IntervalIndex, assign_supports, build_schedule_index
+
+
+def _random_intervals(count, seed=0):
+    rng = random.Random(seed)
+    intervals = []
+    for i in range(count):
+        start = rng.randint(0, 1_000)
+        intervals.append((start, start + rng.randint(0, 40), i))
+    return intervals
+
+
+def test_overlapping_matches_brute_force():
+    """Vérifie que l'index trouve exactement les intervalles chevauchant chaque fenêtre."""
+    intervals = _random_intervals(500)
+    index = IntervalIndex(intervals)
+    rng = random.Random(1)
+
+    for _ in range(200):
+        start = rng.randint(-50, 1_050)
+        end = start + rng.randint(1, 60)
+        expected = sorted((s, v) for s, e, v in intervals if s < end and e > start)
+        assert index.overlapping(start, end) == [v for _, v in expected]
+
+
+def test_overlapping_half_open():
+    """Vérifie qu'un événement qui finit quand l'autre commence n'est pas un chevauchement."""
+    nine, ten, eleven = (datetime(2025, 6, 1, hour) for hour in (9, 10, 11))
+    index = IntervalIndex([(nine, ten, "matin"), (ten, eleven, "suite")])
+
+    assert index.overlapping(ten, eleven) == ["suite"]
+    assert index.overlapping(nine, eleven) == ["matin", "suite"]
+    assert IntervalIndex([]).overlapping(nine, ten) == []
+
+
+def test_conflicts_matches_brute_force():
+    """Vérifie que toutes les paires d'intervalles qui se chevauchent sont détectées, une seule fois."""
+    intervals = _random_intervals(300, seed=2)
+    expected = {
+        frozenset((a[2], b[2]))
+        for i, a in enumerate(intervals)
+        for b in intervals[i + 1 :]
+        if a[0] < b[1] and b[0] < a[1]
+    }
+
+    conflicts = IntervalIndex(intervals).conflicts()
+
+    assert len(conflicts) == len(expected)
+    assert {frozenset(pair) for pair in conflicts} == expected
+
+
+def test_build_schedule_index():
+    """Vérifie le regroupement des intervalles par clé."""
+    start = datetime(2025, 6, 1)
+    rows = [(7, start, start + timedelta(hours=2), 1), (8, start, start + timedelta(hours=1), 2)]
+    rows.append((7, start + timedelta(hours=1), start + timedelta(hours=3), 3))
+
+    index = build_schedule_index(rows)
+
+    assert sorted(index) == [7, 8]
+    assert index[7].conflicts() == [(1, 3)]
+    assert index[8].conflicts() == []
+
+
+def test_assign_supports_without_overlap():
+    """Vérifie que la répartition n'introduit aucun chevauchement et équilibre la charge."""
+    intervals = _random_intervals(400, seed=3)
+    events = [(value, start, end) for start, end, value in intervals]
+
+    assignments, unassigned = assign_supports(events, supports=range(25))
+
+    assert len(assignments) + len(unassigned) == len(events)
+    per_support = build_schedule_index(
+        (support, intervals[event_id][0], intervals[event_id][1], event_id) for event_id, support in assignments
+    )
+    assert all(index.conflicts() == [] for index in per_support.values())
+    counts = sorted(len(index) for index in per_support.values())
+    assert counts[-1] - counts[0] <= 2, f"Charge déséquilibrée : {counts}"
+
+
+def test_assign_supports_respects_existing_schedule():
+    """Vérifie que le planning existant et la charge initiale sont pris en compte."""
+    busy = {1: IntervalIndex([(0, 10, 100)])}
+    events = [(1, 5, 8), (2, 5, 8), (3, 20, 30)]
+
+    assignments, unassigned = assign_supports(events, [1, 2], busy=busy, loads={1: 1})
+
+    assert assignments == [(1, 2), (3, 1)]
+    assert unassigned == [2], "Aucun support libre de 5 à 8 après la première attribution."
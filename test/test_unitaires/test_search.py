@@ -0,0 +1,21 @@
+from utils.search import client_search_key, match_expression, normalize, search_terms
+
+
+def test_normalize():
+    """Test la normalisation : minuscules, sans accents, espaces réduits."""
+    assert normalize("  Élodie   DUPONT-Ça ") == "elodie dupont-ca"
+    assert normalize(None) == ""
+
+
+def test_client_search_key():
+    """Test la clé de recherche d'un client, téléphone aussi en chiffres seuls."""
+    assert client_search_key("Léa", "Lea@Test.fr", None, "06 12") == "lea lea@test.fr 06 12 0612"
+
+
+def test_search_terms_and_match_expression():
+    """Test le découpage des termes et la syntaxe plein texte de chaque base."""
+    terms = search_terms('Château "évent" chateau')
+
+    assert terms == ["chateau", "event"]
+    assert match_expression("sqlite", terms) == '"chateau" "event"'
+    assert match_expression("mysql", terms) == '+"chateau" +"event"'
@@ -0,0 +1,63 @@
+import json
+import time
+import pytest
+from utils.session_cache import Principal, clear_session_cache, read_session_cache, write_session_cache
+
+SECRET = "test_secret_key"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Chemin temporaire du cache de session."""
+    return str(tmp_path / ".session")
+
+
+def test_write_and_read_session_cache(cache_path, sample_user):
+    """Test que le cache restitue l'identité et les permissions de l'utilisateur."""
+    write_session_cache(cache_path, "token", SECRET, sample_user, time.time() + 3600)
+
+    principal = read_session_cache(cache_path, "token", SECRET, ttl=300)
+
+    assert isinstance(principal, Principal)
+    assert (principal.id, principal.name, principal.email) == (sample_user.id, sample_user.name, sample_user.email)
+    assert principal.role.get_permissions() == sample_user.role.get_permissions()
+
+
+@pytest.mark.parametrize(
+    "token, secret, ttl, expires_in",
+    [
+        ("autre_token", SECRET, 300, 3600),
+        ("token", "autre_cle", 300, 3600),
+        ("token", SECRET, 0, 3600),
+        ("token", SECRET, 300, -1),
+    ],
+    ids=["token_different", "cle_differente", "ttl_depasse", "token_expire"],
+)
+def test_read_session_cache_rejected(cache_path, sample_user, token, secret, ttl, expires_in):
+    """Test que le cache est ignoré s'il ne correspond plus au token, à la clé ou à la durée de validité."""
+    write_session_cache(cache_path, "token", SECRET, sample_user, time.time() + expires_in)
+
+    assert read_session_cache(cache_path, token, secret, ttl) is None
+
+
+def test_read_session_cache_tampered(cache_path, sample_user):
+    """Test qu'un cache modifié à la main (élévation de rôle) est rejeté."""
+    write_session_cache(cache_path, "token", SECRET, sample_user, time.time() + 3600)
+    with open(cache_path, encoding="utf-8") as file:
+        content = json.load(file)
+    content["data"]["permissions"].append("delete_everything")
+    with open(cache_path, "w", encoding="utf-8") as file:
+        json.dump(content, file)
+
+    assert read_session_cache(cache_path, "token", SECRET, ttl=300) is None
+
+
+def test_read_session_cache_missing_or_corrupted(cache_path):
+    """Test qu'un cache absent ou illisible est ignoré."""
+    assert read_session_cache(cache_path, "token", SECRET, ttl=300) is None
+    with open(cache_path, "w", encoding="utf-8") as file:
+        file.write("pas du json")
+    assert read_session_cache(cache_path, "token", SECRET, ttl=300) is None
+
+    clear_session_cache(cache_path)
+    clear_session_cache(cache_path)
@@ -0,0 +1,87 @@
+import json
+import pytest
+from utils.telemetry import AuditEmitter, FileSink, parse_sample_rates
+
+
+class RecordingSink:
+    """Destinataire de test qui mémorise les lots reçus."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def send(self, events):
+        if self.fail:
+            raise ConnectionError("Réseau indisponible")
+        self.batches.append(list(events))
+
+
+def test_emit_is_batched_in_background():
+    """Test que les événements sont envoyés par lots depuis le thread de fond."""
+    sink = RecordingSink()
+    emitter = AuditEmitter(sink, batch_size=2, flush_interval=0.05)
+
+    for i in range(5):
+        assert emitter.emit("client_created", f"Client {i}") is True
+    emitter.close()
+
+    messages = [event["message"] for batch in sink.batches for event in batch]
+    assert messages == [f"Client {i}" for i in range(5)], "Tous les événements doivent être envoyés dans l'ordre."
+    assert all(len(batch) <= 2 for batch in sink.batches), "Les lots ne doivent pas dépasser batch_size."
+
+
+def test_emit_sampling():
+    """Test qu'un taux d'échantillonnage nul écarte les événements de ce type uniquement."""
+    sink = RecordingSink()
+    emitter = AuditEmitter(sink, sample_rates={"client_updated": 0.0})
+
+    assert emitter.emit("client_updated", "ignoré") is False
+    assert emitter.emit("client_created", "conservé") is True
+    emitter.close()
+
+    assert [event["message"] for batch in sink.batches for event in batch] == ["conservé"]
+
+
+def test_emit_queue_full():
+    """Test qu'une file pleine écarte l'événement sans bloquer et le comptabilise."""
+    emitter = AuditEmitter(RecordingSink(), max_queue=1)
+    emitter._start_worker = lambda: None
+
+    assert emitter.emit("client_created", "premier") is True
+    assert emitter.emit("client_created", "second") is False
+    assert emitter.dropped == 1
+
+
+def test_emit_without_sink():
+    """Test que l'émetteur est inactif sans destinataire configuré."""
+    emitter = AuditEmitter(None)
+    assert emitter.emit("client_created", "message") is False
+    assert emitter.queue.empty()
+
+
+def test_fallback_to_file_sink(tmp_path):
+    """Test que les lots sont écrits dans le fichier de repli si le destinataire principal échoue."""
+    path = tmp_path / "audit.log"
+    emitter = AuditEmitter(RecordingSink(fail=True), fallback=FileSink(str(path)), flush_interval=0.05)
+
+    emitter.emit("contrat_updated", "Contrat 1 mis à jour.", level="warning")
+    emitter.close()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["type"] == "contrat_updated"
+    assert lines[0]["message"] == "Contrat 1 mis à jour."
+    assert lines[0]["level"] == "warning"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", {}),
+        ("client_updated=0.5", {"client_updated": 0.5}),
+        ("client_updated=0.5, event_updated=0", {"client_updated": 0.5, "event_updated": 0.0}),
+    ],
+)
+def test_parse_sample_rates(value, expected):
+    """Test la lecture de la configuration d'échantillonnage."""
+    assert parse_sample_rates(value) == expected
@@ -1,3 +1,6 @@
+from utils.password_hashing import build_hasher
+
+
 def test_user_init(sample_user):
     """Test la création d'un utilisateur."""
     assert sample_user.name == "John Doe"
@@ -21,3 +24,15 @@ def test_user_repr(sample_user):
     """Test la représentation textuelle (__repr__) de l'utilisateur."""
     expected_repr = f"<User(id={sample_user.id}, name={sample_user.name}, email={sample_user.email}, role_id={sample_user.role_id})>"
     assert repr(sample_user) == expected_repr
+
+
+def test_needs_rehash_after_parameter_change(sample_user, monkeypatch):
+    """Test qu'un hash calculé avec d'anciens paramètres Argon2 est signalé, puis plus après re-hachage."""
+    assert sample_user.needs_rehash() is False
+
+    monkeypatch.setattr("model.user.ph", build_hasher(time_cost=1, memory_cost=8, parallelism=1))
+
+    assert sample_user.needs_rehash() is True
+    assert sample_user.check_password("securepass") is True, "L'ancien hash doit rester vérifiable."
+    sample_user.password = sample_user.set_password("securepass")
+    assert sample_user.needs_rehash() is False
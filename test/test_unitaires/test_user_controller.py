@@ -1,13 +1,16 @@
 import pytest
 from controller.user_controller import UserController
 from model.user import User
+from model.client import Client
+from utils.password_hashing import build_hasher
 
 
 @pytest.fixture
-def user_controller(sample_user, mock_session, monkeypatch):
+def user_controller(sample_user, mock_session, monkeypatch, tmp_path):
     """Crée une instance de UserController en réutilisant sample_user et mock_session."""
 
     monkeypatch.setattr("controller.user_controller.DBSession", lambda: mock_session)
+    monkeypatch.setattr("controller.user_controller.SESSION_CACHE_FILE", str(tmp_path / ".session"))
     controller = UserController(sample_user)
     monkeypatch.setattr(controller.view, "input_infos_user", lambda: ("Alice", "alice@example.com", "securepass"))
     monkeypatch.setattr(controller.view, "choose_role", lambda: "commercial")
@@ -145,6 +148,7 @@ def test_update_user_success(user_controller, mock_session, sample_user, monkeyp
     assert updated_user.name == "John Updated"
     assert updated_user.email == "updated@doe.com"
     assert updated_user.check_password("newpass") is True
+    assert updated_user.token_version == 1, "Les sessions ouvertes avant la modification doivent être invalidées."
 
 
 def test_update_user_not_found(user_controller, mock_session, monkeypatch):
@@ -180,3 +184,81 @@ def test_update_user_permission_denied(user_controller, monkeypatch):
     monkeypatch.setattr(user_controller, "check_permission", lambda action: False)
     result = user_controller.update_user(1)
     assert result is None, "La fonction devrait retourner None lorsque la permission est refusée."
+
+
+def test_user_listings_no_n_plus_one(user_controller, mock_session, role_commercial, assert_max_queries, monkeypatch):
+    """Test que list_users et get_user_details chargent les relations affichées en amont."""
+
+    commercial = User(name="Commercial", email="c@example.com", password="pass", role_id=role_commercial.id)
+    mock_session.add(commercial)
+    mock_session.commit()
+    mock_session.add_all(
+        [Client(name=f"Client {i}", email=f"client{i}@test.com", commercial_id=commercial.id) for i in range(3)]
+    )
+    mock_session.commit()
+    commercial_id = commercial.id
+    mock_session.expunge_all()
+
+    monkeypatch.setattr(user_controller, "check_permission", lambda _: True)
+
+    with assert_max_queries(1):
+        user_controller.list_users()
+    mock_session.expunge_all()
+    with assert_max_queries(3):
+        user_controller.get_user_details(commercial_id)
+
+
+@pytest.fixture
+def users_file(tmp_path, sample_user):
+    """Fichier CSV d'utilisateurs mêlant lignes valides et invalides."""
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "name,email,password,role\n"
+        "Alice,alice@test.com,pass1,commercial\n"
+        "Bob,bob@test.com,pass2,support\n"
+        f"Existant,{sample_user.email},pass3,gestion\n"
+        "Alice bis,alice@test.com,pass4,commercial\n"
+        "Sans mot de passe,nopass@test.com,,support\n"
+        "Mauvais rôle,role@test.com,pass5,admin\n"
+        "Chloé,chloe@test.com,pass6,gestion\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2], ids=["serie", "pool"])
+def test_import_users(user_controller, mock_session, users_file, role_commercial, role_support, monkeypatch, workers):
+    """Teste la création en masse : hachage (en série ou dans un pool de processus) et erreurs par ligne."""
+    monkeypatch.setattr("model.user.ph", build_hasher(time_cost=1, memory_cost=8, parallelism=1))
+
+    inserted, errors = user_controller.import_users(str(users_file), batch_size=3, workers=workers)
+
+    assert inserted == 3, "Trois utilisateurs valides doivent être créés."
+    assert [line for line, _ in errors] == [4, 5, 6, 7]
+    alice = mock_session.query(User).filter_by(email="alice@test.com").one()
+    assert alice.role_id == role_commercial.id
+    assert alice.token_version == 0
+    assert alice.check_password("pass1") is True
+    assert mock_session.query(User).filter_by(email="bob@test.com").one().check_password("pass2") is True
+
+
+def test_import_users_permission_denied(user_controller, users_file, monkeypatch):
+    """Test que import_users est refusé sans la permission create_user."""
+    monkeypatch.setattr(user_controller, "check_permission", lambda action: False)
+    assert user_controller.import_users(str(users_file)) is None
+
+
+def test_import_users_invalid_types(user_controller, mock_session, role_support, tmp_path, monkeypatch):
+    """Test qu'un champ non textuel (JSONL) est signalé sur sa ligne sans interrompre l'import."""
+    monkeypatch.setattr("model.user.ph", build_hasher(time_cost=1, memory_cost=8, parallelism=1))
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        '{"name": "Alice", "email": "alice@test.com", "password": 1234, "role": "support"}\n'
+        '{"name": {"x": 1}, "email": "objet@test.com", "password": "p", "role": "support"}\n',
+        encoding="utf-8",
+    )
+
+    inserted, errors = user_controller.import_users(str(path), workers=1)
+
+    assert (inserted, errors) == (1, [(2, "Champ name : texte attendu.")])
+    assert mock_session.query(User).filter_by(email="alice@test.com").one().check_password("1234") is True
@@ -1,9 +1,10 @@
 import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-import sentry_sdk
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
 
 
 current_dir = os.path.dirname(__file__)
@@ -14,20 +15,243 @@ load_dotenv(dotenv_path)
 Base = declarative_base()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Moteur asynchrone (rapports concurrents) : déduit de DATABASE_URL si non renseigné.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
 SECRET_KEY = os.getenv("SECRET_KEY")
 SENTRY = os.getenv("SENTRY")
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", "50"))
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+SESSION_CACHE_FILE = os.getenv("SESSION_CACHE_FILE", ".session")
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", "300"))
+DAEMON_SOCKET = os.getenv("DAEMON_SOCKET", ".crm.sock")
+# Serveur local : fermeture des connexions inactives (secondes) et nombre d'utilisateurs gardés en mémoire.
+DAEMON_IDLE_TIMEOUT = float(os.getenv("DAEMON_IDLE_TIMEOUT", "300"))
+DAEMON_MAX_SESSIONS = int(os.getenv("DAEMON_MAX_SESSIONS", "100"))
+# Paramètres Argon2 (valeurs par défaut de argon2-cffi) : `python main.py calibrate-hash` aide à les choisir.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+# Processus de hachage pour la création d'utilisateurs en masse (0 : un par cœur).
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", "0"))
+DB_PERMISSIONS = os.getenv("DB_PERMISSIONS", "false").lower() in ("1", "true", "yes")
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0"))
+TELEMETRY_FILE = os.getenv("TELEMETRY_FILE")
+TELEMETRY_BATCH_SIZE = int(os.getenv("TELEMETRY_BATCH_SIZE", "50"))
+TELEMETRY_FLUSH_INTERVAL = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "2"))
+TELEMETRY_QUEUE_SIZE = int(os.getenv("TELEMETRY_QUEUE_SIZE", "1000"))
+TELEMETRY_SAMPLING = os.getenv("TELEMETRY_SAMPLING", "")
 
-engine = create_engine(DATABASE_URL, echo=False)
-Session = sessionmaker(bind=engine)
+_engine = None
 
-if SENTRY:
+
+def engine_options(database_url):
+    """Retourne les options du pool de connexions (SQLite garde son pool par défaut)."""
+    if database_url and database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "1")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "2")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_pre_ping": True,
+    }
+
+
+def get_engine():
+    """Crée le moteur SQLAlchemy à la première utilisation (le driver n'est importé qu'à ce moment)."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, echo=False, **engine_options(DATABASE_URL))
+    return _engine
+
+
+# Pilote asynchrone correspondant à chaque pilote synchrone.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mysql+mysqlconnector": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def async_database_url(database_url):
+    """Retourne l'URL de la même base avec le pilote asynchrone (aiosqlite, aiomysql)."""
+    scheme, separator, rest = database_url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+
+def get_async_engine():
+    """Crée le moteur asynchrone à la première utilisation (SQLAlchemy asyncio n'est importé qu'à ce moment)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = ASYNC_DATABASE_URL or async_database_url(DATABASE_URL)
+        _async_engine = create_async_engine(url, **engine_options(url))
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_engine
+
+
+def async_session():
+    """Nouvelle AsyncSession : une par requête concurrente, une AsyncSession ne pouvant servir qu'une tâche."""
+    get_async_engine()
+    return _async_session_factory()
+
+
+async def dispose_async_engine():
+    """Ferme les connexions du moteur asynchrone."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+def __getattr__(name):
+    """Expose `engine` comme attribut du module tout en retardant sa création."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_session_factory = sessionmaker()
+
+
+def _new_session():
+    """Crée la session partagée, liée au moteur au moment de son premier usage."""
+    return _session_factory(bind=get_engine())
+
+
+# Une seule session par processus (par thread), partagée par tous les contrôleurs.
+Session = scoped_session(_new_session)
+
+
+class _CountingCursor:
+    """Enveloppe le curseur DBAPI d'un SELECT pour compter les lignes effectivement lues."""
+
+    def __init__(self, cursor, profile):
+        self._cursor = cursor
+        self._profile = profile
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._profile.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._profile.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._profile.rows += len(rows)
+        return rows
+
+
+class QueryProfile:
+    """Requêtes SQL exécutées pendant une action : nombre, durée totale, plus lentes et lignes lues."""
+
+    def __init__(self):
+        self.statements = []
+        self.durations = []
+        self.rows = 0
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def total_ms(self):
+        return sum(self.durations)
+
+    def slowest(self, limit=5):
+        """Retourne les `limit` requêtes les plus lentes sous forme de (durée en ms, requête)."""
+        return sorted(zip(self.durations, self.statements), reverse=True)[:limit]
+
+    def report(self, limit=5):
+        """Résumé lisible du profil, requêtes les plus lentes en tête."""
+        lines = [f"📊 {self.count} requête(s) SQL, {self.total_ms:.1f} ms, {self.rows} ligne(s) lue(s)"]
+        for duration, statement in self.slowest(limit):
+            lines.append(f"   {duration:8.2f} ms  {' '.join(statement.split())[:120]}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_queries(bind=None):
+    """Enregistre les requêtes exécutées sur le moteur (celui de l'application par défaut) pendant le bloc."""
+    bind = bind if bind is not None else get_engine()
+    profile = QueryProfile()
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        profile.statements.append(statement)
+        profile.durations.append((time.perf_counter() - conn.info["query_start"].pop()) * 1000)
+        if context is not None and cursor.description is not None:
+            context.cursor = _CountingCursor(cursor, profile)
+
+    event.listen(bind, "before_cursor_execute", _before)
+    event.listen(bind, "after_cursor_execute", _after)
     try:
+        yield profile
+    finally:
+        event.remove(bind, "before_cursor_execute", _before)
+        event.remove(bind, "after_cursor_execute", _after)
+
+
+# Activé par l'option `--profile` : chaque action (session_scope) affiche son profil SQL sur stderr.
+PROFILE_ACTIONS = False
+
+
+@contextmanager
+def session_scope():
+    """Délimite une action : valide (ou annule) la transaction puis rend la connexion au pool."""
+    session = Session()
+    with profile_queries() if PROFILE_ACTIONS else nullcontext() as profile:
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if profile:
+                # Sur stderr : la sortie standard des commandes reste lisible par un programme (JSON, CSV).
+                print(profile.report(), file=sys.stderr)
+
+
+def close_sessions():
+    """Ferme la session partagée et libère les connexions du pool."""
+    Session.remove()
+    if _engine is not None:
+        _engine.dispose()
+
+
+def init_sentry(command=None):
+    """Active Sentry si un DSN est configuré (le SDK n'est importé que dans ce cas)."""
+    if not SENTRY:
+        return
+    try:
+        import sentry_sdk
+        from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
         sentry_sdk.init(
             dsn=SENTRY,
             integrations=[SqlalchemyIntegration()],
-            traces_sample_rate=1,
+            traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
             send_default_pii=False,
         )
+        sentry_sdk.set_context("CLI Command", {"command": command or "Menu principal"})
         print("✅ Sentry activé avec Sqlalchemy")
     except Exception as e:
         print(f"❌ Erreur d'initialisation de Sentry : {e}")
@@ -0,0 +1,156 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from controller.auth_controller import AuthController
+from controller.command_controller import CommandController
+from utils.config import (
+    DAEMON_IDLE_TIMEOUT,
+    DAEMON_MAX_SESSIONS,
+    DAEMON_SOCKET,
+    SESSION_CACHE_TTL,
+    session_scope,
+)
+from view.json_view import JsonView
+
+
+class CRMRequestHandler(socketserver.StreamRequestHandler):
+    """Traite une connexion : une requête JSON par ligne, une réponse JSON par ligne.
+
+    Chaque connexion a son thread ; une connexion inactive plus de DAEMON_IDLE_TIMEOUT secondes est fermée.
+    """
+
+    timeout = DAEMON_IDLE_TIMEOUT
+
+    def handle(self):
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response = self.server.execute(line)
+                self.wfile.write(response.encode("utf-8") + b"\n")
+                self.wfile.flush()
+        except (TimeoutError, ConnectionError):
+            return
+
+
+class CRMServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serveur local (socket Unix) qui garde moteur, pool, permissions et contrôleurs en mémoire.
+
+    Chaque requête `{"token": ..., "argv": [...]}` est authentifiée par son token puis exécutée par le
+    CommandController de cet utilisateur, réutilisé d'une requête à l'autre. Les connexions sont lues
+    dans des threads séparés (un client inactif ne bloque pas les autres) mais les requêtes sont
+    exécutées une par une par un même thread de travail (session SQLAlchemy partagée). Les
+    utilisateurs vérifiés restent en mémoire SESSION_CACHE_TTL secondes, dans la limite de
+    `max_sessions` (les moins récemment utilisés sont oubliés). Le socket n'est accessible qu'à son
+    propriétaire.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path=DAEMON_SOCKET, max_sessions=DAEMON_MAX_SESSIONS, principal_ttl=SESSION_CACHE_TTL):
+        self.path = path
+        self.max_sessions = max_sessions
+        self.principal_ttl = principal_ttl
+        # token -> CommandController, du moins au plus récemment utilisé ; token -> fin de validité.
+        self.commands = OrderedDict()
+        self.verified_until = {}
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        remove_stale_socket(path)
+        super().__init__(path, CRMRequestHandler)
+
+    def server_bind(self):
+        # Le socket est créé directement en 0600 : aucun instant où un autre utilisateur pourrait s'y connecter.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def execute(self, line):
+        """Exécute une requête sur le thread de travail et retourne sa réponse."""
+        return self.worker.submit(self.handle_request, line).result()
+
+    def handle_request(self, line):
+        """Retourne la réponse JSON (une ligne) à une requête du client."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                request = json.loads(line)
+                token, argv = request["token"], list(request["argv"])
+            except (ValueError, KeyError, TypeError):
+                JsonView().display_result("", errors=["Requête invalide."])
+            else:
+                try:
+                    # Jamais de repli sur le token local du serveur : chaque requête apporte le sien.
+                    commands = self.authenticate(token) if token else None
+                    if commands is None:
+                        JsonView().display_result(" ".join(map(str, argv)), errors=["⚠️ Vous devez vous connecter !"])
+                    else:
+                        commands.execute(argv)
+                except Exception as e:
+                    JsonView().display_result(
+                        " ".join(map(str, argv)), errors=[f"Erreur interne : {e.__class__.__name__}"]
+                    )
+        return output.getvalue().strip().splitlines()[-1]
+
+    def authenticate(self, token):
+        """Vérifie le token et retourne le CommandController de l'utilisateur.
+
+        La signature et l'expiration du token sont contrôlées à chaque requête ; l'utilisateur (et sa
+        version de session) n'est relu en base qu'une fois par `principal_ttl`, sans fichier de cache.
+        """
+        auth = AuthController()
+        if not auth.decode_token(token):
+            self.forget(token)
+            return None
+        commands = self.commands.get(token)
+        if commands is not None and self.verified_until[token] > time.monotonic():
+            self.commands.move_to_end(token)
+            return commands
+
+        with session_scope():
+            user = auth.verify_token(token, cache=False)
+        if not user:
+            self.forget(token)
+            return None
+        if commands is None:
+            commands = self.commands[token] = CommandController(user)
+        else:
+            for controller in (commands, *commands.controllers.values()):
+                controller.user = user
+            self.commands.move_to_end(token)
+        self.verified_until[token] = time.monotonic() + self.principal_ttl
+        while len(self.commands) > self.max_sessions:
+            oldest, _ = self.commands.popitem(last=False)
+            self.verified_until.pop(oldest, None)
+        return commands
+
+    def forget(self, token):
+        """Oublie l'utilisateur d'un token refusé."""
+        self.commands.pop(token, None)
+        self.verified_until.pop(token, None)
+
+    def server_close(self):
+        super().server_close()
+        self.worker.shutdown()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+def remove_stale_socket(path):
+    """Supprime le socket d'un serveur arrêté ; refuse de démarrer si un serveur répond déjà."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise RuntimeError(f"Un serveur CRM écoute déjà sur {path}.")
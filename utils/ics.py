@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+PRODID = "-//Epic Events//CRM//FR"
+# Longueur maximale d'une ligne iCalendar en octets (RFC 5545, §3.1), hors CRLF.
+LINE_LIMIT = 75
+
+
+def escape_text(value):
+    """Échappe une valeur texte iCalendar (barre oblique inverse, point-virgule, virgule, retour à la ligne)."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def format_datetime(value):
+    """Date-heure locale (« flottante ») au format iCalendar AAAAMMJJTHHMMSS."""
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def fold(line):
+    """Replie une ligne à 75 octets, les suites commençant par une espace, sans couper un caractère UTF-8."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_LIMIT:
+        return line + "\r\n"
+    parts, start, limit = [], 0, LINE_LIMIT
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, LINE_LIMIT - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def event_lines(event_id, name, start_date, end_date, location, notes, stamp, domain="crm.epicevents"):
+    """Lignes VEVENT d'un événement."""
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event_id}@{domain}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{format_datetime(start_date)}",
+        f"DTEND:{format_datetime(end_date)}",
+        f"SUMMARY:{escape_text(name)}",
+        f"LOCATION:{escape_text(location)}",
+    ]
+    if notes:
+        lines.append(f"DESCRIPTION:{escape_text(notes)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def write_ics(path, batches, name="Epic Events"):
+    """Écrit un calendrier .ics au fil de l'eau à partir de lots de lignes et retourne le nombre d'événements.
+
+    Chaque ligne est un tuple (id, nom, début, fin, lieu, notes) ; seul le lot courant est en mémoire.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        header = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN"]
+        file.writelines(fold(line) for line in [*header, f"X-WR-CALNAME:{escape_text(name)}"])
+        for batch in batches:
+            for row in batch:
+                file.writelines(fold(line) for line in event_lines(*row, stamp=stamp))
+            count += len(batch)
+        file.write(fold("END:VCALENDAR"))
+    return count
@@ -0,0 +1,159 @@
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import Session
+from model.schema_version import SchemaVersion
+from utils.config import Base
+from utils.populate_database import seed_roles, seed_admin_user
+
+SCHEMA_VERSION_ID = 1
+
+
+def create_schema(session: Session):
+    """Crée les tables manquantes puis les rôles et l'administrateur par défaut."""
+    Base.metadata.create_all(session.connection())
+    session.commit()
+    # Base antérieure au suivi des versions : le modèle User complet (token_version...) doit pouvoir être lu.
+    add_missing_columns(session)
+    seed_roles(session)
+    seed_admin_user(session)
+
+
+def create_missing_indexes(session: Session):
+    """Crée les index déclarés sur les modèles qui n'existent pas encore en base."""
+    connection = session.connection()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    session.commit()
+
+
+def add_missing_columns(session: Session):
+    """Ajoute aux tables existantes les colonnes déclarées sur les modèles qui leur manquent."""
+    connection = session.connection()
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                definition = CreateColumn(column).compile(dialect=connection.dialect)
+                connection.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}"))
+    session.commit()
+
+
+def create_contrat_summaries(session: Session):
+    """Crée la table de synthèse des contrats puis la calcule à partir des contrats existants."""
+    # Import local : les modèles de contrats importent utils, qui importe ce module.
+    from model.contrat_summary import rebuild_contrat_summaries
+
+    Base.metadata.create_all(session.connection())
+    session.commit()
+    rebuild_contrat_summaries(session)
+
+
+def convert_amounts_to_cents(session: Session):
+    """Passe les montants des contrats de flottants en euros à des centimes entiers, puis recalcule la synthèse."""
+    from model.contrat_summary import ContratSummary, rebuild_contrat_summaries
+
+    connection = session.connection()
+    preparer = connection.dialect.identifier_preparer
+    contrats = Base.metadata.tables["contrats"]
+    table = preparer.format_table(contrats)
+    for name in ("total_amount", "remaining_amount"):
+        column = contrats.c[name]
+        quoted = preparer.format_column(column)
+        if connection.dialect.name == "mysql":
+            # FLOAT simple précision : les centimes au-delà de 2^24 (167 772,16 €) y seraient arrondis.
+            # Passage en DECIMAL exact avant la multiplication, puis en BIGINT.
+            connection.execute(text(f"ALTER TABLE {table} MODIFY {quoted} DECIMAL(20, 2) NOT NULL"))
+        connection.execute(text(f"UPDATE {table} SET {quoted} = ROUND({quoted} * 100)"))
+        if connection.dialect.name == "mysql":
+            definition = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE {table} MODIFY {definition}"))
+    # SQLite garde l'affinité REAL des colonnes existantes : les centimes y restent des entiers exacts.
+    ContratSummary.__table__.drop(connection, checkfirst=True)
+    ContratSummary.__table__.create(connection)
+    session.commit()
+    rebuild_contrat_summaries(session)
+
+
+def replace_support_index(session: Session):
+    """Remplace l'index events.support_id par l'index composé (support_id, start_date), qui le couvre."""
+    # L'index composé d'abord : sous MySQL/InnoDB, la clé étrangère events.support_id exige un index en
+    # permanence, et l'ancien ne peut être supprimé qu'une fois remplacé.
+    create_missing_indexes(session)
+    connection = session.connection()
+    if "ix_events_support_id" in {index["name"] for index in inspect(connection).get_indexes("events")}:
+        # Pas d'objet Index : il serait rattaché à la table des modèles et recréé par create_all.
+        on_table = " ON events" if connection.dialect.name == "mysql" else ""
+        connection.execute(text(f"DROP INDEX ix_events_support_id{on_table}"))
+    session.commit()
+
+
+def create_client_search(session: Session, batch_size=10_000):
+    """Ajoute clients.search_key, la calcule pour les clients existants puis crée l'index plein texte."""
+    from model.client import Client
+    from utils.search import client_search_key, create_search_index
+
+    add_missing_columns(session)
+    connection = session.connection()
+    columns = select(Client.id, Client.name, Client.email, Client.company, Client.phone).order_by(Client.id)
+    last_id = 0
+    while True:
+        rows = connection.execute(columns.where(Client.id > last_id).limit(batch_size)).all()
+        if not rows:
+            break
+        connection.execute(
+            update(Client.__table__).where(Client.__table__.c.id == bindparam("client_id")),
+            [
+                {"client_id": row.id, "search_key": client_search_key(row.name, row.email, row.company, row.phone)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+    create_search_index(connection)
+    session.commit()
+
+
+# Étapes ordonnées : (version, description, fonction appliquée à la session).
+MIGRATIONS = [
+    (1, "Création du schéma et des données initiales", create_schema),
+    (2, "Index des filtres (contrats, événements, clients, utilisateurs)", create_missing_indexes),
+    (3, "Version de session des utilisateurs (users.token_version)", add_missing_columns),
+    (4, "Synthèse des contrats pour les rapports (contrat_summaries)", create_contrat_summaries),
+    (5, "Montants des contrats en centimes entiers", convert_amounts_to_cents),
+    (6, "Index du planning des supports (events.support_id, start_date)", replace_support_index),
+    (7, "Index du calendrier (events.end_date, location)", create_missing_indexes),
+    (8, "Recherche des clients (clients.search_key, index plein texte)", create_client_search),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(session: Session):
+    """Lit la version enregistrée (une recherche par clé primaire), 0 si la base n'est pas initialisée."""
+    try:
+        marker = session.get(SchemaVersion, SCHEMA_VERSION_ID)
+    except (OperationalError, ProgrammingError):
+        session.rollback()
+        return 0
+    return marker.version if marker else 0
+
+
+def upgrade_database(session: Session):
+    """Applique les migrations plus récentes que la version enregistrée et retourne la version finale."""
+    current = get_schema_version(session)
+    if current >= SCHEMA_VERSION:
+        return current
+
+    for version, description, migrate in MIGRATIONS:
+        if version > current:
+            print(f"📌 Migration {version} : {description}...")
+            migrate(session)
+
+    session.merge(SchemaVersion(id=SCHEMA_VERSION_ID, version=SCHEMA_VERSION))
+    session.commit()
+    return SCHEMA_VERSION
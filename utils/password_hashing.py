@@ -0,0 +1,55 @@
+import time
+from functools import lru_cache, partial
+from argon2 import PasswordHasher
+
+
+def build_hasher(time_cost, memory_cost, parallelism):
+    """Crée le PasswordHasher Argon2id avec les paramètres donnés (mémoire en KiB)."""
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def measure_hash(hasher, samples=3, password="calibration-password"):
+    """Retourne la durée minimale (en millisecondes) d'un hachage sur `samples` essais."""
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash(password)
+        durations.append((time.perf_counter() - start) * 1000)
+    return min(durations)
+
+
+def calibrate(target_ms, memory_cost, parallelism, max_time_cost=20, samples=3):
+    """Cherche le plus petit time_cost dont le hachage atteint `target_ms` sur cette machine.
+
+    La mémoire et le parallélisme sont fixés par l'appelant : ce sont eux qui déterminent la résistance
+    aux attaques matérielles, le nombre de passes ajustant ensuite la latence de connexion.
+    Retourne (time_cost, memory_cost, parallelism, durée mesurée en ms).
+    """
+    duration = 0.0
+    for time_cost in range(1, max_time_cost + 1):
+        duration = measure_hash(build_hasher(time_cost, memory_cost, parallelism), samples)
+        if duration >= target_ms:
+            break
+    return time_cost, memory_cost, parallelism, duration
+
+
+@lru_cache(maxsize=None)
+def _cached_hasher(time_cost, memory_cost, parallelism):
+    return build_hasher(time_cost, memory_cost, parallelism)
+
+
+def _hash_password(parameters, password):
+    """Hache un mot de passe dans un processus de travail (le hasher y est créé une seule fois)."""
+    return _cached_hasher(*parameters).hash(password)
+
+
+def hash_passwords(passwords, hasher, executor=None, chunksize=8):
+    """Hache une liste de mots de passe avec les paramètres de `hasher`.
+
+    Avec un `ProcessPoolExecutor`, les hachages (coûteux en CPU et en mémoire) sont répartis sur
+    tous les cœurs ; sans exécuteur, ils sont calculés en série dans le processus courant.
+    """
+    if executor is None:
+        return [hasher.hash(password) for password in passwords]
+    hash_one = partial(_hash_password, (hasher.time_cost, hasher.memory_cost, hasher.parallelism))
+    return list(executor.map(hash_one, passwords, chunksize=chunksize))
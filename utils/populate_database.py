@@ -1,10 +1,20 @@
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert
 from sqlalchemy.exc import SQLAlchemyError
 from model.role import Role
 from model.user import User
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session as OrmSession
+from utils.records import chunked
 
+SYNTHETIC_PASSWORD = "password"
+SYNTHETIC_START = datetime(2025, 1, 1)
+# Répartition des rôles des utilisateurs générés.
+SYNTHETIC_ROLES = (("commercial", 0.5), ("support", 0.35), ("gestion", 0.15))
+LOCATIONS = ("Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes", "Toulouse", "Nice", "Strasbourg", "Rennes")
 
-def seed_admin_user(session: Session):
+
+def seed_admin_user(session: OrmSession):
     """Ajoute un administrateur par défaut s'il n'existe pas."""
     admin_email = "admin@admin.com"
     admin_name = "Admin"
@@ -29,7 +39,7 @@ def seed_admin_user(session: Session):
         print("❌ Erreur lors de l'insertion de l'admin :", e)
 
 
-def seed_roles(session: Session):
+def seed_roles(session: OrmSession):
     """Ajoute les rôles s'ils n'existent pas encore."""
     roles = ["support", "commercial", "gestion"]
 
@@ -47,3 +57,165 @@ def seed_roles(session: Session):
     except SQLAlchemyError as e:
         session.rollback()
         print("Erreur lors de l'insertion des rôles :", e)
+
+
+def print_progress(table, done, total):
+    """Affiche l'avancement de la génération d'une table."""
+    end = "\n" if done >= total else ""
+    print(f"\r⏳ {table} : {done}/{total}", end=end, flush=True)
+
+
+def _skewed(rng, first, count, exponent):
+    """Tire un identifiant dans [first, first + count) en favorisant les premiers (loi de puissance).
+
+    Reproduit la concentration observée en production : quelques commerciaux gèrent beaucoup de
+    clients et quelques clients concentrent beaucoup de contrats.
+    """
+    return first + int(count * rng.random() ** exponent)
+
+
+def _next_id(session, model):
+    return (session.query(func.max(model.id)).scalar() or 0) + 1
+
+
+def _insert_rows(session, model, rows, total, batch_size, progress):
+    """Insère les lignes par lots (INSERT Core en executemany) avec un commit et un rapport par lot."""
+    done = 0
+    for batch in chunked(rows, batch_size):
+        session.connection().execute(insert(model.__table__), batch)
+        session.commit()
+        done += len(batch)
+        if progress:
+            progress(model.__tablename__, done, total)
+
+
+def generate_synthetic_data(
+    session: OrmSession,
+    users=100,
+    clients=1_000,
+    contrats=5_000,
+    events=2_000,
+    seed=0,
+    batch_size=10_000,
+    progress=print_progress,
+):
+    """Génère un jeu de données synthétique volumineux et déterministe pour les tests de charge.
+
+    Les lignes sont produites à la volée et insérées par lots : la mémoire ne dépend que du nombre
+    d'événements demandés, quel que soit le volume des autres tables. Les identifiants sont attribués à
+    la suite des données existantes, ce qui permet de relier clients, contrats et événements sans relire
+    la base. Tous les utilisateurs générés partagent le mot de passe SYNTHETIC_PASSWORD, haché une seule
+    fois. Les événements ne portent que sur des contrats signés, au plus un par contrat, tirés par
+    échantillonnage de réservoir pendant la génération des contrats : leur nombre est plafonné à celui
+    des contrats signés.
+    Retourne le nombre de lignes créées par table.
+    """
+    # Import local : model.client importe utils, qui importe ce module.
+    from model import Client, Contrat, Event, rebuild_contrat_summaries
+
+    if clients and not users:
+        raise ValueError("Des utilisateurs sont nécessaires pour attribuer les clients.")
+    if contrats and not clients:
+        raise ValueError("Des clients sont nécessaires pour créer des contrats.")
+    if events > contrats:
+        raise ValueError("Un événement est rattaché à un seul contrat : events ne peut dépasser contrats.")
+    rng = random.Random(seed)
+    seed_roles(session)
+    role_ids = dict(session.query(Role.name, Role.id))
+    user_id, client_id, contrat_id, event_id = (_next_id(session, model) for model in (User, Client, Contrat, Event))
+
+    # Utilisateurs : les rôles sont attribués par blocs contigus pour tirer commerciaux et supports par plage.
+    password_hash = User.hash_passwords([SYNTHETIC_PASSWORD])[0]
+    role_counts = [(name, int(users * share)) for name, share in SYNTHETIC_ROLES]
+    role_counts[0] = (role_counts[0][0], users - sum(count for _, count in role_counts[1:]))
+    role_ranges = {}
+    first = user_id
+    for name, count in role_counts:
+        role_ranges[name] = (first, count)
+        first += count
+
+    def user_rows():
+        for name, (first, count) in role_ranges.items():
+            for i in range(first, first + count):
+                yield {
+                    "id": i,
+                    "name": f"{name.capitalize()} {i}",
+                    "email": f"{name}{i}@synthetic.test",
+                    "password": password_hash,
+                    "role_id": role_ids[name],
+                }
+
+    first_commercial, commercials = role_ranges["commercial"]
+    first_support, supports = role_ranges["support"]
+
+    def client_rows():
+        for i in range(client_id, client_id + clients):
+            created = SYNTHETIC_START - timedelta(days=rng.randint(0, 3 * 365))
+            yield {
+                "id": i,
+                "name": f"Client {i}",
+                "email": f"client{i}@synthetic.test",
+                "phone": f"0{rng.randint(100000000, 799999999)}",
+                "company": f"Entreprise {rng.randint(1, max(1, clients // 3))}",
+                "commercial_id": _skewed(rng, first_commercial, commercials, 2) if commercials else None,
+                "date_created": created,
+                "date_updated": created,
+            }
+
+    # Contrats des événements : échantillon uniforme (réservoir de `events` places) des contrats signés.
+    event_contrats = []
+
+    def contrat_rows():
+        signed_count = 0
+        for i in range(contrat_id, contrat_id + contrats):
+            total = round(min(rng.lognormvariate(8, 1), 1_000_000), 2)
+            signed = rng.random() < 0.7
+            if signed:
+                signed_count += 1
+                if len(event_contrats) < events:
+                    event_contrats.append(i)
+                elif (slot := rng.randrange(signed_count)) < events:
+                    event_contrats[slot] = i
+            if not signed:
+                remaining = total
+            elif rng.random() < 0.6:
+                remaining = 0.0
+            else:
+                remaining = round(total * rng.random(), 2)
+            yield {
+                "id": i,
+                "client_id": _skewed(rng, client_id, clients, 3),
+                "total_amount": total,
+                "remaining_amount": remaining,
+                "status": signed,
+                "date_created": SYNTHETIC_START - timedelta(days=rng.randint(0, 2 * 365)),
+            }
+
+    def event_rows():
+        # Un événement par contrat signé (règle de create_event) tiré sans remise ; dates étalées sur un an
+        # autour de SYNTHETIC_START.
+        rng.shuffle(event_contrats)
+        for i, contrat in enumerate(event_contrats, start=event_id):
+            start = SYNTHETIC_START + timedelta(hours=int(rng.triangular(-24 * 180, 24 * 180, 0)))
+            yield {
+                "id": i,
+                "name": f"Événement {i}",
+                "contrat_id": contrat,
+                "start_date": start,
+                "end_date": start + timedelta(hours=rng.randint(2, 72)),
+                "support_id": (first_support + rng.randrange(supports) if supports and rng.random() >= 0.15 else None),
+                "location": rng.choice(LOCATIONS),
+                "attendees": min(int(rng.lognormvariate(4, 1)), 10_000),
+                "notes": None,
+            }
+
+    _insert_rows(session, User, user_rows(), users, batch_size, progress)
+    _insert_rows(session, Client, client_rows(), clients, batch_size, progress)
+    _insert_rows(session, Contrat, contrat_rows(), contrats, batch_size, progress)
+    # Environ 70 % des contrats sont signés : le volume d'événements est plafonné à leur nombre.
+    events = len(event_contrats)
+    _insert_rows(session, Event, event_rows(), events, batch_size, progress)
+    # Les insertions Core ne passent pas par l'ORM : la synthèse des contrats est recalculée en une requête.
+    if contrats:
+        rebuild_contrat_summaries(session)
+    return {"users": users, "clients": clients, "contrats": contrats, "events": events}
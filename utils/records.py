@@ -0,0 +1,113 @@
+import csv
+import datetime
+import json
+import os
+
+CSV_EXTENSIONS = (".csv",)
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+# JSON Lines colonnaire : une ligne d'en-tête (noms des colonnes) puis un tableau par colonne et par lot.
+COLUMNAR_EXTENSIONS = (".cjsonl",)
+FORMATS = ("csv", "jsonl", "columnar")
+
+
+def detect_format(path):
+    """Déduit le format (csv, jsonl ou columnar) de l'extension du fichier."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in CSV_EXTENSIONS:
+        return "csv"
+    if extension in JSONL_EXTENSIONS:
+        return "jsonl"
+    if extension in COLUMNAR_EXTENSIONS:
+        return "columnar"
+    raise ValueError(f"Format de fichier non supporté : {extension or path}")
+
+
+def read_records(path):
+    """Lit un fichier CSV ou JSONL en flux et produit (numéro de ligne, enregistrement, erreur).
+
+    Une ligne illisible produit un enregistrement None et son message d'erreur, sans interrompre la lecture.
+    """
+    if detect_format(path) == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record, None
+        return
+
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"JSON invalide : {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "Objet JSON attendu."
+                continue
+            yield line_number, record, None
+
+
+def text_field(record, field):
+    """Valeur texte d'un champ d'enregistrement, sans espaces autour ("" si absent).
+
+    Les nombres (JSONL) sont convertis en texte ; tout autre type lève ValueError pour être signalé sur sa ligne.
+    """
+    value = record.get(field)
+    if value is None:
+        return ""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"Champ {field} : texte attendu.")
+    return str(value).strip()
+
+
+def chunked(iterable, size):
+    """Regroupe un itérable en listes d'au plus `size` éléments."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _json_default(value):
+    """Sérialise les dates au format ISO 8601 et les autres valeurs (Decimal...) en texte."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def write_records(path, columns, batches, fmt=None):
+    """Écrit des lots de lignes (tuples) au fil de l'eau et retourne le nombre de lignes écrites.
+
+    Seul le lot courant est en mémoire : `batches` peut être un curseur serveur parcouru par partitions.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Format de fichier non supporté : {fmt}")
+
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        if fmt == "csv":
+            writer = csv.writer(file)
+            writer.writerow(columns)
+        elif fmt == "columnar":
+            file.write(json.dumps({"columns": list(columns)}) + "\n")
+
+        for batch in batches:
+            if not batch:
+                continue
+            if fmt == "csv":
+                writer.writerows(batch)
+            elif fmt == "jsonl":
+                for row in batch:
+                    file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_default) + "\n")
+            else:
+                column_values = [list(values) for values in zip(*batch)]
+                file.write(json.dumps(column_values, ensure_ascii=False, default=_json_default) + "\n")
+            count += len(batch)
+    return count
@@ -0,0 +1,112 @@
+from bisect import bisect_left
+from collections import defaultdict
+from heapq import heapify, heappop, heappush
+
+
+class IntervalIndex:
+    """Index statique d'intervalles semi-ouverts [début, fin) pour la recherche de chevauchements.
+
+    Les intervalles sont triés par début et parcourus comme un arbre binaire implicite (le milieu de
+    chaque plage est la racine de son sous-arbre) ; chaque nœud mémorise la plus grande fin de son
+    sous-arbre, ce qui permet d'écarter d'un coup les branches terminées avant la fenêtre recherchée.
+    Une recherche coûte O(log n + k) pour k intervalles trouvés sur un planning sans long événement
+    recouvrant les autres.
+    """
+
+    def __init__(self, intervals):
+        """Construit l'index à partir de triplets (début, fin, valeur), dans n'importe quel ordre."""
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [start for start, _, _ in ordered]
+        self.ends = [end for _, end, _ in ordered]
+        self.values = [value for _, _, value in ordered]
+        self.max_ends = list(self.ends)
+        if ordered:
+            self._build(0, len(ordered))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _build(self, lo, hi):
+        """Calcule la fin maximale du sous-arbre de la plage [lo, hi) et la range à son milieu."""
+        mid = (lo + hi) // 2
+        max_end = self.ends[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self.max_ends[mid] = max_end
+        return max_end
+
+    def overlapping(self, start, end):
+        """Retourne les valeurs des intervalles qui chevauchent [start, end), triées par début."""
+        found = []
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_ends[mid] <= start:
+                # Tout le sous-arbre se termine avant la fenêtre.
+                continue
+            if self.starts[mid] < end:
+                # Triés par début : le sous-arbre droit n'est utile que si ce nœud commence avant la fin.
+                stack.append((mid + 1, hi))
+                if self.ends[mid] > start:
+                    found.append(mid)
+            stack.append((lo, mid))
+        return [self.values[i] for i in sorted(found)]
+
+    def conflicts(self):
+        """Retourne les paires (valeur, valeur) d'intervalles qui se chevauchent au sein de l'index."""
+        pairs = []
+        for i, (start, end) in enumerate(zip(self.starts, self.ends)):
+            for j in range(i + 1, bisect_left(self.starts, end)):
+                if self.ends[j] > start:
+                    pairs.append((self.values[i], self.values[j]))
+        return pairs
+
+
+def build_schedule_index(rows):
+    """Regroupe des lignes (clé, début, fin, valeur) en un IntervalIndex par clé (ex. un par support)."""
+    intervals = defaultdict(list)
+    for key, start, end, value in rows:
+        intervals[key].append((start, end, value))
+    return {key: IntervalIndex(items) for key, items in intervals.items()}
+
+
+def assign_supports(events, supports, busy=None, loads=None):
+    """Répartit des événements (id, début, fin) entre des supports, sans chevauchement et en équilibrant la charge.
+
+    Glouton par date de début : chaque événement va au support le moins chargé (tas de (charge, support))
+    qui est libre sur le créneau, c'est-à-dire sans événement déjà planifié (`busy` : IntervalIndex par
+    support) ni événement attribué pendant ce passage (fin la plus tardive mémorisée). `loads` donne la
+    charge initiale (nombre d'événements déjà suivis). Coût O(n log n + n log s) pour n événements et
+    s supports quand la plupart des supports sont libres.
+    Retourne (attributions [(événement, support)], événements sans support disponible).
+    """
+    busy = busy or {}
+    loads = loads or {}
+    heap = [(loads.get(support, 0), support) for support in supports]
+    heapify(heap)
+    free_at = {}
+    assignments, unassigned = [], []
+
+    for event_id, start, end in sorted(events, key=lambda event: (event[1], event[2], event[0])):
+        unavailable = []
+        while heap:
+            load, support = heappop(heap)
+            if support in free_at and free_at[support] > start:
+                unavailable.append((load, support))
+            elif support in busy and busy[support].overlapping(start, end):
+                unavailable.append((load, support))
+            else:
+                assignments.append((event_id, support))
+                free_at[support] = max(free_at.get(support, end), end)
+                heappush(heap, (load + 1, support))
+                break
+        else:
+            unassigned.append(event_id)
+        for candidate in unavailable:
+            heappush(heap, candidate)
+    return assignments, unassigned
@@ -0,0 +1,71 @@
+import unicodedata
+from sqlalchemy import inspect, text
+
+# Table FTS5 (SQLite) et index FULLTEXT (MySQL) de la recherche de clients.
+SEARCH_TABLE = "clients_search"
+FULLTEXT_INDEX = "ix_clients_search_key"
+# Longueur minimale d'un terme servi par l'index : trigrammes FTS5, n-grammes MySQL (ngram_token_size=2).
+MIN_TERM_LENGTH = {"sqlite": 3, "mysql": 2}
+
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+    "USING fts5(search_key, content='clients', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS clients_search_insert AFTER INSERT ON clients BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, search_key) VALUES (new.id, new.search_key); END",
+    f"CREATE TRIGGER IF NOT EXISTS clients_search_delete AFTER DELETE ON clients BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, search_key) VALUES ('delete', old.id, old.search_key); END",
+    f"CREATE TRIGGER IF NOT EXISTS clients_search_update AFTER UPDATE OF search_key ON clients BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, search_key) VALUES ('delete', old.id, old.search_key); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, search_key) VALUES (new.id, new.search_key); END",
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')",
+]
+
+
+def normalize(value):
+    """Minuscules sans accents ni espaces superflus (« Élodie  DUPONT » -> « elodie dupont »)."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).casefold().split())
+
+
+def client_search_key(name, email, company=None, phone=None):
+    """Clé de recherche d'un client : nom, email, entreprise et téléphone normalisés (chiffres seuls compris)."""
+    digits = "".join(char for char in phone or "" if char.isdigit())
+    parts = [normalize(name), normalize(email), normalize(company), normalize(phone), digits]
+    return " ".join(part for part in parts if part)
+
+
+def search_terms(query):
+    """Termes normalisés d'une recherche, sans doublon (les guillemets délimitent les termes)."""
+    return list(dict.fromkeys(normalize(query).replace('"', " ").split()))
+
+
+def create_search_index(connection):
+    """Crée (si besoin) l'index plein texte de clients.search_key et le remplit à partir de la table.
+
+    SQLite : table FTS5 à contenu externe (tokenizer trigram, recherche de sous-chaînes) tenue à jour
+    par des triggers. MySQL : index FULLTEXT avec le parseur ngram. Sans effet sur les autres bases.
+    """
+    if connection.dialect.name == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+    elif connection.dialect.name == "mysql":
+        if FULLTEXT_INDEX not in {index["name"] for index in inspect(connection).get_indexes("clients")}:
+            connection.execute(
+                text(f"ALTER TABLE clients ADD FULLTEXT INDEX {FULLTEXT_INDEX} (search_key) WITH PARSER ngram")
+            )
+
+
+def drop_search_index(connection):
+    """Supprime la table FTS5 de SQLite (les triggers disparaissent avec la table clients)."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+def match_expression(dialect_name, terms):
+    """Requête plein texte où chaque terme doit apparaître comme sous-chaîne (syntaxe FTS5 ou booléenne MySQL)."""
+    phrases = [f'"{term}"' for term in terms]
+    if dialect_name == "mysql":
+        return " ".join(f"+{phrase}" for phrase in phrases)
+    return " ".join(phrases)
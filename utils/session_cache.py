@@ -0,0 +1,100 @@
+import hashlib
+import hmac
+import json
+import os
+import time
+
+
+class PrincipalRole:
+    """Rôle d'un utilisateur authentifié, reconstruit depuis le cache de session."""
+
+    def __init__(self, name, permissions):
+        self.name = name
+        self.permissions = frozenset(permissions)
+
+    def get_permissions(self):
+        """Retourne l'ensemble des permissions mises en cache pour ce rôle."""
+        return self.permissions
+
+    def has_permission(self, action: str) -> bool:
+        """Vérifie si le rôle a une permission spécifique."""
+        return action in self.permissions
+
+    def __repr__(self):
+        return f"<PrincipalRole(name={self.name})>"
+
+
+class Principal:
+    """Utilisateur authentifié résolu depuis le cache de session, sans requête en base.
+
+    Expose les attributs utilisés par les contrôleurs et les menus (id, name, email, role).
+    """
+
+    def __init__(self, id, name, email, role, token_version=0):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.role = role
+        self.token_version = token_version
+
+    def __repr__(self):
+        return f"<Principal(id={self.id}, name={self.name}, role={self.role.name if self.role else None})>"
+
+
+def _signature(secret_key, data):
+    """Signe (HMAC-SHA256) le contenu canonique du cache."""
+    message = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hmac.new(secret_key.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def _token_digest(token):
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def write_session_cache(path, token, secret_key, user, expires_at):
+    """Enregistre le principal (id, nom, rôle, permissions, version) lié au token, jusqu'à son expiration."""
+    role = user.role
+    data = {
+        "token": _token_digest(token),
+        "user_id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "role": role.name if role else None,
+        "permissions": sorted(role.get_permissions()) if role else [],
+        "token_version": user.token_version or 0,
+        "exp": int(expires_at),
+        "checked_at": int(time.time()),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"data": data, "sig": _signature(secret_key, data)}, file)
+
+
+def read_session_cache(path, token, secret_key, ttl):
+    """Retourne le Principal mis en cache si la signature, le token, l'expiration et la fraîcheur sont valides.
+
+    Au-delà de `ttl` secondes depuis la dernière vérification en base, le cache est ignoré pour que la
+    version de session de l'utilisateur soit revérifiée (invalidation après modification ou suppression).
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+        data, signature = content["data"], content["sig"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not hmac.compare_digest(signature, _signature(secret_key, data)):
+        return None
+    now = time.time()
+    if data["token"] != _token_digest(token) or data["exp"] <= now or data["checked_at"] + ttl <= now:
+        return None
+
+    role = PrincipalRole(data["role"], data["permissions"]) if data["role"] else None
+    return Principal(data["user_id"], data["name"], data["email"], role, data["token_version"])
+
+
+def clear_session_cache(path):
+    """Supprime le cache de session local."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
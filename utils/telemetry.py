@@ -0,0 +1,180 @@
+import atexit
+import json
+import queue
+import random
+import threading
+import time
+from utils.config import (
+    SENTRY,
+    TELEMETRY_BATCH_SIZE,
+    TELEMETRY_FILE,
+    TELEMETRY_FLUSH_INTERVAL,
+    TELEMETRY_QUEUE_SIZE,
+    TELEMETRY_SAMPLING,
+)
+
+_STOP = object()
+
+
+class FileSink:
+    """Écrit les événements d'audit au format JSON Lines dans un fichier local."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, events):
+        with open(self.path, "a", encoding="utf-8") as file:
+            for event in events:
+                file.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+class SentrySink:
+    """Transmet les événements d'audit à Sentry (SDK importé au premier envoi)."""
+
+    def send(self, events):
+        import sentry_sdk
+
+        for event in events:
+            sentry_sdk.capture_message(event["message"], level=event["level"])
+
+
+class AuditEmitter:
+    """Émetteur d'audit asynchrone : file bornée en mémoire vidée par lots dans un thread de fond.
+
+    `emit` ne bloque jamais l'action interactive : l'événement est échantillonné selon son type,
+    puis abandonné (et compté) si la file est pleine. Si le destinataire échoue, le lot est
+    confié au destinataire de repli (fichier local par exemple).
+    """
+
+    def __init__(self, sink, batch_size=50, flush_interval=2.0, max_queue=1000, sample_rates=None, fallback=None):
+        self.sink = sink
+        self.fallback = fallback
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rates = sample_rates or {}
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def emit(self, event_type, message, level="info"):
+        """Met un événement en file ; retourne False s'il est écarté (échantillonnage ou file pleine)."""
+        if self.sink is None:
+            return False
+        rate = self.sample_rates.get(event_type, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return False
+
+        event = {"type": event_type, "message": message, "level": level, "timestamp": time.time()}
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+        self._start_worker()
+        return True
+
+    def _start_worker(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audit-emitter", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._send(batch)
+            if stop:
+                return
+
+    def _next_batch(self):
+        """Attend un lot complet ou l'expiration de l'intervalle de vidage."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                event = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if event is _STOP:
+                return batch, True
+            batch.append(event)
+        return batch, False
+
+    def _send(self, batch):
+        try:
+            self.sink.send(batch)
+        except Exception as e:
+            if self.fallback is None:
+                print(f"❌ Événements d'audit perdus ({len(batch)}) : {e}")
+                return
+            try:
+                self.fallback.send(batch)
+            except Exception as fallback_error:
+                print(f"❌ Événements d'audit perdus ({len(batch)}) : {fallback_error}")
+
+    def flush(self):
+        """Envoie de façon synchrone les événements encore en file."""
+        batch = []
+        while True:
+            try:
+                event = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is _STOP:
+                continue
+            batch.append(event)
+            if len(batch) >= self.batch_size:
+                self._send(batch)
+                batch = []
+        if batch:
+            self._send(batch)
+
+    def close(self, timeout=5.0):
+        """Arrête le thread de fond puis vide la file (appelé à la sortie du processus)."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        self.flush()
+
+
+def parse_sample_rates(value):
+    """Convertit `type=taux,type=taux` en dictionnaire {type: taux}."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in (value or "").split(","))):
+        event_type, _, rate = item.partition("=")
+        rates[event_type.strip()] = float(rate)
+    return rates
+
+
+def build_emitter():
+    """Construit l'émetteur selon la configuration : Sentry si un DSN est défini, sinon fichier local."""
+    file_sink = FileSink(TELEMETRY_FILE) if TELEMETRY_FILE else None
+    if SENTRY:
+        sink, fallback = SentrySink(), file_sink
+    else:
+        sink, fallback = file_sink, None
+
+    return AuditEmitter(
+        sink,
+        batch_size=TELEMETRY_BATCH_SIZE,
+        flush_interval=TELEMETRY_FLUSH_INTERVAL,
+        max_queue=TELEMETRY_QUEUE_SIZE,
+        sample_rates=parse_sample_rates(TELEMETRY_SAMPLING),
+        fallback=fallback,
+    )
+
+
+audit = build_emitter()
+atexit.register(audit.close)
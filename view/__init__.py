@@ -1,6 +1,25 @@
-from .user_view import UserView  # noqa F401
-from .auth_view import AuthView  # noqa F401
-from .client_view import ClientView  # noqa F401
-from .contrat_view import ContratView  # noqa F401
-from .event_view import EventView  # noqa F401
-from .menu_view import *  # noqa F401
+import importlib
+
+# Chargement paresseux : rich et prompt_toolkit ne sont importés que par les vues qui s'en servent.
+_VIEWS = {
+    "UserView": "view.user_view",
+    "AuthView": "view.auth_view",
+    "ClientView": "view.client_view",
+    "ContratView": "view.contrat_view",
+    "EventView": "view.event_view",
+    "ExportView": "view.export_view",
+    "JsonView": "view.json_view",
+    "ReportView": "view.report_view",
+    "console": "view.menu_view",
+    "show_menu": "view.menu_view",
+    "show_user_menu": "view.menu_view",
+    "show_client_menu": "view.menu_view",
+    "show_contrat_menu": "view.menu_view",
+    "show_event_menu": "view.menu_view",
+}
+
+
+def __getattr__(name):
+    if name in _VIEWS:
+        return getattr(importlib.import_module(_VIEWS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
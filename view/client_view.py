@@ -18,6 +18,12 @@ class ClientView:
         """Affiche un message d'erreur."""
         print(f"❌ {message}")
 
+    def display_import_report(self, inserted, errors):
+        """Affiche le bilan d'un import de clients."""
+        print(f"\n📥 {inserted} client(s) importé(s), {len(errors)} ligne(s) en erreur.")
+        for line_number, message in errors:
+            print(f"❌ Ligne {line_number} : {message}")
+
     def display_clients(self, clients):
         """Affiche une liste de clients."""
         if not clients:
@@ -28,6 +34,17 @@ class ClientView:
                 print(f"- {client.id}: {client.name} ({client.email}) - Entreprise: {client.company}")
             return
 
+    def display_search_results(self, clients, query, page, has_more):
+        """Affiche une page de résultats de recherche de clients."""
+        if not clients:
+            print(f"\n🔎 Aucun client ne correspond à « {query} » (page {page}).")
+            return
+        print(f"\n🔎 Clients correspondant à « {query} » (page {page}) :")
+        for client in clients:
+            print(f"- {client.id}: {client.name} ({client.email}) - Entreprise: {client.company} - Tél: {client.phone}")
+        if has_more:
+            print(f"➡️ D'autres résultats sur la page {page + 1}.")
+
     def display_client_details(self, client):
         """Affiche les détails d'un client."""
         print("\n👤 Détails du client :")
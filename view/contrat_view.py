@@ -70,6 +70,11 @@ class ContratView:
                 f"| Restant: {contrat.remaining_amount}€ | Signé: {'✅ Oui' if contrat.status else '❌ Non'}"
             )
 
+    def ask_next_page(self):
+        """Demande à l'utilisateur s'il veut afficher la page suivante."""
+        choix = input("➡️ Entrée pour la page suivante, 'q' pour quitter : ").strip().lower()
+        return choix != "q"
+
     def ask_filter_option(self):
         """Demande à l'utilisateur quel type de filtrage il veut appliquer."""
         print("\n📌 Choisissez un filtre pour afficher les contrats :")
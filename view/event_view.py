@@ -39,6 +39,33 @@ class EventView:
             )
         print("\n")
 
+    def ask_next_page(self):
+        """Demande à l'utilisateur s'il veut afficher la page suivante."""
+        choix = input("➡️ Entrée pour la page suivante, 'q' pour quitter : ").strip().lower()
+        return choix != "q"
+
+    def display_schedule_conflicts(self, conflicts):
+        """Affiche les chevauchements d'événements par support."""
+        if not conflicts:
+            print("✅ Aucun chevauchement dans le planning des supports.")
+            return
+
+        print(f"⚠️ {len(conflicts)} chevauchement(s) dans le planning des supports :")
+        for support_id, (first_id, first_name), (second_id, second_name) in conflicts:
+            print(f"👤 Support {support_id} : {first_name} (ID {first_id}) ↔ {second_name} (ID {second_id})")
+
+    def display_assignment_report(self, assignments, unassigned, dry_run=False):
+        """Affiche le résultat de l'assignation automatique des supports."""
+        prefix = "🔍 Simulation : " if dry_run else "✅ "
+        print(f"{prefix}{len(assignments)} événement(s) assigné(s), {len(unassigned)} sans support disponible.")
+        per_support = {}
+        for _, support_id in assignments:
+            per_support[support_id] = per_support.get(support_id, 0) + 1
+        for support_id, count in sorted(per_support.items()):
+            print(f"👤 Support {support_id} : {count} événement(s)")
+        if unassigned:
+            print(f"⚠️ Événements sans support : {', '.join(str(event_id) for event_id in unassigned)}")
+
     def input_support_assignment(self):
         """Demande à l'utilisateur d'entrer un ID de support."""
         while True:
@@ -0,0 +1,10 @@
+class ExportView:
+    """Vue pour les messages liés aux exports de données."""
+
+    def display_info_message(self, message):
+        """Affiche un message d'information."""
+        print(f"ℹ️ {message}")
+
+    def display_error_message(self, message):
+        """Affiche un message d'erreur."""
+        print(f"❌ {message}")
@@ -0,0 +1,88 @@
+import datetime
+import json
+from decimal import Decimal
+from sqlalchemy import inspect
+
+# Colonnes jamais exposées dans les sorties JSON (secrets, colonnes internes).
+HIDDEN_FIELDS = {"password", "token_version", "search_key"}
+
+
+def serialize(value):
+    """Convertit un résultat de contrôleur (objets ORM, dictionnaires, listes, dates) en valeur JSON."""
+    if isinstance(value, dict):
+        return {key: serialize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize(item) for item in value]
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Montants au centime : le flottant JSON s'écrit avec les mêmes chiffres (10000.5).
+        return float(value)
+    if hasattr(value, "__table__"):
+        return {
+            column.key: serialize(getattr(value, column.key))
+            for column in inspect(value).mapper.column_attrs
+            if column.key not in HIDDEN_FIELDS
+        }
+    return value
+
+
+class MissingAnswer(Exception):
+    """Une action a demandé une saisie qui n'a pas été fournie en argument."""
+
+
+class JsonView:
+    """Vue non interactive : répond aux saisies à partir des arguments et collecte les affichages.
+
+    Remplace la vue d'un contrôleur le temps d'une commande. Les méthodes `input_*`, `ask_*` et
+    `choose_*` renvoient la réponse fournie (ou l'appellent avec les arguments de la saisie si c'est
+    une fonction) ; les méthodes `display_*` enregistrent messages, erreurs et données affichées.
+    """
+
+    INPUT_PREFIXES = ("input_", "ask_", "choose_", "prompt_")
+
+    def __init__(self, answers=None):
+        self.answers = answers or {}
+        self.messages = []
+        self.errors = []
+        self.data = None
+
+    def display_info_message(self, message):
+        self.messages.append(message)
+
+    def display_success_message(self, message):
+        self.messages.append(message)
+
+    def display_error_message(self, message):
+        self.errors.append(message)
+
+    def __getattr__(self, name):
+        if name.startswith(self.INPUT_PREFIXES):
+            return lambda *args: self._answer(name, args)
+        if name.startswith("display_"):
+            return self._display
+        raise AttributeError(name)
+
+    def _answer(self, name, args):
+        if name not in self.answers:
+            raise MissingAnswer(f"Paramètre manquant pour cette action ({name}).")
+        answer = self.answers[name]
+        return answer(*args) if callable(answer) else answer
+
+    def _display(self, value, *options):
+        # Les options de présentation (titre, regroupement...) ne changent pas les données.
+        self.data = value
+
+    def display_result(self, command, result=None, errors=None):
+        """Affiche le résultat d'une commande sur une ligne JSON et retourne True si elle a réussi."""
+        errors = self.errors + list(errors or [])
+        data = result if result is not None else self.data
+        payload = {
+            "command": command,
+            "ok": not errors,
+            "data": serialize(data),
+            "messages": self.messages,
+            "errors": errors,
+        }
+        print(json.dumps(payload, ensure_ascii=False, default=str))
+        return not errors
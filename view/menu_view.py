@@ -1,5 +1,6 @@
 from rich.console import Console
 from prompt_toolkit import prompt
+from utils.config import session_scope
 
 console = Console()
 
@@ -34,43 +35,44 @@ def show_user_menu(user, controllers):
     while True:
         sub_choix = prompt("👉 Choisissez une action : ").strip()
 
-        if sub_choix == "1" and user.role.name == "gestion":
-            controllers["user"].create_user()
+        with session_scope():
+            if sub_choix == "1" and user.role.name == "gestion":
+                controllers["user"].create_user()
+
+            elif sub_choix == "2":
+                controllers["user"].list_users()
+            elif sub_choix == "3":
+                while True:
+                    try:
+                        user_id = input("👉 Entrez l'ID de l'utilisateur (ou 0 pour revenir) : ").strip()
+                        if user_id == "0":
+                            break
+
+                        user_id = int(user_id)
+                        controllers["user"].get_user_details(user_id)
+                        break
 
-        elif sub_choix == "2":
-            controllers["user"].list_users()
-        elif sub_choix == "3":
-            while True:
-                try:
-                    user_id = input("👉 Entrez l'ID de l'utilisateur (ou 0 pour revenir) : ").strip()
-                    if user_id == "0":
+                    except ValueError:
+                        console.print("[bold yellow]⚠ ID invalide, veuillez entrer un nombre.[/bold yellow]")
                         break
 
-                    user_id = int(user_id)
-                    controllers["user"].get_user_details(user_id)
-                    break
+            elif sub_choix in ["4", "5"] and user.role.name == "gestion":
+                action = "modifier" if sub_choix == "4" else "supprimer"
 
+                try:
+                    user_id = int(prompt(f"👉 Entrez l'ID de l'utilisateur à {action} : ").strip())
+                    if sub_choix == "4":
+                        controllers["user"].update_user(user_id)
+                    else:
+                        controllers["user"].delete_user(user_id)
                 except ValueError:
                     console.print("[bold yellow]⚠ ID invalide, veuillez entrer un nombre.[/bold yellow]")
-                    break
-
-        elif sub_choix in ["4", "5"] and user.role.name == "gestion":
-            action = "modifier" if sub_choix == "4" else "supprimer"
-
-            try:
-                user_id = int(prompt(f"👉 Entrez l'ID de l'utilisateur à {action} : ").strip())
-                if sub_choix == "4":
-                    controllers["user"].update_user(user_id)
-                else:
-                    controllers["user"].delete_user(user_id)
-            except ValueError:
-                console.print("[bold yellow]⚠ ID invalide, veuillez entrer un nombre.[/bold yellow]")
 
-        elif sub_choix == "0":
-            break
+            elif sub_choix == "0":
+                break
 
-        else:
-            console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
+            else:
+                console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
 
 
 def show_client_menu(user, controllers):
@@ -87,22 +89,23 @@ def show_client_menu(user, controllers):
     while True:
         sub_choix = prompt("👉 Choisissez une action : ").strip()
 
-        if sub_choix == "1" and user.role.name == "commercial":
-            controllers["client"].create_client()
-        elif sub_choix == "2" and user.role.name == "commercial":
-            controllers["client"].list_personnal_client()
-        elif sub_choix == "3" and user.role.name == "commercial":
-            try:
-                client_id = int(prompt("👉 Entrez l'ID du client à modifier : ").strip())
-                controllers["client"].update_client(client_id)
-            except ValueError:
-                console.print("[bold yellow]⚠ ID invalide! Non existant ou ne vous est pas attribué[/bold yellow]")
-        elif sub_choix == "4":
-            controllers["client"].list_all_client()
-        elif sub_choix == "0":
-            break
-        else:
-            console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
+        with session_scope():
+            if sub_choix == "1" and user.role.name == "commercial":
+                controllers["client"].create_client()
+            elif sub_choix == "2" and user.role.name == "commercial":
+                controllers["client"].list_personnal_client()
+            elif sub_choix == "3" and user.role.name == "commercial":
+                try:
+                    client_id = int(prompt("👉 Entrez l'ID du client à modifier : ").strip())
+                    controllers["client"].update_client(client_id)
+                except ValueError:
+                    console.print("[bold yellow]⚠ ID invalide! Non existant ou ne vous est pas attribué[/bold yellow]")
+            elif sub_choix == "4":
+                controllers["client"].list_all_client()
+            elif sub_choix == "0":
+                break
+            else:
+                console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
 
 
 def show_contrat_menu(user, controllers):
@@ -119,23 +122,24 @@ def show_contrat_menu(user, controllers):
     while True:
         sub_choix = prompt("👉 Choisissez une action : ").strip()
 
-        if sub_choix == "1" and user.role.name == "commercial":
-            controllers["contrat"].create_contrat()
-        elif sub_choix == "2":
-            controllers["contrat"].read_contrat()
-        elif sub_choix == "3" and user.role.name in ["commercial", "gestion"]:
-            contrat_id = int(prompt("👉 Entrez l'ID du contrat à modifier : ").strip())
-            try:
-                controllers["contrat"].update_contrat(contrat_id)
-            except ValueError as ve:
-                console.print(f"[bold red]🚨 Erreur : {ve}[/bold red]")
-
-        elif sub_choix == "4" and user.role.name in ["commercial", "gestion"]:
-            controllers["contrat"].filter_contrats()
-        elif sub_choix == "0":
-            break
-        else:
-            console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
+        with session_scope():
+            if sub_choix == "1" and user.role.name == "commercial":
+                controllers["contrat"].create_contrat()
+            elif sub_choix == "2":
+                controllers["contrat"].browse_contrats()
+            elif sub_choix == "3" and user.role.name in ["commercial", "gestion"]:
+                contrat_id = int(prompt("👉 Entrez l'ID du contrat à modifier : ").strip())
+                try:
+                    controllers["contrat"].update_contrat(contrat_id)
+                except ValueError as ve:
+                    console.print(f"[bold red]🚨 Erreur : {ve}[/bold red]")
+
+            elif sub_choix == "4" and user.role.name in ["commercial", "gestion"]:
+                controllers["contrat"].filter_contrats()
+            elif sub_choix == "0":
+                break
+            else:
+                console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
 
 
 def show_event_menu(user, controllers):
@@ -154,15 +158,16 @@ def show_event_menu(user, controllers):
     while True:
         sub_choix = prompt("👉 Choisissez une action : ").strip()
 
-        if sub_choix == "1" and user.role.name == "commercial":
-            controllers["event"].create_event()
-        elif sub_choix == "2":
-            controllers["event"].read_event()
-        elif sub_choix == "3" and user.role.name in ["support", "gestion"]:
-            controllers["event"].update_event()
-        elif sub_choix == "4" and user.role.name in ["support", "gestion"]:
-            controllers["event"].filter_event()
-        elif sub_choix == "0":
-            break
-        else:
-            console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
+        with session_scope():
+            if sub_choix == "1" and user.role.name == "commercial":
+                controllers["event"].create_event()
+            elif sub_choix == "2":
+                controllers["event"].read_event()
+            elif sub_choix == "3" and user.role.name in ["support", "gestion"]:
+                controllers["event"].update_event()
+            elif sub_choix == "4" and user.role.name in ["support", "gestion"]:
+                controllers["event"].filter_event()
+            elif sub_choix == "0":
+                break
+            else:
+                console.print("[bold yellow]⚠ Option invalide, essayez encore ![/bold yellow]")
@@ -0,0 +1,53 @@
+class ReportView:
+    """Vue pour l'affichage des rapports."""
+
+    GROUP_TITLES = {"client": "client", "commercial": "commercial", "month": "mois", "status": "statut"}
+
+    def display_info_message(self, message):
+        """Affiche un message d'information."""
+        print(f"ℹ️ {message}")
+
+    def display_error_message(self, message):
+        """Affiche un message d'erreur."""
+        print(f"❌ {message}")
+
+    def display_contrat_totals(self, totals, group_by):
+        """Affiche les totaux des contrats, une ligne par groupe."""
+        if not totals:
+            print("📭 Aucun contrat à agréger.")
+            return
+
+        print(f"\n📊 Totaux des contrats par {self.GROUP_TITLES[group_by]} :")
+        for row in totals:
+            *keys, count, total, remaining = row
+            print(
+                f"🔹 {self.group_label(group_by, keys)} | Contrats: {count} | Total: {total}€ | Restant: {remaining}€"
+            )
+
+    @staticmethod
+    def group_label(group_by, keys):
+        """Libellé d'un groupe à partir de ses clés de regroupement."""
+        if group_by == "month":
+            year, month = keys
+            return f"{year}-{month:02d}"
+        if group_by == "status":
+            return "✅ Signés" if keys[0] else "❌ Non signés"
+        identifier, name = keys
+        return f"{name} (ID: {identifier})" if identifier is not None else "Sans commercial"
+
+    def display_dashboard(self, dashboard):
+        """Affiche les agrégats du tableau de bord."""
+        print("\n📊 Contrats par statut :")
+        for status, count, total, remaining in dashboard["contrats_par_statut"]:
+            print(
+                f"🔹 {'✅ Signés' if status else '❌ Non signés'} : {count} | Total: {total or 0}€ "
+                f"| Restant: {remaining or 0}€"
+            )
+
+        print("\n💰 Restant dû par commercial :")
+        for commercial_id, remaining in dashboard["reste_par_commercial"]:
+            print(f"🔹 Commercial {commercial_id if commercial_id is not None else '-'} : {remaining or 0}€")
+
+        print("\n📅 Événements par support :")
+        for support_id, count in dashboard["events_par_support"]:
+            print(f"🔹 {f'Support {support_id}' if support_id is not None else 'Non assignés'} : {count}")
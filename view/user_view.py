@@ -11,6 +11,12 @@ class UserView:
         print("Rôles disponibles : [gestion, commercial, support]")
         return input("👉 Choisissez un rôle : ")
 
+    def display_import_report(self, inserted, errors):
+        """Affiche le bilan d'une création d'utilisateurs en masse."""
+        print(f"\n📥 {inserted} utilisateur(s) créé(s), {len(errors)} ligne(s) en erreur.")
+        for line_number, message in errors:
+            print(f"❌ Ligne {line_number} : {message}")
+
     def display_users(self, users):
         """Affiche la liste des utilisateurs."""
         print("\n📜 Liste des utilisateurs :")